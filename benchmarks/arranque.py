@@ -0,0 +1,99 @@
+"""Mide el tiempo de importación en frío del shell de la app y falla si se degrada.
+
+Uso:
+    python benchmarks/arranque.py [--presupuesto-ms MS] [-n REPETICIONES]
+
+En un intérprete nuevo por repetición importa, con ``-X importtime``, los
+mismos módulos que importa ``app.py`` y reporta el tiempo propio acumulado por
+paquete raíz (mediana de las repeticiones). Termina con código 1 si la mediana
+total supera el presupuesto o si el shell carga alguno de
+``MODULOS_PEREZOSOS``: esos solo deben importarse en las páginas que los usan.
+"""
+
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# plotly.graph_objects no está: Streamlit lo importa al arrancar si plotly está instalado
+MODULOS_PEREZOSOS = ("numpy", "pandas", "pyarrow", "plotly.express")
+PRESUPUESTO_MS = 800
+
+
+def modulos_del_shell():
+    """Módulos importados en el nivel superior de app.py."""
+    with open(os.path.join(RAIZ, "app.py"), encoding="utf-8") as archivo:
+        arbol = ast.parse(archivo.read())
+    modulos = []
+    for nodo in arbol.body:
+        if isinstance(nodo, ast.Import):
+            modulos += [alias.name for alias in nodo.names]
+        elif isinstance(nodo, ast.ImportFrom) and nodo.level == 0:
+            modulos.append(nodo.module)
+    return modulos
+
+
+def medir_importacion(modulos):
+    """Tiempo propio (ms) por módulo importado en un intérprete nuevo."""
+    salida = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modulos)}"],
+        cwd=RAIZ, check=True, capture_output=True, text=True
+    ).stderr
+    tiempos = {}
+    for linea in salida.splitlines():
+        if not linea.startswith("import time:") or "self [us]" in linea:
+            continue
+        propio, _, nombre = linea[len("import time:"):].split("|")
+        tiempos[nombre.strip()] = int(propio) / 1000
+    return tiempos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--presupuesto-ms", type=float, default=PRESUPUESTO_MS)
+    parser.add_argument("-n", "--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    modulos = modulos_del_shell()
+    por_paquete = defaultdict(list)
+    totales = []
+    cargados = set()
+    for _ in range(args.repeticiones):
+        tiempos = medir_importacion(modulos)
+        cargados |= set(tiempos)
+        totales.append(sum(tiempos.values()))
+        acumulado = defaultdict(float)
+        for nombre, ms in tiempos.items():
+            acumulado[nombre.split(".")[0]] += ms
+        for paquete, ms in acumulado.items():
+            por_paquete[paquete].append(ms)
+
+    medianas = sorted(
+        ((paquete, statistics.median(valores)) for paquete, valores in por_paquete.items()),
+        key=lambda item: item[1], reverse=True
+    )
+    print(f"Importación en frío de app.py: {', '.join(modulos)}")
+    print(f"{'paquete':<24} {'ms':>8}")
+    for paquete, ms in medianas[:15]:
+        print(f"{paquete:<24} {ms:>8.1f}")
+    total = statistics.median(totales)
+    print(f"{'total':<24} {total:>8.1f}   (presupuesto {args.presupuesto_ms:.0f} ms)")
+
+    fallos = []
+    if total > args.presupuesto_ms:
+        fallos.append(f"el arranque tarda {total:.0f} ms, más que el presupuesto de {args.presupuesto_ms:.0f} ms")
+    perezosos = [modulo for modulo in MODULOS_PEREZOSOS if modulo in cargados]
+    if perezosos:
+        fallos.append(f"el shell importa módulos que deben cargarse en las páginas: {', '.join(perezosos)}")
+    for fallo in fallos:
+        print(f"FALLO: {fallo}")
+    sys.exit(1 if fallos else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Compara el rerun completo de Conceptos Flash con el rerun de una sola ficha.
+
+Uso:
+    python benchmarks/fragmento_conceptos.py [-c CONCEPTOS] [-n REPETICIONES]
+
+Inyecta un capítulo sintético con ``CONCEPTOS`` fichas y mide, para el rerun
+completo de la app y para el rerun de un único fragmento ``tarjeta_concepto``,
+el tiempo de ejecución y los bytes de deltas que viajarían por el websocket.
+
+AppTest siempre re-ejecuta el script completo, así que el rerun de fragmento se
+solicita sustituyendo su runner por uno que encola el id del fragmento, igual
+que hace el servidor cuando un widget dentro de la ficha cambia.
+"""
+
+import argparse
+import dataclasses
+import os
+import statistics
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import nucleo  # noqa: E402
+from streamlit.testing.v1 import AppTest, app_test, local_script_runner  # noqa: E402
+
+CAPITULO = "Cap 99: Capítulo de referencia"
+
+
+class _RunnerMedido(local_script_runner.LocalScriptRunner):
+    fragmento = None
+    bytes_deltas = 0
+
+    def _run_script(self, rerun_data):
+        if _RunnerMedido.fragmento is not None:
+            rerun_data = dataclasses.replace(
+                rerun_data,
+                fragment_id_queue=[_RunnerMedido.fragmento],
+                is_fragment_scoped_rerun=True,
+            )
+        return super()._run_script(rerun_data)
+
+    def forward_msgs(self):
+        mensajes = super().forward_msgs()
+        _RunnerMedido.bytes_deltas = sum(
+            m.ByteSize() for m in mensajes if m.WhichOneof("type") == "delta"
+        )
+        return mensajes
+
+
+def inyectar_capitulo(num_conceptos):
+    plantilla = next(iter(next(iter(nucleo.CONCEPTOS_CLAVE.values())).values()))
+    nucleo.CONCEPTOS_CLAVE[CAPITULO] = {
+        f"Concepto {i + 1}": dict(plantilla) for i in range(num_conceptos)
+    }
+
+
+def medir(at, repeticiones):
+    tiempos, tamanos = [], []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        at.run()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+        tamanos.append(_RunnerMedido.bytes_deltas)
+    return statistics.median(tiempos), statistics.median(tamanos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-c", "--conceptos", type=int, default=24)
+    parser.add_argument("-n", "--repeticiones", type=int, default=20)
+    args = parser.parse_args()
+
+    inyectar_capitulo(args.conceptos)
+    app_test.LocalScriptRunner = _RunnerMedido
+
+    at = AppTest.from_file(os.path.join(RAIZ, "app.py"), default_timeout=60).run()
+    at.switch_page("paginas/conceptos.py").run()
+    at.selectbox(key="selector_capitulo").select(CAPITULO).run()
+
+    completo_ms, completo_bytes = medir(at, args.repeticiones)
+
+    _RunnerMedido.fragmento = list(at._fragment_storage._fragments)[-1]
+    ficha_ms, ficha_bytes = medir(at, args.repeticiones)
+
+    print(f"Capítulo con {args.conceptos} conceptos (mediana de {args.repeticiones} reruns)")
+    print(f"{'':<18} {'ms':>8} {'bytes delta':>12}")
+    print(f"{'rerun completo':<18} {completo_ms:>8.1f} {completo_bytes:>12,.0f}")
+    print(f"{'rerun de ficha':<18} {ficha_ms:>8.1f} {ficha_bytes:>12,.0f}")
+    print(f"{'reducción':<18} {1 - ficha_ms / completo_ms:>8.0%} "
+          f"{1 - ficha_bytes / completo_bytes:>12.0%}")
+
+
+if __name__ == "__main__":
+    main()
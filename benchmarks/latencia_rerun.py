@@ -0,0 +1,96 @@
+"""Mide la latencia por rerun de cada página con el runner headless de Streamlit.
+
+Uso:
+    python benchmarks/latencia_rerun.py                   # árbol actual
+    python benchmarks/latencia_rerun.py --referencia REV  # compara con un commit
+
+Con ``--referencia`` se extrae ese commit a un directorio temporal y se mide
+con la misma metodología, de modo que el antes/después es comparable. Para la
+versión monolítica (sin ``paginas/``) la página se elige con
+``st.session_state.pagina_actual``.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import tempfile
+import time
+
+from streamlit.testing.v1 import AppTest
+
+PAGINAS = [
+    "inicio", "diagnostico", "mapa", "conceptos", "simulador", "constructor",
+    "casos", "laboratorio", "quiz", "repaso", "progreso",
+]
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def medir_pagina(directorio, pagina, repeticiones):
+    """Devuelve los tiempos (ms) de ``repeticiones`` reruns de una página."""
+    at = AppTest.from_file(os.path.join(directorio, "app.py"), default_timeout=60)
+    multipagina = os.path.isdir(os.path.join(directorio, "paginas"))
+    if multipagina:
+        at.run()
+        at.switch_page(f"paginas/{pagina}.py")
+    else:
+        at.session_state["pagina_actual"] = pagina
+    at.run()  # calentamiento: imports y cachés del proceso
+
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        at.run()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return tiempos
+
+
+def medir_arbol(directorio, repeticiones):
+    resultados = {}
+    for pagina in PAGINAS:
+        try:
+            tiempos = medir_pagina(directorio, pagina, repeticiones)
+        except Exception as error:  # el runner headless no soporta todo
+            print(f"{pagina}: no medible ({error})")
+            continue
+        resultados[pagina] = (statistics.median(tiempos), max(tiempos))
+    return resultados
+
+
+def extraer_referencia(revision, destino):
+    archivo = subprocess.run(
+        ["git", "archive", revision], cwd=RAIZ, check=True, capture_output=True
+    ).stdout
+    subprocess.run(["tar", "-x", "-C", destino], input=archivo, check=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--referencia", help="commit con el que comparar")
+    parser.add_argument("-n", "--repeticiones", type=int, default=20)
+    args = parser.parse_args()
+
+    actual = medir_arbol(RAIZ, args.repeticiones)
+    referencia = None
+    if args.referencia:
+        with tempfile.TemporaryDirectory() as tmp:
+            extraer_referencia(args.referencia, tmp)
+            referencia = medir_arbol(tmp, args.repeticiones)
+
+    print(f"{'página':<12} {'mediana ms':>11} {'máx ms':>8}", end="")
+    print(f" {'ref. mediana':>13} {'Δ':>7}" if referencia else "")
+    for pagina in PAGINAS:
+        if pagina not in actual:
+            continue
+        mediana, maximo = actual[pagina]
+        print(f"{pagina:<12} {mediana:>11.1f} {maximo:>8.1f}", end="")
+        if referencia and pagina in referencia:
+            ref = referencia[pagina][0]
+            print(f" {ref:>13.1f} {(mediana - ref) / ref:>+7.0%}")
+        else:
+            print(f" {'n/d':>13}" if referencia else "")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""Funciones compartidas por el shell de la aplicación y las páginas."""
+
+import functools
+import json
+import re
+import uuid
+
+import streamlit as st
+
+from nucleo.actividades import TIPOS, RegistroActividades
+from nucleo.almacen import RUTA_PROGRESO, AlmacenProgreso
+from nucleo.puntuacion import calcular_nivel_estudiante
+from nucleo.repeticion import Agenda, item_vigente
+
+ID_ESTUDIANTE = re.compile(r"[A-Za-z0-9_-]{8,64}")
+
+# --- FUNCIONES AUXILIARES ---
+
+def actualizar_puntos(puntos):
+    """Actualiza los puntos del estudiante"""
+    st.session_state.progreso['puntos_totales'] += puntos
+    nivel, color = calcular_nivel_estudiante(st.session_state.progreso)
+    st.session_state.progreso['nivel'] = nivel
+    progreso_modificado()
+
+def progreso_modificado():
+    """Marca el progreso para que ``guardar_progreso`` lo guarde"""
+    st.session_state.progreso_modificado = True
+
+def progreso_inicial():
+    """Progreso de un estudiante nuevo; ``actividades`` es un conjunto de bits (ver ``registro_actividades``)
+    
+    ``conceptos_por_area`` cuenta los conceptos vistos de cada área y se deriva
+    de ``actividades``: no se guarda en el almacén.
+    """
+    return {'actividades': 0, 'conceptos_por_area': {}, 'puntos_totales': 0, 'nivel': 'Principiante'}
+
+@st.cache_resource(show_spinner=False)
+def registro_actividades():
+    """IDs enteros de las actividades del curso, compartidos por todas las sesiones del proceso"""
+    from nucleo.paquete import cargar_contenido
+    
+    return RegistroActividades.desde_contenido(cargar_contenido())
+
+def marcar_actividad(tipo, clave):
+    """Marca como hecha una actividad (``tipo`` es uno de ``TIPOS``)"""
+    progreso = st.session_state.progreso
+    bit = registro_actividades().bit(tipo, clave)
+    if progreso['actividades'] & bit:
+        return
+    progreso['actividades'] |= bit
+    progreso_modificado()
+    if tipo == 'conceptos_vistos':
+        _sumar_areas(progreso['conceptos_por_area'], [clave])
+
+def _sumar_areas(por_area, conceptos):
+    """Suma cada concepto al contador de su área (``INDICES['area_concepto']``)"""
+    from nucleo import INDICES
+    
+    area_concepto = INDICES['area_concepto']
+    for concepto in conceptos:
+        area = area_concepto.get(concepto)
+        if area is not None:
+            por_area[area] = por_area.get(area, 0) + 1
+
+def actividad_hecha(tipo, clave):
+    """Indica si el estudiante ya hizo la actividad"""
+    return bool(st.session_state.progreso['actividades'] & registro_actividades().bit(tipo, clave))
+
+def contar_actividades(tipo=None):
+    """Actividades hechas de un tipo (o de todos): un popcount del conjunto de bits"""
+    return registro_actividades().contar(st.session_state.progreso['actividades'], tipo)
+
+def agenda_repaso():
+    """Agenda de repetición espaciada del estudiante (se crea al primer uso y se guarda con el progreso)"""
+    if 'agenda_repaso' not in st.session_state:
+        st.session_state.agenda_repaso = Agenda()
+    return st.session_state.agenda_repaso
+
+@st.cache_resource(show_spinner=False)
+def almacen_progreso():
+    """Almacén de progreso compartido por todas las sesiones del proceso"""
+    return AlmacenProgreso(RUTA_PROGRESO)
+
+def iniciar_sesion_estudiante():
+    """Identifica al estudiante por la URL (``?estudiante=...``) y, al abrir la sesión, restaura su progreso.
+    
+    Si la URL no trae un ID se crea uno nuevo; el ID se mantiene en la URL para
+    que una reconexión o un reinicio del servidor recupere el mismo progreso.
+    """
+    if 'estudiante' in st.session_state:
+        if st.query_params.get('estudiante') != st.session_state.estudiante:
+            st.query_params['estudiante'] = st.session_state.estudiante
+        return
+    
+    estudiante = st.query_params.get('estudiante', '')
+    if not ID_ESTUDIANTE.fullmatch(estudiante):
+        estudiante = uuid.uuid4().hex
+        st.query_params['estudiante'] = estudiante
+    st.session_state.estudiante = estudiante
+    
+    datos = almacen_progreso().cargar(estudiante)
+    if datos is None:
+        return
+    st.session_state.progreso_guardado = _huella(datos)
+    registro = registro_actividades()
+    progreso = progreso_inicial()
+    progreso.update({clave: valor for clave, valor in datos['progreso'].items() if clave not in TIPOS})
+    for tipo in TIPOS:
+        progreso['actividades'] |= registro.bits(tipo, datos['progreso'][tipo])
+    _sumar_areas(progreso['conceptos_por_area'], set(datos['progreso']['conceptos_vistos']))
+    st.session_state.progreso = progreso
+    st.session_state.diagnostico_completado = datos['diagnostico_completado']
+    st.session_state.respuestas_diagnostico = {int(i): acierto for i, acierto in datos['respuestas_diagnostico']}
+    st.session_state.marca_creada = datos['marca_creada']
+    if datos.get('agenda'):
+        from nucleo import INDICES
+        
+        st.session_state.agenda_repaso = Agenda.desde_datos(
+            datos['agenda'], lambda item: item_vigente(item, INDICES)
+        )
+
+def _datos_guardables(progreso, diagnostico_completado, respuestas_diagnostico, marca_creada, agenda=None):
+    """Estado del estudiante tal como se guarda en el almacén"""
+    registro = registro_actividades()
+    progreso = dict(progreso)
+    bits = progreso.pop('actividades')
+    del progreso['conceptos_por_area']
+    # Se guardan los nombres, no los bits: los IDs del registro solo valen en este proceso
+    return {
+        'progreso': {**progreso, **{tipo: sorted(registro.claves_de(bits, tipo)) for tipo in TIPOS}},
+        'diagnostico_completado': diagnostico_completado,
+        'respuestas_diagnostico': sorted(respuestas_diagnostico.items()),
+        'marca_creada': marca_creada,
+        'agenda': agenda.datos() if agenda is not None else {},
+    }
+
+def _huella(datos):
+    return json.dumps(datos, sort_keys=True, ensure_ascii=False)
+
+@functools.cache
+def _huella_inicial():
+    return _huella(_datos_guardables(progreso_inicial(), False, {}, {}))
+
+def guardar_progreso():
+    """Programa el guardado del progreso si cambió desde el último guardado (no espera al disco)
+    
+    Se llama al final de cada rerun y desde los fragmentos que cambian el
+    progreso, porque sus reruns no llegan al final de ``app.py``. Solo
+    serializa el estado si algo lo marcó (``progreso_modificado``) o si la
+    agenda de repaso registró cambios desde el último guardado.
+    """
+    agenda = st.session_state.get('agenda_repaso')
+    cambios_agenda = agenda.cambios if agenda is not None else 0
+    if not st.session_state.get('progreso_modificado') and cambios_agenda == st.session_state.get('cambios_agenda', 0):
+        return
+    st.session_state.progreso_modificado = False
+    st.session_state.cambios_agenda = cambios_agenda
+    
+    datos = _datos_guardables(
+        st.session_state.progreso,
+        st.session_state.diagnostico_completado,
+        st.session_state.respuestas_diagnostico,
+        st.session_state.marca_creada,
+        agenda,
+    )
+    huella = _huella(datos)
+    # Mientras el estado siga siendo el inicial no se crea la fila del estudiante
+    if huella != (st.session_state.get('progreso_guardado') or _huella_inicial()):
+        almacen_progreso().guardar(st.session_state.estudiante, datos)
+        st.session_state.progreso_guardado = huella
+
+def mostrar_progreso_global():
+    """Muestra el progreso general del estudiante"""
+    progreso = st.session_state.progreso
+    nivel, color = calcular_nivel_estudiante(progreso)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("🎯 Puntos Totales", progreso['puntos_totales'])
+    with col2:
+        st.metric("📖 Conceptos Vistos", contar_actividades('conceptos_vistos'))
+    with col3:
+        st.metric("✅ Quizzes Completados", contar_actividades('quizzes_completados'))
+    with col4:
+        st.metric("⚖️ Casos Resueltos", contar_actividades('casos_resueltos'))
+    
+    st.markdown(f"**Nivel Actual:** <span style='color:{color}; font-size:1.3rem; font-weight:bold;'>{nivel}</span>", unsafe_allow_html=True)
+    
+    # Barra de progreso hacia siguiente nivel
+    puntos = progreso['puntos_totales']
+    if puntos < 100:
+        progreso_nivel = puntos / 100
+        siguiente = "Aprendiz (100 pts)"
+    elif puntos < 300:
+        progreso_nivel = (puntos - 100) / 200
+        siguiente = "Competente (300 pts)"
+    elif puntos < 600:
+        progreso_nivel = (puntos - 300) / 300
+        siguiente = "Avanzado (600 pts)"
+    elif puntos < 1000:
+        progreso_nivel = (puntos - 600) / 400
+        siguiente = "Experto (1000 pts)"
+    else:
+        progreso_nivel = 1.0
+        siguiente = "¡Nivel Máximo!"
+    
+    st.progress(progreso_nivel)
+    st.caption(f"Próximo nivel: {siguiente}")
+
+def mostrar_perfil(perfil):
+    """Muestra en la barra lateral el resumen del último rerun perfilado"""
+    if 'segundos' not in perfil:
+        return
+    with st.expander(f"🔬 Perfil: {perfil['pagina']} ({perfil['segundos'] * 1000:.0f} ms)"):
+        st.caption(f"Pico de memoria: {perfil['pico_memoria_mb']:.1f} MB")
+        st.dataframe(
+            [
+                {"Función": fila['funcion'], "Acum. ms": round(fila['acumulado_ms'], 1), "Llamadas": fila['llamadas']}
+                for fila in perfil['funciones']
+            ],
+            hide_index=True
+        )
+        st.markdown("**Mayores asignaciones de memoria**")
+        for asignacion in perfil['asignaciones']:
+            st.caption(f"{asignacion['kb']:,.0f} KB · {asignacion['linea']}")
+        st.caption(f"📁 `{perfil['ruta_perfil']}`\n\n📁 `{perfil['ruta_memoria']}`")
+        if st.button("Cerrar perfil", key="cerrar_perfil"):
+            del st.session_state.ultimo_perfil
+            st.rerun()
@@ -0,0 +1,218 @@
+"""Métricas de latencia por página, compartidas por todas las sesiones del proceso.
+
+``app.py`` envuelve cada rerun con ``MedicionRerun`` y el registro acumula,
+por página, un histograma de tiempos, percentiles sobre las últimas
+``MUESTRAS_POR_PAGINA`` ejecuciones y el número de elementos emitidos.
+
+Si la variable de entorno ``MARKETING_METRICAS`` apunta a un archivo, el
+registro se exporta allí cada ``INTERVALO_EXPORTACION`` segundos: en JSON si la
+extensión es ``.json`` y en formato de texto de Prometheus en otro caso (apto
+para el *textfile collector* de node_exporter).
+"""
+
+import bisect
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from itertools import accumulate
+
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# Límites superiores de los buckets del histograma, en segundos
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PERCENTILES = (50, 95, 99)
+MUESTRAS_POR_PAGINA = 2048
+VENTANA_SESION_ACTIVA = 300  # segundos sin rerun para dar una sesión por inactiva
+INTERVALO_EXPORTACION = 15
+
+RUTA_EXPORTACION = os.environ.get("MARKETING_METRICAS")
+
+
+def _percentiles(ordenadas, percentiles):
+    """Percentiles con interpolación lineal (como ``numpy.percentile``) sobre datos ordenados."""
+    resultado = []
+    for p in percentiles:
+        posicion = (len(ordenadas) - 1) * p / 100
+        inferior = math.floor(posicion)
+        superior = min(inferior + 1, len(ordenadas) - 1)
+        fraccion = posicion - inferior
+        resultado.append(ordenadas[inferior] * (1 - fraccion) + ordenadas[superior] * fraccion)
+    return resultado
+
+
+class _EstadisticasPagina:
+    def __init__(self):
+        self.reruns = 0
+        self.segundos = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)  # el último es +Inf
+        self.muestras = deque(maxlen=MUESTRAS_POR_PAGINA)
+        self.elementos = 0
+        self.ultimo_rerun = 0.0
+
+    def registrar(self, segundos, elementos):
+        self.reruns += 1
+        self.segundos += segundos
+        self.buckets[bisect.bisect_left(BUCKETS, segundos)] += 1
+        self.muestras.append(segundos)
+        self.elementos += elementos
+        self.ultimo_rerun = time.time()
+
+
+class RegistroMetricas:
+    """Acumula las mediciones de todas las sesiones; seguro entre hilos."""
+
+    def __init__(self, ruta_exportacion=None):
+        self.ruta_exportacion = ruta_exportacion
+        self._paginas = {}
+        self._sesiones = {}  # sesión -> último rerun, en orden de último rerun
+        self._sesiones_totales = 0
+        self._ultima_exportacion = 0.0
+        self._lock = threading.Lock()
+
+    def registrar(self, pagina, segundos, elementos, sesion):
+        with self._lock:
+            self._paginas.setdefault(pagina, _EstadisticasPagina()).registrar(segundos, elementos)
+            ahora = time.time()
+            # Una sesión que vuelve tras más de VENTANA_SESION_ACTIVA sin reruns cuenta otra vez
+            if self._sesiones.pop(sesion, None) is None:
+                self._sesiones_totales += 1
+            self._sesiones[sesion] = ahora
+            self._podar(ahora)
+            exportar = (
+                self.ruta_exportacion
+                and time.time() - self._ultima_exportacion >= INTERVALO_EXPORTACION
+            )
+            if exportar:
+                self._ultima_exportacion = time.time()
+        if exportar:
+            self.exportar(self.ruta_exportacion)
+
+    def _podar(self, ahora):
+        """Descarta las sesiones inactivas; como están en orden de último rerun, solo mira el principio."""
+        limite = ahora - VENTANA_SESION_ACTIVA
+        while self._sesiones:
+            sesion = next(iter(self._sesiones))
+            if self._sesiones[sesion] >= limite:
+                break
+            del self._sesiones[sesion]
+
+    def sesiones_activas(self):
+        with self._lock:
+            self._podar(time.time())
+            return len(self._sesiones)
+
+    def resumen(self):
+        """Diccionario serializable con las métricas actuales de cada página."""
+        with self._lock:
+            paginas = {}
+            for nombre, stats in sorted(self._paginas.items()):
+                percentiles = _percentiles(sorted(stats.muestras), PERCENTILES)
+                paginas[nombre] = {
+                    "reruns": stats.reruns,
+                    "segundos_total": stats.segundos,
+                    "buckets": dict(zip([*map(str, BUCKETS), "+Inf"], accumulate(stats.buckets))),
+                    "percentiles_ms": {
+                        f"p{p}": valor * 1000 for p, valor in zip(PERCENTILES, percentiles)
+                    },
+                    "elementos_por_rerun": stats.elementos / stats.reruns,
+                    "ultimo_rerun": stats.ultimo_rerun,
+                }
+            sesiones_totales = self._sesiones_totales
+        return {
+            "generado": time.time(),
+            "sesiones_activas": self.sesiones_activas(),
+            "sesiones_totales": sesiones_totales,
+            "paginas": paginas,
+        }
+
+    def prometheus(self):
+        """Resumen en el formato de exposición de texto de Prometheus."""
+        resumen = self.resumen()
+        lineas = [
+            "# HELP marketing_sesiones_activas Sesiones con algún rerun en los últimos 5 minutos.",
+            "# TYPE marketing_sesiones_activas gauge",
+            f"marketing_sesiones_activas {resumen['sesiones_activas']}",
+            "# HELP marketing_rerun_segundos Duración del rerun completo por página.",
+            "# TYPE marketing_rerun_segundos histogram",
+        ]
+        for pagina, datos in resumen["paginas"].items():
+            for limite, acumulado in datos["buckets"].items():
+                lineas.append(f'marketing_rerun_segundos_bucket{{pagina="{pagina}",le="{limite}"}} {acumulado}')
+            lineas.append(f'marketing_rerun_segundos_sum{{pagina="{pagina}"}} {datos["segundos_total"]:.6f}')
+            lineas.append(f'marketing_rerun_segundos_count{{pagina="{pagina}"}} {datos["reruns"]}')
+        lineas += [
+            "# HELP marketing_rerun_percentil_segundos Percentiles sobre los últimos reruns de cada página.",
+            "# TYPE marketing_rerun_percentil_segundos gauge",
+        ]
+        for pagina, datos in resumen["paginas"].items():
+            for nombre, valor in datos["percentiles_ms"].items():
+                lineas.append(
+                    f'marketing_rerun_percentil_segundos{{pagina="{pagina}",percentil="{nombre[1:]}"}} {valor / 1000:.6f}'
+                )
+        lineas += [
+            "# HELP marketing_elementos_por_rerun Elementos de Streamlit emitidos por rerun (promedio).",
+            "# TYPE marketing_elementos_por_rerun gauge",
+        ]
+        for pagina, datos in resumen["paginas"].items():
+            lineas.append(f'marketing_elementos_por_rerun{{pagina="{pagina}"}} {datos["elementos_por_rerun"]:.1f}')
+        return "\n".join(lineas) + "\n"
+
+    def exportar(self, ruta):
+        """Escribe el registro en ``ruta`` de forma atómica (JSON o Prometheus según la extensión)."""
+        if ruta.endswith(".json"):
+            contenido = json.dumps(self.resumen(), ensure_ascii=False, indent=2)
+        else:
+            contenido = self.prometheus()
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            archivo.write(contenido)
+        os.replace(temporal, ruta)
+
+
+REGISTRO = RegistroMetricas(RUTA_EXPORTACION)
+
+
+class MedicionRerun:
+    """Mide un rerun desde su creación hasta el final de la página.
+
+    Se crea al inicio de ``app.py``; a partir de ese momento cuenta los
+    elementos que el script envía al navegador. ``pagina(nombre)`` envuelve la
+    ejecución de la página y al salir registra el tiempo total del rerun
+    (shell, barra lateral y página).
+    """
+
+    def __init__(self, registro=REGISTRO):
+        self.registro = registro
+        self.inicio = time.perf_counter()
+        self.elementos = 0
+        self._ctx = get_script_run_ctx()
+        if self._ctx is not None:
+            # Si un rerun anterior falló antes de terminar, su contador sigue puesto
+            self._ctx.__dict__.pop("enqueue", None)
+            enviar = self._ctx.enqueue
+
+            def contar_y_enviar(msg):
+                if msg.WhichOneof("type") == "delta" and msg.delta.WhichOneof("type") == "new_element":
+                    self.elementos += 1
+                enviar(msg)
+
+            # El contexto se reutiliza entre reruns: se restaura al terminar
+            self._ctx.enqueue = contar_y_enviar
+
+    @contextmanager
+    def pagina(self, nombre):
+        """Ejecuta la página y registra el rerun, también si termina con ``st.rerun()``."""
+        try:
+            yield self
+        finally:
+            self.terminar(nombre)
+
+    def terminar(self, nombre):
+        segundos = time.perf_counter() - self.inicio
+        if self._ctx is not None:
+            self._ctx.__dict__.pop("enqueue", None)
+            self.registro.registrar(nombre, segundos, self.elementos, self._ctx.session_id)
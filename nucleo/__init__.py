@@ -0,0 +1,52 @@
+"""Capa de biblioteca: contenido del curso, reglas de puntuación y motor del CVP.
+
+Nada en este paquete importa Streamlit ni tiene efectos al importarse, de modo
+que los trabajos por lotes y los scripts pueden reutilizarlo sin levantar la
+aplicación. Los submódulos se cargan al primer acceso::
+
+    from nucleo import calificar           # solo importa nucleo.puntuacion
+    from nucleo import BANCO_PREGUNTAS     # carga el paquete de contenido en ese momento
+
+El contenido se sirve desde el paquete precompilado (ver ``nucleo.paquete``),
+no importando ``nucleo.contenido``.
+"""
+
+import importlib
+
+# Nombre público -> submódulo que lo define ("paquete": contenido compilado)
+_EXPORTACIONES = {
+    "CONCEPTOS_CLAVE": "paquete",
+    "BANCO_PREGUNTAS": "paquete",
+    "CASOS_ESTRATEGICOS": "paquete",
+    "PREGUNTAS_DIAGNOSTICO": "paquete",
+    "COMPARACIONES_LABORATORIO": "paquete",
+    "RESUMENES_EJECUTIVOS": "paquete",
+    "GLOSARIO": "paquete",
+    "CATEGORIAS_MAPA": "paquete",
+    "AREAS_CONOCIMIENTO": "paquete",
+    "INDICES": "paquete",
+    "NIVELES_QUIZ": "puntuacion",
+    "calcular_nivel_estudiante": "puntuacion",
+    "es_correcta": "puntuacion",
+    "calificar": "puntuacion",
+    "nivel_diagnostico": "puntuacion",
+    "puntos_quiz": "puntuacion",
+}
+
+__all__ = list(_EXPORTACIONES)
+
+
+def __getattr__(nombre):
+    if nombre not in _EXPORTACIONES:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    modulo = importlib.import_module(f".{_EXPORTACIONES[nombre]}", __name__)
+    if _EXPORTACIONES[nombre] == "paquete":
+        valor = modulo.cargar_contenido()[nombre]
+    else:
+        valor = getattr(modulo, nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
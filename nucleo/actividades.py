@@ -0,0 +1,162 @@
+"""Registro de actividades con IDs enteros densos y progreso como conjunto de bits.
+
+Cada actividad que cuenta para el progreso (concepto visto, quiz completado,
+caso resuelto) recibe un entero en ``RegistroActividades``. El progreso de un
+estudiante es un solo ``int`` con el bit ``id`` encendido por cada actividad
+hecha: contarlas es ``int.bit_count()`` y restringirlas a un tipo o a un área
+es un AND con la máscara correspondiente, sin recorrer cadenas.
+
+Los IDs son densos y se asignan por tipo (``TIPOS``) a partir del contenido.
+Las claves que no están en el contenido (como ``quiz_cvp_<producto>`` del
+catálogo) se registran al primer uso. Los IDs solo valen dentro del proceso:
+el progreso se guarda con los nombres de las actividades (``claves``) y se
+vuelve a convertir a bits al cargarlo.
+
+``matriz_bits`` y ``resumen_cohorte`` agregan el progreso de toda una cohorte
+sobre una matriz de bits de numpy; ``python -m nucleo.actividades`` lo hace
+con el almacén de progreso (ver ``nucleo.almacen``).
+"""
+
+import argparse
+import threading
+
+TIPOS = ("conceptos_vistos", "quizzes_completados", "casos_resueltos")
+PREFIJO_QUIZ_LABORATORIO = "quiz_lab_"
+CASO_CONSTRUCTOR = "constructor_marca"
+
+
+class RegistroActividades:
+    """Clave de actividad -> ID entero denso, con una máscara de bits por tipo.
+
+    Seguro entre hilos: registrar claves nuevas no cambia los IDs existentes.
+    """
+
+    def __init__(self, grupos=()):
+        self.claves = []
+        self.tipos = []
+        self.mascaras = dict.fromkeys(TIPOS, 0)
+        self._ids = {}
+        self._lock = threading.Lock()
+        for tipo, claves in dict(grupos).items():
+            for clave in claves:
+                self.id(tipo, clave)
+
+    @classmethod
+    def desde_contenido(cls, contenido):
+        """Registro con todas las actividades que el contenido del curso conoce de antemano."""
+        conceptos = dict.fromkeys(
+            [nombre for conceptos in contenido["CONCEPTOS_CLAVE"].values() for nombre in conceptos]
+            + [tema for temas in contenido["CATEGORIAS_MAPA"].values() for tema in temas]
+        )
+        return cls({
+            "conceptos_vistos": conceptos,
+            "quizzes_completados": [
+                PREFIJO_QUIZ_LABORATORIO + comparacion for comparacion in contenido["COMPARACIONES_LABORATORIO"]
+            ],
+            "casos_resueltos": [*contenido["CASOS_ESTRATEGICOS"], CASO_CONSTRUCTOR],
+        })
+
+    def __len__(self):
+        return len(self.claves)
+
+    def id(self, tipo, clave):
+        """ID de la actividad; la registra si es nueva."""
+        identificador = self._ids.get((tipo, clave))
+        if identificador is None:
+            with self._lock:
+                identificador = self._ids.get((tipo, clave))
+                if identificador is None:
+                    identificador = len(self.claves)
+                    self.claves.append(clave)
+                    self.tipos.append(tipo)
+                    self.mascaras[tipo] |= 1 << identificador
+                    self._ids[(tipo, clave)] = identificador
+        return identificador
+
+    def bit(self, tipo, clave):
+        return 1 << self.id(tipo, clave)
+
+    def bits(self, tipo, claves):
+        """Conjunto de bits de ``claves`` (registra las que sean nuevas)."""
+        resultado = 0
+        for clave in claves:
+            resultado |= 1 << self.id(tipo, clave)
+        return resultado
+
+    def contar(self, bits, tipo=None):
+        """Actividades hechas en ``bits``, de un tipo o de todos."""
+        return (bits if tipo is None else bits & self.mascaras[tipo]).bit_count()
+
+    def claves_de(self, bits, tipo):
+        """Nombres de las actividades de ``tipo`` en ``bits``, en orden de ID."""
+        bits &= self.mascaras[tipo]
+        claves = []
+        while bits:
+            menor = bits & -bits
+            claves.append(self.claves[menor.bit_length() - 1])
+            bits ^= menor
+        return claves
+
+
+def matriz_bits(bitsets, ancho):
+    """Matriz ``uint8`` ``(estudiantes, ceil(ancho / 8))`` con un bit por actividad (orden ``little``)."""
+    import numpy as np
+
+    n_bytes = (ancho + 7) // 8
+    datos = b"".join(bits.to_bytes(n_bytes, "little") for bits in bitsets)
+    return np.frombuffer(datos, dtype=np.uint8).reshape(len(bitsets), n_bytes)
+
+
+def resumen_cohorte(registro, bitsets):
+    """Agregados de una cohorte sobre su matriz de bits.
+
+    Devuelve ``por_actividad`` (estudiantes que hicieron cada actividad, por
+    ID) y ``por_tipo``: tipo -> actividades hechas por cada estudiante.
+    """
+    import numpy as np
+
+    matriz = matriz_bits(bitsets, len(registro))
+    unos = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
+    por_tipo = {}
+    for tipo, mascara in registro.mascaras.items():
+        bytes_mascara = np.frombuffer(mascara.to_bytes(matriz.shape[1], "little"), dtype=np.uint8)
+        por_tipo[tipo] = unos[matriz & bytes_mascara].sum(axis=1)
+    por_actividad = np.unpackbits(matriz, axis=1, bitorder="little")[:, :len(registro)].sum(axis=0)
+    return {"por_actividad": por_actividad, "por_tipo": por_tipo}
+
+
+def main():
+    from nucleo.almacen import RUTA_PROGRESO, leer_todos
+    from nucleo.paquete import cargar_contenido
+
+    parser = argparse.ArgumentParser(description="Resume el progreso de todos los estudiantes del almacén.")
+    parser.add_argument("--base", default=RUTA_PROGRESO, help=f"base de progreso (por defecto {RUTA_PROGRESO})")
+    parser.add_argument("--top", type=int, default=10, help="actividades más y menos hechas a mostrar")
+    args = parser.parse_args()
+
+    registro = RegistroActividades.desde_contenido(cargar_contenido())
+    bitsets = []
+    for _, datos in leer_todos(args.base):
+        progreso = datos["progreso"]
+        bits = 0
+        for tipo in TIPOS:
+            bits |= registro.bits(tipo, progreso.get(tipo, ()))
+        bitsets.append(bits)
+    if not bitsets:
+        print("No hay estudiantes en el almacén.")
+        return
+
+    resumen = resumen_cohorte(registro, bitsets)
+    print(f"{len(bitsets):,} estudiantes, {len(registro)} actividades")
+    for tipo, cantidades in resumen["por_tipo"].items():
+        print(f"  {tipo}: media {cantidades.mean():.1f}, máximo {cantidades.max()}")
+    orden = resumen["por_actividad"].argsort()[::-1]
+    for titulo, ids in (("Más hechas", orden[:args.top]), ("Menos hechas", orden[::-1][:args.top])):
+        print(titulo)
+        for identificador in ids:
+            print(f"  {resumen['por_actividad'][identificador] / len(bitsets):6.1%}  "
+                  f"{registro.tipos[identificador]}: {registro.claves[identificador]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""Almacén local y durable del progreso de cada estudiante (SQLite en modo WAL).
+
+Cada estudiante tiene una fila ``(estudiante, datos, actualizado)`` con su
+estado serializado en JSON, así que restaurarlo al abrir una sesión es una
+sola lectura por clave primaria.
+
+Las escrituras no van al disco en el momento: ``guardar`` deja la última
+instantánea de cada estudiante en memoria (las siguientes la reemplazan) y un
+hilo de fondo las escribe todas juntas en una transacción cada
+``INTERVALO_ESCRITURA`` segundos, o antes si se acumulan ``LOTE_MAXIMO``
+estudiantes. Con WAL y ``synchronous=NORMAL`` SQLite solo sincroniza el disco
+en los puntos de control, no en cada transacción. Si el proceso muere sin
+cerrar el almacén se pierden como mucho los cambios del último intervalo;
+``cerrar`` (registrado con ``atexit``) escribe lo pendiente antes de salir.
+
+La base vive en ``datos/progreso.db`` salvo que la variable de entorno
+``MARKETING_PROGRESO`` indique otra ruta.
+"""
+
+import atexit
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+RUTA_PROGRESO = os.environ.get("MARKETING_PROGRESO") or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "datos", "progreso.db"
+)
+INTERVALO_ESCRITURA = 1.0  # segundos
+LOTE_MAXIMO = 500
+
+_registro = logging.getLogger(__name__)
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS progreso (
+    estudiante TEXT PRIMARY KEY,
+    datos TEXT NOT NULL,
+    actualizado REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+
+def _conectar(ruta):
+    conexion = sqlite3.connect(ruta, timeout=30, check_same_thread=False, isolation_level=None)
+    conexion.execute("PRAGMA journal_mode=WAL")
+    conexion.execute("PRAGMA synchronous=NORMAL")
+    return conexion
+
+
+def leer_todos(ruta):
+    """``(estudiante, datos)`` de todos los estudiantes guardados, para trabajos por lotes."""
+    if not os.path.exists(ruta):
+        return
+    conexion = sqlite3.connect(f"file:{ruta}?mode=ro", uri=True)
+    try:
+        for estudiante, datos in conexion.execute("SELECT estudiante, datos FROM progreso"):
+            yield estudiante, json.loads(datos)
+    finally:
+        conexion.close()
+
+
+class AlmacenProgreso:
+    """Progreso por estudiante con lecturas directas y escrituras agrupadas en segundo plano.
+
+    Seguro entre hilos: todas las sesiones del proceso comparten una instancia.
+    """
+
+    def __init__(self, ruta, intervalo=INTERVALO_ESCRITURA, lote_maximo=LOTE_MAXIMO):
+        directorio = os.path.dirname(os.path.abspath(ruta))
+        os.makedirs(directorio, exist_ok=True)
+        self.ruta = ruta
+        self.intervalo = intervalo
+        self.lote_maximo = lote_maximo
+        self.escrituras = 0  # transacciones hechas
+        self._conexion = _conectar(ruta)
+        self._conexion.execute(ESQUEMA)
+        self._lock_conexion = threading.Lock()
+        self._pendientes = {}
+        self._en_curso = {}  # lote que se está escribiendo: sigue visible para cargar()
+        self._lock = threading.Lock()
+        self._hay_trabajo = threading.Event()
+        self._cerrado = False
+        self._hilo = threading.Thread(target=self._escribir_en_fondo, name="almacen-progreso", daemon=True)
+        self._hilo.start()
+        atexit.register(self.cerrar)
+
+    def cargar(self, estudiante):
+        """Último estado guardado del estudiante, o ``None`` si no tiene."""
+        with self._lock:
+            pendiente = self._pendientes.get(estudiante, self._en_curso.get(estudiante))
+        if pendiente is None:
+            with self._lock_conexion:
+                fila = self._conexion.execute(
+                    "SELECT datos FROM progreso WHERE estudiante = ?", (estudiante,)
+                ).fetchone()
+            if fila is None:
+                return None
+            pendiente = fila[0]
+        return json.loads(pendiente)
+
+    def guardar(self, estudiante, datos):
+        """Programa la escritura de ``datos`` (serializables en JSON) sin esperar al disco."""
+        serializados = json.dumps(datos, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            if self._cerrado:
+                raise RuntimeError("el almacén de progreso está cerrado")
+            self._pendientes[estudiante] = serializados
+            lleno = len(self._pendientes) >= self.lote_maximo
+        if lleno:
+            self._hay_trabajo.set()
+
+    def vaciar(self):
+        """Escribe ahora lo pendiente; devuelve cuántos estudiantes escribió."""
+        with self._lock_conexion:
+            with self._lock:
+                lote, self._pendientes = self._pendientes, {}
+                self._en_curso = lote
+            if not lote:
+                return 0
+            ahora = time.time()
+            try:
+                self._conexion.execute("BEGIN")
+                self._conexion.executemany(
+                    "INSERT INTO progreso (estudiante, datos, actualizado) VALUES (?, ?, ?) "
+                    "ON CONFLICT (estudiante) DO UPDATE SET datos = excluded.datos, actualizado = excluded.actualizado",
+                    [(estudiante, datos, ahora) for estudiante, datos in lote.items()],
+                )
+                self._conexion.execute("COMMIT")
+            except BaseException:
+                if self._conexion.in_transaction:
+                    try:
+                        self._conexion.execute("ROLLBACK")
+                    except sqlite3.Error:
+                        pass  # SQLite ya deshizo la transacción al fallar el COMMIT
+                with self._lock:
+                    # Lo que llegó mientras tanto es más nuevo que el lote fallido
+                    self._pendientes = {**lote, **self._pendientes}
+                    self._en_curso = {}
+                raise
+            with self._lock:
+                self._en_curso = {}
+            self.escrituras += 1
+        return len(lote)
+
+    def _escribir_en_fondo(self):
+        while True:
+            self._hay_trabajo.wait(self.intervalo)
+            self._hay_trabajo.clear()
+            try:
+                self.vaciar()
+            except Exception:
+                # El lote quedó restaurado: se reintenta en el próximo intervalo
+                _registro.exception("no se pudo escribir el progreso en %s", self.ruta)
+            if self._cerrado:
+                return
+
+    def cerrar(self):
+        """Detiene el hilo de fondo y escribe lo pendiente."""
+        with self._lock:
+            if self._cerrado:
+                return
+            self._cerrado = True
+        self._hay_trabajo.set()
+        self._hilo.join()
+        self.vaciar()
+        with self._lock_conexion:
+            self._conexion.close()
@@ -0,0 +1,282 @@
+"""Analítica de ítems a partir de registros de respuestas.
+
+El registro tiene una fila por respuesta con las columnas ``COLUMNAS``:
+``estudiante``, ``item`` (ID de la pregunta del banco) y ``respuesta``
+(índice de la opción elegida en el orden del banco; vacía si no respondió).
+Se lee en bloques de ``TAMANO_BLOQUE`` filas, en dos pasadas y sin tener nunca
+el registro entero en memoria:
+
+1. aciertos y respuestas por estudiante y por ítem, y cuántas veces se eligió
+   cada opción;
+2. con los totales de cada estudiante, las sumas para la correlación
+   punto-biserial de cada ítem con el puntaje del estudiante en el resto de
+   los ítems (su proporción de aciertos sin contar ese ítem).
+
+Por ítem se obtiene la dificultad clásica (proporción de aciertos), la
+discriminación punto-biserial, la frecuencia de cada opción y, con las
+aproximaciones de Lord, parámetros TRI ``discriminacion`` y ``dificultad``
+(ver ``nucleo.irt``). Los ítems muy fáciles, muy difíciles, que discriminan
+poco o con un distractor más elegido que la respuesta correcta quedan
+marcados para revisar.
+
+``python -m nucleo.analitica respuestas.csv`` escribe el resultado en
+``datos/metadatos_items.json``; al recompilar el paquete, ``nucleo.paquete``
+usa esos parámetros en el banco (el quiz adaptativo elige con ellos) y los
+generadores de examen dejan fuera los ítems marcados.
+"""
+
+import argparse
+import json
+import os
+import sys
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from nucleo.calificacion import SIN_RESPUESTA
+
+COLUMNAS = ("estudiante", "item", "respuesta")
+TAMANO_BLOQUE = 500_000
+MAXIMO_OPCIONES = 26
+
+MINIMO_RESPUESTAS = 50       # por debajo no se calibra ni se marca el ítem
+PROPORCION_MAXIMA = 0.95     # más fácil que esto: no informa
+PROPORCION_MINIMA = 0.20     # más difícil que esto: casi azar con cuatro opciones
+DISCRIMINACION_MINIMA = 0.15  # punto-biserial mínima aceptable
+LIMITE_DIFICULTAD = 4.0      # mismo rango que la rejilla de nucleo.irt
+
+
+def _bloques_csv(ruta, tamano_bloque):
+    yield from pd.read_csv(
+        ruta, usecols=list(COLUMNAS), dtype={"estudiante": str, "item": str}, chunksize=tamano_bloque
+    )
+
+
+def _bloques_parquet(ruta, tamano_bloque):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("Para leer archivos Parquet se necesita instalar pyarrow") from None
+
+    lector = pq.ParquetFile(ruta)
+    for lote in lector.iter_batches(batch_size=tamano_bloque, columns=list(COLUMNAS)):
+        yield lote.to_pandas()
+
+
+def abrir_registro(ruta, tamano_bloque=TAMANO_BLOQUE):
+    """Función que devuelve un iterador nuevo de bloques del registro en cada llamada."""
+    extension = ruta.rsplit(".", 1)[-1].lower()
+    if extension == "csv":
+        return lambda: _bloques_csv(ruta, tamano_bloque)
+    if extension == "parquet":
+        return lambda: _bloques_parquet(ruta, tamano_bloque)
+    raise ValueError("Formato no soportado: usa un archivo .csv o .parquet")
+
+
+def _sumar(total, codigos, pesos=None, largo=0):
+    """``total`` más el ``bincount`` de ``codigos``, agrandando ``total`` si hace falta."""
+    parcial = np.bincount(codigos, weights=pesos, minlength=max(largo, len(total)))
+    if len(parcial) > len(total):
+        total = np.concatenate([total, np.zeros(len(parcial) - len(total))])
+    total += parcial
+    return total
+
+
+class _Codificador:
+    """Códigos enteros estables de estudiantes e ítems entre bloques y pasadas."""
+
+    def __init__(self, preguntas):
+        self.preguntas = preguntas
+        self.estudiantes = {}
+        self.items = {}
+        self.ids = []
+        self.correctas = []
+        self.n_opciones = []
+        self.desconocidos = set()
+
+    def _item(self, id_item):
+        codigo = self.items.get(id_item)
+        if codigo is None:
+            if id_item not in self.preguntas:
+                self.desconocidos.add(id_item)
+                return -1
+            pregunta = self.preguntas[id_item]
+            codigo = self.items[id_item] = len(self.ids)
+            self.ids.append(id_item)
+            self.correctas.append(pregunta['correcta'])
+            self.n_opciones.append(len(pregunta['opciones']))
+        return codigo
+
+    def codificar(self, bloque):
+        """``(estudiante, item, respuesta, acierto)`` del bloque, sin las filas de ítems desconocidos."""
+        locales, unicos = pd.factorize(bloque["estudiante"].astype(str))
+        estudiante = np.array(
+            [self.estudiantes.setdefault(e, len(self.estudiantes)) for e in unicos], dtype=np.int64
+        )[locales]
+        locales, unicos = pd.factorize(bloque["item"].astype(str))
+        item = np.array([self._item(i) for i in unicos], dtype=np.int64)[locales]
+        respuesta = pd.to_numeric(bloque["respuesta"], errors="coerce").fillna(SIN_RESPUESTA).to_numpy(np.int64)
+
+        validas = item >= 0
+        estudiante, item, respuesta = estudiante[validas], item[validas], respuesta[validas]
+        respuesta[(respuesta < 0) | (respuesta >= np.array(self.n_opciones)[item])] = SIN_RESPUESTA
+        acierto = respuesta == np.array(self.correctas)[item]
+        return estudiante, item, respuesta, acierto
+
+
+def analizar(abrir_bloques, preguntas=None):
+    """Estadísticos por ítem del registro; ``abrir_bloques()`` se llama una vez por pasada.
+
+    ``preguntas`` es el índice ID -> pregunta (por defecto el del banco
+    compilado). Devuelve un ``DataFrame`` indexado por ID y la cantidad de
+    filas de ítems que no están en el banco.
+    """
+    if preguntas is None:
+        from nucleo import INDICES
+
+        preguntas = INDICES['preguntas']
+    codificador = _Codificador(preguntas)
+    vacio = np.zeros(0)
+
+    # Pasada 1: totales por estudiante y por ítem, y elecciones de cada opción
+    respuestas_estudiante, aciertos_estudiante = vacio, vacio
+    respuestas_item, aciertos_item, elecciones = vacio, vacio, vacio
+    filas_desconocidas = 0
+    for bloque in abrir_bloques():
+        estudiante, item, respuesta, acierto = codificador.codificar(bloque)
+        filas_desconocidas += len(bloque) - len(item)
+        n_estudiantes, n_items = len(codificador.estudiantes), len(codificador.ids)
+        respuestas_estudiante = _sumar(respuestas_estudiante, estudiante, largo=n_estudiantes)
+        aciertos_estudiante = _sumar(aciertos_estudiante, estudiante, acierto, n_estudiantes)
+        respuestas_item = _sumar(respuestas_item, item, largo=n_items)
+        aciertos_item = _sumar(aciertos_item, item, acierto, n_items)
+        elegidas = respuesta >= 0
+        elecciones = _sumar(
+            elecciones, item[elegidas] * MAXIMO_OPCIONES + respuesta[elegidas], largo=n_items * MAXIMO_OPCIONES
+        )
+    n_items = len(codificador.ids)
+    if not n_items:
+        raise ValueError("el registro no tiene respuestas a preguntas del banco")
+
+    # Pasada 2: sumas para la punto-biserial contra el puntaje en el resto de los ítems
+    m, suma_a, suma_x, suma_x2, suma_xa = (np.zeros(n_items) for _ in range(5))
+    for bloque in abrir_bloques():
+        estudiante, item, _, acierto = codificador.codificar(bloque)
+        otras = respuestas_estudiante[estudiante] - 1
+        usar = otras > 0
+        item, acierto = item[usar], acierto[usar].astype(np.float64)
+        resto = (aciertos_estudiante[estudiante[usar]] - acierto) / otras[usar]
+        m = _sumar(m, item, largo=n_items)
+        suma_a = _sumar(suma_a, item, acierto)
+        suma_x = _sumar(suma_x, item, resto)
+        suma_x2 = _sumar(suma_x2, item, resto * resto)
+        suma_xa = _sumar(suma_xa, item, resto * acierto)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        media_a, media_x = suma_a / m, suma_x / m
+        covarianza = suma_xa / m - media_a * media_x
+        varianza = (suma_x2 / m - media_x * media_x) * media_a * (1 - media_a)
+        punto_biserial = np.where(varianza > 0, covarianza / np.sqrt(varianza), np.nan)
+        proporcion = aciertos_item / respuestas_item
+
+    elecciones = elecciones.reshape(n_items, MAXIMO_OPCIONES)
+    tabla = pd.DataFrame({
+        "respuestas": respuestas_item.astype(np.int64),
+        "proporcion_aciertos": proporcion,
+        "punto_biserial": punto_biserial,
+    }, index=pd.Index(codificador.ids, name="id"))
+    tabla["discriminacion"], tabla["dificultad"] = _parametros_irt(proporcion, punto_biserial)
+    tabla["elecciones"] = [
+        fila[:n].astype(int).tolist() for fila, n in zip(elecciones, codificador.n_opciones)
+    ]
+    tabla["motivo"] = [
+        _motivo(fila, correcta) for fila, correcta in zip(tabla.itertuples(), codificador.correctas)
+    ]
+    tabla["revisar"] = tabla["motivo"] != ""
+    sin_datos = tabla["respuestas"] < MINIMO_RESPUESTAS
+    tabla.loc[sin_datos, ["discriminacion", "dificultad"]] = np.nan
+    tabla.loc[sin_datos, "revisar"] = False
+    tabla.loc[sin_datos, "motivo"] = f"pocas respuestas (menos de {MINIMO_RESPUESTAS}): sin juzgar"
+    return tabla, filas_desconocidas
+
+
+def _parametros_irt(proporcion, punto_biserial):
+    """Discriminación y dificultad 2PL logísticas con las aproximaciones de Lord."""
+    p = np.clip(np.nan_to_num(proporcion, nan=0.5), 0.01, 0.99)
+    z = np.array([NormalDist().inv_cdf(valor) for valor in p])
+    densidad = np.exp(-z * z / 2) / np.sqrt(2 * np.pi)
+    biserial = np.clip(np.nan_to_num(punto_biserial) * np.sqrt(p * (1 - p)) / densidad, 0.05, 0.95)
+    discriminacion = 1.7 * biserial / np.sqrt(1 - biserial * biserial)
+    dificultad = np.clip(-z / biserial, -LIMITE_DIFICULTAD, LIMITE_DIFICULTAD)
+    return discriminacion, dificultad
+
+
+def _motivo(fila, correcta):
+    motivos = []
+    if fila.proporcion_aciertos > PROPORCION_MAXIMA:
+        motivos.append("demasiado fácil")
+    elif fila.proporcion_aciertos < PROPORCION_MINIMA:
+        motivos.append("demasiado difícil")
+    if not fila.punto_biserial >= DISCRIMINACION_MINIMA:
+        motivos.append("discrimina poco" if not fila.punto_biserial < 0 else "discriminación negativa")
+    elecciones = fila.elecciones
+    if elecciones and max(elecciones) > elecciones[correcta]:
+        motivos.append(f"el distractor {chr(ord('A') + elecciones.index(max(elecciones)))} se elige más que la correcta")
+    return "; ".join(motivos)
+
+
+def escribir_metadatos(tabla, ruta):
+    """Guarda los metadatos por ítem en JSON de forma atómica (ver ``nucleo.paquete``)."""
+    items = {}
+    for id_item, fila in tabla.iterrows():
+        datos = {
+            "respuestas": int(fila["respuestas"]),
+            "proporcion_aciertos": round(float(fila["proporcion_aciertos"]), 4),
+            "punto_biserial": None if np.isnan(fila["punto_biserial"]) else round(float(fila["punto_biserial"]), 4),
+            "elecciones": fila["elecciones"],
+            "revisar": bool(fila["revisar"]),
+            "motivo": fila["motivo"],
+        }
+        if not np.isnan(fila["discriminacion"]):
+            datos["discriminacion"] = round(float(fila["discriminacion"]), 4)
+            datos["dificultad"] = round(float(fila["dificultad"]), 4)
+        items[id_item] = datos
+
+    os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    with open(temporal, "w", encoding="utf-8") as archivo:
+        json.dump({"items": items}, archivo, ensure_ascii=False, indent=1)
+    os.replace(temporal, ruta)
+
+
+def main():
+    from nucleo.paquete import RUTA_METADATOS
+
+    parser = argparse.ArgumentParser(description="Calcula dificultad, discriminación y distractores por ítem.")
+    parser.add_argument("registro", help="CSV o Parquet con las columnas " + ", ".join(COLUMNAS))
+    parser.add_argument("--salida", default=RUTA_METADATOS, help=f"metadatos JSON (por defecto {RUTA_METADATOS})")
+    parser.add_argument("--informe", help="CSV opcional con una fila por ítem")
+    parser.add_argument("--bloque", type=int, default=TAMANO_BLOQUE, help="filas leídas por bloque")
+    args = parser.parse_args()
+
+    try:
+        tabla, filas_desconocidas = analizar(abrir_registro(args.registro, args.bloque))
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        sys.exit(1)
+    escribir_metadatos(tabla, args.salida)
+    if args.informe:
+        tabla.to_csv(args.informe)
+
+    if filas_desconocidas:
+        print(f"aviso: {filas_desconocidas:,} filas de ítems que no están en el banco", file=sys.stderr)
+    print(
+        f"{len(tabla):,} ítems analizados ({int(tabla['respuestas'].sum()):,} respuestas); "
+        f"{int(tabla['revisar'].sum())} para revisar. Metadatos en {args.salida}; "
+        "recompila con python -m nucleo.paquete para usarlos."
+    )
+
+
+if __name__ == "__main__":
+    main()
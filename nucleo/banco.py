@@ -0,0 +1,271 @@
+"""Banco de preguntas en un archivo mapeado en memoria y compartido entre procesos.
+
+``escribir`` guarda el banco en ``datos/banco.bin`` como arreglos planos de
+enteros más una tabla de cadenas UTF-8 deduplicada:
+
+- encabezado: firma, formato, hash de la fuente y el tamaño de cada sección;
+- desplazamientos y blob: la tabla de cadenas;
+- niveles y temas: ``(cadena, inicio, fin)`` por entrada;
+- registros: ``CAMPOS`` enteros por pregunta (cadenas del ID, el enunciado, la
+  explicación y el tema; primera opción, número de opciones, respuesta
+  correcta y nivel);
+- opciones: índice de cadena de cada opción, contiguas por pregunta;
+- por_tema: posiciones de las preguntas agrupadas por tema;
+- claves y orden: CRC32 de cada ID ordenado y la posición correspondiente,
+  para buscar por ID con bisección;
+- discriminación y dificultad: parámetros TRI de cada pregunta en ``float32``,
+  listos para operar sobre ellos sin copiarlos (ver ``nucleo.irt``).
+
+``BancoMapeado`` abre el archivo con ``mmap`` de solo lectura y no decodifica
+nada al abrirlo salvo los nombres de niveles y temas: cada pregunta se arma
+cuando se accede a ella. Las páginas del archivo viven en la caché del sistema
+operativo, así que todos los procesos del servidor comparten una sola copia y
+su memoria residente no crece con el tamaño del banco.
+
+Los arreglos usan el orden de bytes de la máquina que compila el paquete.
+"""
+
+import mmap
+import os
+import struct
+import zlib
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+
+FIRMA = b"MKTBANC"
+FORMATO = 2
+# firma, formato, hash de la fuente, niveles, temas, preguntas, opciones, cadenas, bytes del blob
+ENCABEZADO = struct.Struct("<7sB32sIIIIIQ4x")
+CAMPOS = 8
+ID, PREGUNTA, EXPLICACION, TEMA, PRIMERA_OPCION, N_OPCIONES, CORRECTA, NIVEL = range(CAMPOS)
+
+
+def _clave(id_pregunta):
+    return zlib.crc32(id_pregunta.encode())
+
+
+def escribir(ruta, banco, hash_fuente):
+    """Escribe ``banco`` (nivel -> lista de preguntas con ``id``) de forma atómica."""
+    cadenas = {}
+
+    def cadena(texto):
+        return cadenas.setdefault(texto, len(cadenas))
+
+    niveles = array("I")
+    registros = array("I")
+    opciones = array("I")
+    discriminacion = array("f")
+    dificultad = array("f")
+    posiciones_tema = {}
+    posicion = 0
+    for indice_nivel, (nivel, preguntas) in enumerate(banco.items()):
+        inicio = posicion
+        for pregunta in preguntas:
+            registros.extend((
+                cadena(pregunta["id"]), cadena(pregunta["pregunta"]),
+                cadena(pregunta["explicacion"]), cadena(pregunta["tema"]),
+                len(opciones), len(pregunta["opciones"]), pregunta["correcta"], indice_nivel,
+            ))
+            opciones.extend(cadena(opcion) for opcion in pregunta["opciones"])
+            discriminacion.append(pregunta["discriminacion"])
+            dificultad.append(pregunta["dificultad"])
+            posiciones_tema.setdefault(pregunta["tema"], []).append(posicion)
+            posicion += 1
+        niveles.extend((cadena(nivel), inicio, posicion))
+
+    temas = array("I")
+    por_tema = array("I")
+    for tema, posiciones in posiciones_tema.items():
+        temas.extend((cadena(tema), len(por_tema), len(por_tema) + len(posiciones)))
+        por_tema.extend(posiciones)
+
+    ordenadas = sorted(
+        (_clave(pregunta["id"]), posicion)
+        for posicion, pregunta in enumerate(pregunta for preguntas in banco.values() for pregunta in preguntas)
+    )
+    claves = array("I", (clave for clave, _ in ordenadas))
+    orden = array("I", (posicion for _, posicion in ordenadas))
+
+    codificadas = [texto.encode() for texto in cadenas]
+    desplazamientos = array("Q", [0])
+    for codificada in codificadas:
+        desplazamientos.append(desplazamientos[-1] + len(codificada))
+    blob = b"".join(codificadas)
+
+    encabezado = ENCABEZADO.pack(
+        FIRMA, FORMATO, hash_fuente, len(niveles) // 3, len(temas) // 3,
+        posicion, len(opciones), len(codificadas), len(blob),
+    )
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(encabezado)
+        secciones = (
+            desplazamientos, niveles, temas, registros, opciones, por_tema, claves, orden, discriminacion, dificultad
+        )
+        for seccion in secciones:
+            archivo.write(seccion.tobytes())
+        archivo.write(blob)
+    os.replace(temporal, ruta)
+
+
+class _Preguntas(Sequence):
+    """Secuencia perezosa de preguntas del banco: decodifica solo las que se leen."""
+
+    def __init__(self, banco, posiciones):
+        self._banco = banco
+        self._posiciones = posiciones
+
+    def __len__(self):
+        return len(self._posiciones)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return _Preguntas(self._banco, self._posiciones[indice])
+        return self._banco.pregunta(self._posiciones[indice])
+
+
+class _PorId(Mapping):
+    def __init__(self, banco):
+        self._banco = banco
+
+    def __getitem__(self, id_pregunta):
+        posicion = self._banco.posicion(id_pregunta)
+        if posicion is None:
+            raise KeyError(id_pregunta)
+        return self._banco.pregunta(posicion)
+
+    def __iter__(self):
+        return (pregunta["id"] for pregunta in self._banco.todas)
+
+    def __len__(self):
+        return len(self._banco.todas)
+
+
+class _PorTema(Mapping):
+    def __init__(self, banco):
+        self._banco = banco
+
+    def __getitem__(self, tema):
+        inicio, fin = self._banco._temas[tema]
+        return _Preguntas(self._banco, self._banco._por_tema[inicio:fin])
+
+    def __iter__(self):
+        return iter(self._banco._temas)
+
+    def __len__(self):
+        return len(self._banco._temas)
+
+
+class BancoMapeado(Mapping):
+    """Nivel -> secuencia de preguntas, leída de un archivo escrito por ``escribir``.
+
+    Cada pregunta se devuelve como un diccionario nuevo con las mismas claves
+    que en ``nucleo.contenido`` más ``id``, ``nivel`` y ``numero`` (su
+    posición), ``discriminacion`` y ``dificultad``. ``por_id`` y ``por_tema``
+    son vistas de solo lectura sobre los índices del archivo;
+    ``discriminacion`` y ``dificultad`` son los parámetros TRI de todo el
+    banco como ``memoryview`` de ``float32``.
+    """
+
+    def __init__(self, mapa):
+        self._mapa = mapa
+        (_, _, self.hash_fuente, n_niveles, n_temas, n_preguntas,
+         n_opciones, n_cadenas, tamano_blob) = ENCABEZADO.unpack_from(mapa)
+
+        vista = memoryview(mapa)
+        inicio = ENCABEZADO.size
+
+        def seccion(formato, cantidad):
+            nonlocal inicio
+            fin = inicio + cantidad * struct.calcsize(formato)
+            datos = vista[inicio:fin].cast(formato)
+            inicio = fin
+            return datos
+
+        self._desplazamientos = seccion("Q", n_cadenas + 1)
+        niveles = seccion("I", 3 * n_niveles)
+        temas = seccion("I", 3 * n_temas)
+        self._registros = seccion("I", CAMPOS * n_preguntas)
+        self._opciones = seccion("I", n_opciones)
+        self._por_tema = seccion("I", n_preguntas)
+        self._claves = seccion("I", n_preguntas)
+        self._orden = seccion("I", n_preguntas)
+        self.discriminacion = seccion("f", n_preguntas)
+        self.dificultad = seccion("f", n_preguntas)
+        self._blob = vista[inicio:inicio + tamano_blob]
+        if len(self._blob) != tamano_blob:
+            raise ValueError("archivo del banco truncado")
+
+        self._nombres_niveles = [self._cadena(niveles[i]) for i in range(0, len(niveles), 3)]
+        self._niveles = {
+            self._cadena(niveles[i]): (niveles[i + 1], niveles[i + 2]) for i in range(0, len(niveles), 3)
+        }
+        self._temas = {self._cadena(temas[i]): (temas[i + 1], temas[i + 2]) for i in range(0, len(temas), 3)}
+        self.todas = _Preguntas(self, range(n_preguntas))
+        self.por_id = _PorId(self)
+        self.por_tema = _PorTema(self)
+
+    def _cadena(self, indice):
+        return str(self._blob[self._desplazamientos[indice]:self._desplazamientos[indice + 1]], "utf-8")
+
+    def pregunta(self, posicion):
+        inicio = posicion * CAMPOS
+        registro = self._registros[inicio:inicio + CAMPOS]
+        primera = registro[PRIMERA_OPCION]
+        return {
+            "id": self._cadena(registro[ID]),
+            "nivel": self._nombres_niveles[registro[NIVEL]],
+            "numero": posicion,
+            "pregunta": self._cadena(registro[PREGUNTA]),
+            "opciones": [
+                self._cadena(opcion) for opcion in self._opciones[primera:primera + registro[N_OPCIONES]]
+            ],
+            "correcta": registro[CORRECTA],
+            "explicacion": self._cadena(registro[EXPLICACION]),
+            "tema": self._cadena(registro[TEMA]),
+            "discriminacion": self.discriminacion[posicion],
+            "dificultad": self.dificultad[posicion],
+        }
+
+    def posicion(self, id_pregunta):
+        """Posición de la pregunta con ese ID, o ``None`` si no está en el banco."""
+        clave = _clave(id_pregunta)
+        i = bisect_left(self._claves, clave)
+        while i < len(self._claves) and self._claves[i] == clave:
+            posicion = self._orden[i]
+            if self._cadena(self._registros[posicion * CAMPOS + ID]) == id_pregunta:
+                return posicion
+            i += 1
+        return None
+
+    def __getitem__(self, nivel):
+        inicio, fin = self._niveles[nivel]
+        return _Preguntas(self, range(inicio, fin))
+
+    def __iter__(self):
+        return iter(self._niveles)
+
+    def __len__(self):
+        return len(self._niveles)
+
+
+def abrir(ruta, hash_fuente=None):
+    """Banco mapeado en memoria, o ``None`` si falta, está dañado o es de otra fuente."""
+    try:
+        with open(ruta, "rb") as archivo:
+            mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):  # ValueError: archivo vacío
+        return None
+    if len(mapa) < ENCABEZADO.size:
+        return None
+    firma, formato, fuente_compilada = ENCABEZADO.unpack_from(mapa)[:3]
+    if firma != FIRMA or formato != FORMATO:
+        return None
+    if hash_fuente is not None and fuente_compilada != hash_fuente:
+        return None
+    try:
+        return BancoMapeado(mapa)
+    except (ValueError, TypeError):
+        return None
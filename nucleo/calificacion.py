@@ -0,0 +1,155 @@
+"""Calificación por lotes de hojas de respuestas (papel o LMS).
+
+Las hojas llegan como una matriz entera estudiantes × ítems con el índice de
+la opción marcada (``SIN_RESPUESTA`` si quedó en blanco o anulada), en el
+orden de opciones del banco: el mismo que muestran el quiz adaptativo y el
+generador de práctica. Una marca fuera de las opciones del ítem (una "E" en
+un ítem de cuatro opciones) cuenta como sin responder y se informa aparte.
+
+``ClaveRespuestas`` compila una vez, para una lista de ítems, la opción
+correcta y los puntos de cada uno y una matriz ítems × temas con un 1 en el
+tema de cada ítem. Calificar un lote es una comparación contra la clave y dos
+productos de matrices (puntos y subpuntajes por tema), sin bucles por
+estudiante; el nivel sale de ``calcular_nivel_estudiante`` aplicado una vez a
+cada puntaje distinto.
+
+``python -m nucleo.calificacion hojas.csv resultados.csv`` lee un CSV con una
+columna ``estudiante`` y una columna por ID de pregunta (letra marcada, vacía
+si no respondió) por bloques de ``TAMANO_BLOQUE`` filas y escribe los
+resultados de cada bloque a medida que avanza.
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+from nucleo.puntuacion import calcular_nivel_estudiante, puntos_quiz
+
+SIN_RESPUESTA = -1
+TAMANO_BLOQUE = 50_000
+
+
+class ClaveRespuestas:
+    """Clave compilada de una lista de ítems del banco, en el orden de las columnas de las hojas."""
+
+    def __init__(self, preguntas):
+        if not preguntas:
+            raise ValueError("la clave necesita al menos una pregunta")
+        self.ids = [pregunta['id'] for pregunta in preguntas]
+        self.correctas = np.array([pregunta['correcta'] for pregunta in preguntas], dtype=np.int16)
+        self.opciones = np.array([len(pregunta['opciones']) for pregunta in preguntas], dtype=np.int16)
+        self.puntos = np.array([puntos_quiz(pregunta['nivel']) for pregunta in preguntas], dtype=np.int32)
+        self.temas, codigos = np.unique([pregunta['tema'] for pregunta in preguntas], return_inverse=True)
+        self.por_tema = np.zeros((len(preguntas), len(self.temas)), dtype=np.int32)
+        self.por_tema[np.arange(len(preguntas)), codigos] = 1
+        self.items_por_tema = self.por_tema.sum(axis=0)
+
+    def calificar(self, respuestas):
+        """Califica la matriz ``respuestas`` ``(estudiantes, ítems)`` de una vez.
+
+        Devuelve un diccionario de arreglos con una entrada por estudiante:
+        ``aciertos`` ``(E, I)``, ``correctas``, ``porcentaje`` (0-100),
+        ``puntos``, ``por_tema`` ``(E, T)`` con los aciertos en cada tema de
+        ``temas``, ``nivel`` (etiqueta de ``calcular_nivel_estudiante``) e
+        ``invalidas``, las marcas fuera de las opciones de su ítem, que se
+        califican como ``SIN_RESPUESTA``.
+        """
+        respuestas = np.asarray(respuestas)
+        if respuestas.ndim != 2 or respuestas.shape[1] != len(self.ids):
+            raise ValueError(f"se esperaba una matriz con {len(self.ids)} columnas y llegó {respuestas.shape}")
+
+        fuera_de_rango = (respuestas != SIN_RESPUESTA) & ((respuestas < 0) | (respuestas >= self.opciones))
+        aciertos = (respuestas == self.correctas) & ~fuera_de_rango
+        correctas = aciertos.sum(axis=1)
+        puntos = aciertos.astype(np.int32) @ self.puntos
+        unicos, inversos = np.unique(puntos, return_inverse=True)
+        etiquetas = np.array([calcular_nivel_estudiante({'puntos_totales': int(p)})[0] for p in unicos], dtype=object)
+        return {
+            'aciertos': aciertos,
+            'correctas': correctas,
+            'porcentaje': correctas / len(self.ids) * 100,
+            'puntos': puntos,
+            'por_tema': aciertos.astype(np.int32) @ self.por_tema,
+            'temas': self.temas,
+            'nivel': etiquetas[inversos],
+            'invalidas': fuera_de_rango.sum(axis=1),
+        }
+
+
+def letras_a_indices(valores):
+    """Matriz de letras marcadas (``"A"``, ``"b"``, ``""``...) -> índices de opción.
+
+    Las celdas vacías, con más de una letra o con otro carácter quedan en
+    ``SIN_RESPUESTA``.
+    """
+    valores = np.asarray(valores, dtype="U2")
+    codigos = valores.astype("U1").view(np.uint32).reshape(valores.shape).astype(np.int64)
+    indices = np.where(codigos >= ord("a"), codigos - ord("a"), codigos - ord("A"))
+    invalidas = (np.char.str_len(valores) != 1) | (indices < 0) | (indices >= 26)
+    indices[invalidas] = SIN_RESPUESTA
+    return indices
+
+
+def calificar_csv(entrada, salida, tamano_bloque=TAMANO_BLOQUE):
+    """Califica las hojas de ``entrada`` y escribe ``salida``; devuelve cuántas hojas calificó.
+
+    Lanza ``ValueError`` si falta la columna ``estudiante`` o alguna columna
+    no es un ID de pregunta del banco.
+    """
+    import pandas as pd
+
+    from nucleo import INDICES
+
+    bloques = pd.read_csv(entrada, dtype=str, keep_default_na=False, chunksize=tamano_bloque)
+    temporal = f"{salida}.{os.getpid()}.tmp"
+    total = 0
+    try:
+        with open(temporal, "w", encoding="utf-8", newline="") as archivo:
+            for numero, bloque in enumerate(bloques):
+                if numero == 0:
+                    if "estudiante" not in bloque.columns:
+                        raise ValueError("falta la columna 'estudiante'")
+                    ids = [columna for columna in bloque.columns if columna != "estudiante"]
+                    desconocidos = [id_pregunta for id_pregunta in ids if id_pregunta not in INDICES['preguntas']]
+                    if desconocidos:
+                        raise ValueError(f"columnas que no son preguntas del banco: {', '.join(desconocidos)}")
+                    clave = ClaveRespuestas([INDICES['preguntas'][id_pregunta] for id_pregunta in ids])
+
+                resultado = clave.calificar(letras_a_indices(bloque[ids].to_numpy()))
+                tabla = pd.DataFrame({
+                    "estudiante": bloque["estudiante"].to_numpy(),
+                    "correctas": resultado['correctas'],
+                    "porcentaje": resultado['porcentaje'].round(1),
+                    "puntos": resultado['puntos'],
+                    "nivel": resultado['nivel'],
+                    "marcas_invalidas": resultado['invalidas'],
+                })
+                tabla[[f"tema: {tema}" for tema in clave.temas]] = resultado['por_tema']
+                tabla.to_csv(archivo, index=False, header=numero == 0)
+                total += len(tabla)
+        os.replace(temporal, salida)
+    finally:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Califica hojas de respuestas contra la clave del banco.")
+    parser.add_argument("hojas", help="CSV con la columna 'estudiante' y una columna por ID de pregunta")
+    parser.add_argument("salida", help="CSV de resultados: puntaje, nivel y aciertos por tema de cada estudiante")
+    parser.add_argument("--bloque", type=int, default=TAMANO_BLOQUE, help="filas leídas por bloque")
+    args = parser.parse_args()
+
+    try:
+        total = calificar_csv(args.hojas, args.salida, args.bloque)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        sys.exit(1)
+    print(f"{total:,} hojas calificadas en {args.salida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Catálogo indexado de productos reales para el simulador del CVP.
+
+El catálogo vive en ``datos/productos.jsonl`` (un producto por línea). Al
+cargarlo solo se conservan en memoria los campos de índice y el
+desplazamiento en bytes de cada línea; la descripción, las características,
+las estrategias y las métricas se leen del disco cuando se selecciona el
+producto.
+"""
+
+import json
+import os
+import unicodedata
+from collections import defaultdict
+from functools import lru_cache
+
+from nucleo.cvp import ETAPAS
+
+RUTA_CATALOGO = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "datos", "productos.jsonl"
+)
+
+CAMPOS_INDICE = ("id", "nombre", "industria", "etapa_actual", "region")
+
+# Contenido por defecto para productos que no declaran el suyo
+CARACTERISTICAS_ETAPA = {
+    "Introducción": [
+        "📊 Ventas bajas, crecimiento inicial lento",
+        "💸 Altos costos de desarrollo, producción y promoción",
+        "🏭 Pocos o ningún competidor",
+        "👥 Compradores innovadores que prueban la novedad"
+    ],
+    "Crecimiento": [
+        "📈 Ventas en rápido crecimiento",
+        "💰 Utilidades crecientes",
+        "🏭 Nuevos competidores entrando al mercado",
+        "👥 Adoptadores tempranos y primeros segmentos masivos"
+    ],
+    "Madurez": [
+        "📊 Ventas altas pero crecimiento desacelerado",
+        "💰 Utilidades en su nivel máximo",
+        "⚔️ Competencia intensa",
+        "👥 La mayoría del mercado ya adoptó el producto"
+    ],
+    "Declive": [
+        "📉 Ventas en descenso sostenido",
+        "💰 Utilidades bajas o decrecientes",
+        "🏭 Competidores saliendo del mercado",
+        "👥 Solo quedan rezagados y nichos"
+    ]
+}
+
+ESTRATEGIAS_ETAPA = {
+    "Introducción": [
+        "📢 Comunicación informativa para crear conocimiento",
+        "🎯 Enfocarse en innovadores y early adopters",
+        "💵 Precio de descremado o de penetración",
+        "🤝 Construir distribución selectiva"
+    ],
+    "Crecimiento": [
+        "🏆 Ganar participación de mercado",
+        "🔧 Mejorar el producto y ampliar la línea",
+        "🏪 Ampliar los canales de distribución",
+        "📣 Comunicación persuasiva y de preferencia de marca"
+    ],
+    "Madurez": [
+        "🛡️ Defender la posición frente a la competencia",
+        "🔄 Modificar el producto y buscar nuevos usos",
+        "🌍 Buscar nuevos segmentos o mercados",
+        "💎 Programas de fidelización y recordación de marca"
+    ],
+    "Declive": [
+        "💸 Reducir costos y gastos de promoción",
+        "🎯 Concentrarse en los nichos rentables",
+        "🌾 Cosechar la marca o retirarla gradualmente",
+        "🔄 Evaluar relanzar o reemplazar el producto"
+    ]
+}
+
+
+def _normalizar(texto):
+    """Minúsculas y sin tildes, para búsquedas que ignoran acentos."""
+    return unicodedata.normalize("NFKD", texto.lower()).encode("ascii", "ignore").decode()
+
+
+@lru_cache(maxsize=128)
+def _leer_producto(ruta, desplazamiento):
+    with open(ruta, "rb") as archivo:
+        archivo.seek(desplazamiento)
+        return json.loads(archivo.readline())
+
+
+class Catalogo:
+    """Índice en memoria del catálogo de productos.
+
+    ``productos`` conserva solo los ``CAMPOS_INDICE`` en el orden del archivo;
+    los métodos de filtrado devuelven posiciones sobre esa lista.
+    """
+
+    def __init__(self, ruta=RUTA_CATALOGO):
+        self.ruta = ruta
+        self.productos = []
+        self._desplazamientos = []
+        self._texto = []
+        self._por_campo = {campo: defaultdict(list) for campo in ("etapa_actual", "industria", "region")}
+
+        with open(ruta, "rb") as archivo:
+            desplazamiento = 0
+            for linea in archivo:
+                if linea.strip():
+                    datos = json.loads(linea)
+                    if datos["etapa_actual"] not in ETAPAS:
+                        raise ValueError(f"Etapa desconocida en {datos['id']}: {datos['etapa_actual']}")
+                    posicion = len(self.productos)
+                    self.productos.append({campo: datos[campo] for campo in CAMPOS_INDICE})
+                    self._desplazamientos.append(desplazamiento)
+                    self._texto.append(_normalizar(" ".join(
+                        datos[campo] for campo in ("nombre", "industria", "region")
+                    )))
+                    for campo, indice in self._por_campo.items():
+                        indice[datos[campo]].append(posicion)
+                desplazamiento += len(linea)
+
+    def __len__(self):
+        return len(self.productos)
+
+    def valores(self, campo):
+        """Valores distintos de ``etapa_actual``, ``industria`` o ``region``."""
+        if campo == "etapa_actual":
+            return [etapa for etapa in ETAPAS if etapa in self._por_campo[campo]]
+        return sorted(self._por_campo[campo])
+
+    def filtrar(self, etapa=None, industria=None, region=None, texto=""):
+        """Posiciones de los productos que cumplen todos los filtros, ordenadas por nombre."""
+        filtros = [
+            self._por_campo[campo].get(valor, [])
+            for campo, valor in (("etapa_actual", etapa), ("industria", industria), ("region", region))
+            if valor
+        ]
+        candidatos = set.intersection(*map(set, filtros)) if filtros else range(len(self.productos))
+
+        consulta = _normalizar(texto.strip())
+        if consulta:
+            candidatos = [i for i in candidatos if consulta in self._texto[i]]
+
+        return sorted(candidatos, key=lambda i: self.productos[i]["nombre"])
+
+    def detalle(self, posicion):
+        """Ficha completa de un producto, completada con el contenido de su etapa."""
+        datos = _leer_producto(self.ruta, self._desplazamientos[posicion])
+        etapa = datos["etapa_actual"]
+        return {
+            "caracteristicas_etapa": CARACTERISTICAS_ETAPA[etapa],
+            "estrategias": ESTRATEGIAS_ETAPA[etapa],
+            "metricas": {},
+            **datos
+        }
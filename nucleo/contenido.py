@@ -0,0 +1,750 @@
+"""Fuente del contenido del curso: conceptos, preguntas, casos y material de repaso.
+
+La app no importa este módulo directamente: lee el paquete compilado por
+``nucleo.paquete``, que se regenera cuando este archivo cambia.
+"""
+
+# --- DATOS DE CONCEPTOS POR CAPÍTULO ---
+CONCEPTOS_CLAVE = {
+    "Cap 1: Marketing Estratégico": {
+        "Marketing 6.0": {
+            "definicion": "Evolución del marketing que integra tecnología avanzada (IA, big data) con humanismo, enfocándose en la creación de valor humano, bienestar social y sostenibilidad.",
+            "ejemplo": "Una marca que usa IA para personalizar experiencias, pero siempre priorizando el propósito social y la transparencia.",
+            "pregunta": "¿Cuál es el elemento diferenciador clave del Marketing 6.0?",
+            "opciones": [
+                "Solo el uso de tecnología avanzada",
+                "La convergencia de tecnología y humanismo",
+                "El enfoque exclusivo en ventas",
+                "La eliminación de la ética empresarial"
+            ],
+            "respuesta_correcta": 1
+        },
+        "Producto y Marca": {
+            "definicion": "El producto materializa la propuesta de valor; la marca funciona como sistema de significados que identifica, diferencia y dota de sentido dicha propuesta.",
+            "ejemplo": "iPhone como producto (tecnología) + Apple como marca (innovación, diseño, estatus).",
+            "pregunta": "¿Cuál es la relación correcta entre producto y marca?",
+            "opciones": [
+                "Son conceptos idénticos e intercambiables",
+                "El producto es tangible, la marca es el sistema de significados",
+                "Solo el producto importa para la competitividad",
+                "La marca es solo el logo de la empresa"
+            ],
+            "respuesta_correcta": 1
+        }
+    },
+    
+    "Cap 2: Creación de Valor": {
+        "Orientación al Mercado": {
+            "definicion": "Capacidad de la organización para identificar, comprender y satisfacer las necesidades del consumidor mejor que la competencia.",
+            "ejemplo": "Netflix estudiando hábitos de consumo para crear contenido original personalizado.",
+            "pregunta": "La orientación al mercado implica principalmente:",
+            "opciones": [
+                "Producir lo que la empresa sabe hacer",
+                "Identificar y satisfacer necesidades del consumidor",
+                "Reducir costos de producción",
+                "Copiar a la competencia"
+            ],
+            "respuesta_correcta": 1
+        },
+        "Propuesta de Valor": {
+            "definicion": "Conjunto de beneficios que una empresa promete entregar al consumidor para satisfacer sus necesidades de manera diferenciada.",
+            "ejemplo": "Volvo: seguridad como propuesta central de valor.",
+            "pregunta": "Una propuesta de valor efectiva debe:",
+            "opciones": [
+                "Ser genérica para atraer a todos",
+                "Diferenciarse y ser relevante para el segmento objetivo",
+                "Enfocarse solo en precio bajo",
+                "Cambiar constantemente"
+            ],
+            "respuesta_correcta": 1
+        }
+    },
+    
+    "Cap 3: El Producto": {
+        "Niveles del Producto": {
+            "definicion": "Producto básico (beneficio esencial), producto real (atributos tangibles/intangibles), producto aumentado (servicios adicionales y experiencias).",
+            "ejemplo": "Hotel: básico=alojamiento, real=habitación+diseño+marca, aumentado=spa+wifi+concierge.",
+            "pregunta": "El 'producto aumentado' se refiere a:",
+            "opciones": [
+                "El beneficio esencial que busca el consumidor",
+                "Los atributos físicos del producto",
+                "Servicios adicionales y experiencias complementarias",
+                "El precio del producto"
+            ],
+            "respuesta_correcta": 2
+        },
+        "Clasificación de Productos": {
+            "definicion": "Conveniencia (compra frecuente/rápida), Comparación (evaluación previa), Especialidad (características únicas), No buscados (desconocidos).",
+            "ejemplo": "Conveniencia=chicle, Comparación=TV, Especialidad=Rolex, No buscado=seguro funerario.",
+            "pregunta": "Un producto de especialidad se caracteriza por:",
+            "opciones": [
+                "Compra rápida sin comparación",
+                "Evaluación de múltiples alternativas",
+                "Características únicas que motivan esfuerzo especial de compra",
+                "Ser desconocido para el consumidor"
+            ],
+            "respuesta_correcta": 2
+        }
+    },
+    
+    "Cap 4: Ciclo de Vida": {
+        "Etapas del CVP": {
+            "definicion": "Introducción (lanzamiento), Crecimiento (aceptación), Madurez (saturación), Declive (disminución).",
+            "ejemplo": "Introducción=auto eléctrico en 2010, Crecimiento=Tesla 2015-2020, Madurez=smartphone 2023.",
+            "pregunta": "¿En qué etapa del CVP la competencia es más intensa?",
+            "opciones": [
+                "Introducción",
+                "Crecimiento",
+                "Madurez",
+                "Declive"
+            ],
+            "respuesta_correcta": 2
+        },
+        "Estrategias por Etapa": {
+            "definicion": "Cada etapa requiere ajustes en producto, precio, distribución y comunicación según condiciones del mercado.",
+            "ejemplo": "Introducción: comunicación informativa; Madurez: comunicación persuasiva y promociones.",
+            "pregunta": "En la etapa de madurez, la estrategia típica es:",
+            "opciones": [
+                "Informar sobre la existencia del producto",
+                "Retirarse del mercado",
+                "Defender participación y buscar diferenciación",
+                "Aumentar drásticamente los precios"
+            ],
+            "respuesta_correcta": 2
+        }
+    },
+    
+    "Cap 7-8: Marca": {
+        "Identidad vs Imagen": {
+            "definicion": "Identidad: cómo la empresa define la marca (interno). Imagen: cómo el consumidor percibe la marca (externo). Reputación: percepción acumulada en el tiempo.",
+            "ejemplo": "Nike define identidad como 'inspiración atlética' → consumidores pueden percibirla como 'motivación' o 'élite deportiva'.",
+            "pregunta": "La diferencia clave entre identidad e imagen de marca es:",
+            "opciones": [
+                "No hay diferencia, son lo mismo",
+                "Identidad es interna (empresa), imagen es externa (consumidor)",
+                "Identidad es visual, imagen es conceptual",
+                "Solo la imagen importa"
+            ],
+            "respuesta_correcta": 1
+        },
+        "Equidad de Marca": {
+            "definicion": "Valor adicional que la marca aporta al producto más allá de características funcionales (brand equity).",
+            "ejemplo": "Dos bolsos idénticos: uno sin marca $50, otro con logo Louis Vuitton $1,500 (equidad de marca).",
+            "pregunta": "La equidad de marca se refiere a:",
+            "opciones": [
+                "El costo de producción de la marca",
+                "El valor adicional que la marca aporta al producto",
+                "El número de productos en el portafolio",
+                "La edad de la marca en el mercado"
+            ],
+            "respuesta_correcta": 1
+        },
+        "Estrategias de Marca": {
+            "definicion": "Individual (marca por producto), Corporativa (un nombre para todo), Extensión (marca existente a nuevo producto), Co-branding (alianza).",
+            "ejemplo": "Individual=P&G (Pampers, Ariel, Gillette), Corporativa=Samsung, Extensión=Dove jabón→shampoo.",
+            "pregunta": "La extensión de marca consiste en:",
+            "opciones": [
+                "Crear una nueva marca desde cero",
+                "Aplicar marca existente a nuevos productos/categorías",
+                "Eliminar productos del portafolio",
+                "Cambiar el nombre de la marca"
+            ],
+            "respuesta_correcta": 1
+        }
+    }
+}
+
+# --- BANCO DE PREGUNTAS PARA QUIZ ADAPTATIVO ---
+BANCO_PREGUNTAS = {
+    "basico": [
+        {
+            "pregunta": "¿Qué es el Marketing 6.0?",
+            "opciones": [
+                "Marketing tradicional en redes sociales",
+                "Convergencia de tecnología avanzada y humanismo",
+                "Marketing enfocado solo en ventas online",
+                "Eliminación del marketing físico"
+            ],
+            "correcta": 1,
+            "explicacion": "Marketing 6.0 integra IA, big data y automatización al servicio de la creación de valor humano, bienestar social y sostenibilidad.",
+            "tema": "Fundamentos"
+        },
+        {
+            "pregunta": "El producto básico representa:",
+            "opciones": [
+                "Los atributos físicos del producto",
+                "El beneficio esencial que busca el consumidor",
+                "Los servicios adicionales",
+                "El precio más bajo del mercado"
+            ],
+            "correcta": 1,
+            "explicacion": "El producto básico es el beneficio fundamental que satisface la necesidad del consumidor (ej: un hotel ofrece alojamiento como beneficio básico).",
+            "tema": "Producto"
+        },
+        {
+            "pregunta": "¿Cuál NO es una etapa del ciclo de vida del producto?",
+            "opciones": [
+                "Introducción",
+                "Expansión internacional",
+                "Madurez",
+                "Declive"
+            ],
+            "correcta": 1,
+            "explicacion": "Las 4 etapas del CVP son: Introducción, Crecimiento, Madurez y Declive. La expansión internacional es una estrategia, no una etapa.",
+            "tema": "Ciclo de Vida"
+        },
+        {
+            "pregunta": "La marca funciona como:",
+            "opciones": [
+                "Solo un logo visual",
+                "Un sistema de significados que identifica y diferencia",
+                "El precio del producto",
+                "La publicidad de la empresa"
+            ],
+            "correcta": 1,
+            "explicacion": "La marca es un sistema de significados que permite identificar, diferenciar y dotar de sentido a la propuesta de valor.",
+            "tema": "Marca"
+        },
+        {
+            "pregunta": "La orientación al mercado implica:",
+            "opciones": [
+                "Producir lo que la empresa quiere",
+                "Identificar y satisfacer necesidades del consumidor",
+                "Reducir costos sin importar la calidad",
+                "Copiar todos los productos de la competencia"
+            ],
+            "correcta": 1,
+            "explicacion": "La orientación al mercado significa comprender y satisfacer las necesidades del consumidor mejor que la competencia.",
+            "tema": "Creación de Valor"
+        }
+    ],
+    
+    "intermedio": [
+        {
+            "pregunta": "En la etapa de madurez del CVP, ¿cuál estrategia es más apropiada?",
+            "opciones": [
+                "Retirarse inmediatamente del mercado",
+                "Modificar el mercado, producto o marketing mix",
+                "Aumentar precios drásticamente",
+                "Eliminar toda la comunicación"
+            ],
+            "correcta": 1,
+            "explicacion": "En madurez se busca prolongar la vida del producto mediante modificaciones del mercado (nuevos segmentos), producto (mejoras) o marketing mix.",
+            "tema": "Ciclo de Vida"
+        },
+        {
+            "pregunta": "¿Qué diferencia a la identidad de marca de la imagen de marca?",
+            "opciones": [
+                "Son conceptos idénticos",
+                "Identidad es cómo la empresa define la marca; imagen es la percepción del consumidor",
+                "Identidad es el logo; imagen es el slogan",
+                "No hay diferencia real entre ambas"
+            ],
+            "correcta": 1,
+            "explicacion": "Identidad es la construcción interna (empresa), imagen es la percepción externa (consumidor). La identidad no está completamente bajo control de la empresa.",
+            "tema": "Marca"
+        },
+        {
+            "pregunta": "La extensión de marca implica:",
+            "opciones": [
+                "Crear una marca completamente nueva",
+                "Aplicar una marca existente a nuevos productos o categorías",
+                "Cambiar el nombre de la marca actual",
+                "Fusionarse con otra empresa"
+            ],
+            "correcta": 1,
+            "explicacion": "La extensión de marca aprovecha la equidad de marca existente para lanzar nuevos productos, reduciendo costos y facilitando aceptación.",
+            "tema": "Estrategias de Marca"
+        },
+        {
+            "pregunta": "Un producto de especialidad se caracteriza por:",
+            "opciones": [
+                "Compra frecuente sin pensar",
+                "Comparación exhaustiva de alternativas",
+                "Características únicas que justifican esfuerzo especial de compra",
+                "Ser completamente desconocido"
+            ],
+            "correcta": 2,
+            "explicacion": "Los productos de especialidad (ej: Rolex, Ferrari) tienen atributos únicos o fuerte identificación de marca que motivan al consumidor a hacer esfuerzo para adquirirlos.",
+            "tema": "Producto"
+        },
+        {
+            "pregunta": "El co-branding consiste en:",
+            "opciones": [
+                "Eliminar una marca del portafolio",
+                "La asociación de dos o más marcas para un producto/servicio",
+                "Reducir el precio de la marca",
+                "Cambiar el logo de la marca"
+            ],
+            "correcta": 1,
+            "explicacion": "Co-branding es la alianza estratégica entre marcas para combinar fortalezas y crear propuestas diferenciadas (ej: Nike + Apple).",
+            "tema": "Estrategias de Marca"
+        }
+    ],
+    
+    "avanzado": [
+        {
+            "pregunta": "¿Cuál es el principal riesgo del greenwashing en productos verdes?",
+            "opciones": [
+                "Aumentar las ventas temporalmente",
+                "Pérdida de credibilidad y daño reputacional grave",
+                "Reducir los costos de producción",
+                "Mejorar la imagen de marca"
+            ],
+            "correcta": 1,
+            "explicacion": "El greenwashing (comunicar sostenibilidad falsa) genera desconfianza, afecta la reputación y puede tener consecuencias legales en el contexto del Marketing 6.0.",
+            "tema": "Sostenibilidad"
+        },
+        {
+            "pregunta": "Según el caso Frisby, ¿cuál es la lección estratégica clave sobre marcas?",
+            "opciones": [
+                "No es necesario registrar marcas internacionalmente",
+                "El registro marcario debe acompañarse de uso real y vigilancia",
+                "Las marcas no tienen valor legal",
+                "Solo importa el registro en el país de origen"
+            ],
+            "correcta": 1,
+            "explicacion": "El caso Frisby enseña que la protección marcaria requiere planificación internacional, uso real y vigilancia constante, incluso en territorios donde aún no se opera.",
+            "tema": "Aspectos Legales"
+        },
+        {
+            "pregunta": "En el contexto del Marketing 6.0, ¿qué implica la 'economía de la experiencia'?",
+            "opciones": [
+                "Reducir precios al mínimo",
+                "Competir por experiencias memorables, no solo atributos funcionales",
+                "Eliminar el servicio al cliente",
+                "Enfocarse solo en productos tangibles"
+            ],
+            "correcta": 1,
+            "explicacion": "Pine y Gilmore introducen la economía de la experiencia: las empresas compiten creando experiencias inmersivas que integran beneficios funcionales, emocionales y simbólicos.",
+            "tema": "Fundamentos Avanzados"
+        },
+        {
+            "pregunta": "¿Qué representa la equidad de marca según Aaker?",
+            "opciones": [
+                "Solo el reconocimiento visual del logo",
+                "Conjunto de activos y pasivos vinculados a la marca que agregan o restan valor",
+                "El precio de venta de los productos",
+                "El número de empleados de la empresa"
+            ],
+            "correcta": 1,
+            "explicacion": "Aaker define brand equity como activos/pasivos vinculados al nombre y símbolo de la marca que impactan el valor percibido por consumidores y empresa.",
+            "tema": "Marca Avanzado"
+        },
+        {
+            "pregunta": "En una declaración de posicionamiento, ¿qué elementos son esenciales?",
+            "opciones": [
+                "Solo el nombre de la marca",
+                "Público objetivo, categoría, diferenciación y beneficio",
+                "Únicamente el precio del producto",
+                "Solo la descripción física del producto"
+            ],
+            "correcta": 1,
+            "explicacion": "Una declaración de posicionamiento efectiva debe incluir: para quién (público), qué es (categoría), por qué es diferente (diferenciación) y qué entrega (beneficio).",
+            "tema": "Posicionamiento"
+        }
+    ]
+}
+
+# --- CASOS DE DECISIÓN ESTRATÉGICA ---
+CASOS_ESTRATEGICOS = {
+    "caso_frisby": {
+        "titulo": "Caso Frisby: El Conflicto Marcario",
+        "contexto": """
+        Frisby, cadena colombiana de pollo, expandió su operación sin registrar su marca en todos 
+        los países de interés. Años después, al intentar ingresar a Panamá, descubrió que un tercero 
+        había registrado "Frisby" y operaba un negocio similar.
+        
+        **Situación:** Como gerente de marca de Frisby, ¿qué estrategia recomendarías?
+        """,
+        "opciones": [
+            {
+                "texto": "Cambiar el nombre de la marca en Panamá",
+                "consecuencia": "Se pierde la equidad de marca construida. Los consumidores no reconocen la nueva marca. Inversión en rebranding.",
+                "correcta": False,
+                "aprendizaje": "Cambiar el nombre diluye la equidad de marca y genera confusión. No es la solución estratégica óptima."
+            },
+            {
+                "texto": "Negociar la compra de los derechos marcarios",
+                "consecuencia": "Costo elevado pero se recupera la marca. Permite continuidad de identidad y equidad. Estrategia viable a largo plazo.",
+                "correcta": True,
+                "aprendizaje": "La negociación permite recuperar el activo marcario y mantener la coherencia de la estrategia de marca internacional."
+            },
+            {
+                "texto": "Iniciar disputa legal sin analizar el contexto",
+                "consecuencia": "Proceso largo, costoso y sin garantía de éxito si el registro del tercero es legítimo. Desgaste de recursos.",
+                "correcta": False,
+                "aprendizaje": "La vía legal sin análisis previo es riesgosa. Debe evaluarse la legitimidad del registro y viabilidad jurídica."
+            },
+            {
+                "texto": "Ignorar el problema y operar con otra identidad",
+                "consecuencia": "Se pierden años de construcción de marca. Fragmentación de la identidad corporativa. Confusión en mercados regionales.",
+                "correcta": False,
+                "aprendizaje": "Ignorar la protección marcaria genera problemas estratégicos graves a futuro. La prevención es clave."
+            }
+        ],
+        "leccion_final": """
+        **Lecciones clave del caso Frisby:**
+        1. El registro marcario debe planificarse internacionalmente desde el inicio
+        2. La protección debe acompañarse de uso real en los mercados
+        3. La vigilancia marcaria es esencial para detectar conflictos temprano
+        4. La marca es un activo vulnerable sin gestión legal-estratégica integrada
+        """
+    },
+    
+    "caso_producto_verde": {
+        "titulo": "Dilema: Producto Verde vs Greenwashing",
+        "contexto": """
+        Tu empresa de cosméticos quiere lanzar una línea "eco-friendly". El equipo de marketing 
+        propone comunicar "100% natural" aunque solo el 60% de ingredientes lo sean. 
+        Argumentan que la competencia hace lo mismo y genera más ventas.
+        
+        **Situación:** Como gerente de producto, ¿qué decides?
+        """,
+        "opciones": [
+            {
+                "texto": "Aprobar la campaña '100% natural' para competir",
+                "consecuencia": "Ventas iniciales altas. A mediano plazo: denuncia de consumidores, multas, pérdida de confianza, daño reputacional irreparable.",
+                "correcta": False,
+                "aprendizaje": "El greenwashing genera ganancias cortoplacistas pero destruye la reputación y credibilidad de marca a largo plazo."
+            },
+            {
+                "texto": "Comunicar honestamente '60% ingredientes naturales'",
+                "consecuencia": "Ventas iniciales moderadas, pero construcción de confianza. Diferenciación por transparencia. Lealtad a largo plazo.",
+                "correcta": True,
+                "aprendizaje": "La transparencia es un pilar del Marketing 6.0. Los consumidores valoran la honestidad y castigan el engaño."
+            },
+            {
+                "texto": "Lanzar sin ninguna comunicación ambiental",
+                "consecuencia": "Se pierde la oportunidad de diferenciación. El producto no aprovecha el beneficio real del 60% natural. Posicionamiento débil.",
+                "correcta": False,
+                "aprendizaje": "No comunicar los atributos reales es desperdiciar una ventaja competitiva legítima."
+            },
+            {
+                "texto": "Mejorar la fórmula al 100% natural antes de lanzar",
+                "consecuencia": "Retraso en el lanzamiento y mayores costos, pero propuesta auténtica. Comunicación coherente y sin riesgos legales.",
+                "correcta": True,
+                "aprendizaje": "Alinear el producto con la comunicación es la estrategia más sostenible. La autenticidad genera valor a largo plazo."
+            }
+        ],
+        "leccion_final": """
+        **Lecciones sobre sostenibilidad y ética:**
+        1. El Marketing 6.0 exige coherencia entre discurso y acción
+        2. Los consumidores contemporáneos valoran la transparencia
+        3. El greenwashing destruye la credibilidad de marca
+        4. La sostenibilidad es una exigencia del mercado, no una opción
+        """
+    },
+    
+    "caso_extension_marca": {
+        "titulo": "Extensión de Marca: ¿Oportunidad o Riesgo?",
+        "contexto": """
+        Tu empresa de ropa deportiva de alta gama (posicionada en calidad premium) quiere lanzar 
+        una línea de productos económicos para captar el mercado masivo. El equipo comercial 
+        asegura que duplicará las ventas.
+        
+        **Situación:** ¿Qué estrategia de marca recomiendas?
+        """,
+        "opciones": [
+            {
+                "texto": "Usar la misma marca premium para la línea económica",
+                "consecuencia": "Confusión en el posicionamiento. Dilución de la percepción de calidad. Clientes premium abandonan la marca.",
+                "correcta": False,
+                "aprendizaje": "Extender una marca premium a segmentos económicos puede diluir la equidad de marca y generar confusión."
+            },
+            {
+                "texto": "Crear una marca individual diferente para la línea económica",
+                "consecuencia": "Protección de la marca premium. Segmentación clara. Mayores costos de marketing, pero sin riesgo de dilución.",
+                "correcta": True,
+                "aprendizaje": "Las marcas individuales permiten posicionamientos diferenciados y reducen el riesgo para la marca principal."
+            },
+            {
+                "texto": "Usar una sub-marca (ej: 'Marca Sport Lite')",
+                "consecuencia": "Aprovecha reconocimiento de marca matriz pero diferencia. Estrategia intermedia con menor riesgo de dilución.",
+                "correcta": True,
+                "aprendizaje": "Las sub-marcas permiten extensiones manteniendo conexión con la marca principal pero con diferenciación."
+            },
+            {
+                "texto": "Cancelar el proyecto de línea económica",
+                "consecuencia": "Se mantiene la integridad de marca premium, pero se pierde oportunidad de crecimiento en otro segmento.",
+                "correcta": False,
+                "aprendizaje": "No siempre es necesario cancelar oportunidades; existen estrategias de marca que permiten diversificación sin dilución."
+            }
+        ],
+        "leccion_final": """
+        **Lecciones sobre extensión de marca:**
+        1. Las extensiones deben ser coherentes con la identidad de marca
+        2. La dilución de marca es un riesgo real en extensiones mal gestionadas
+        3. Existen alternativas estratégicas: marcas individuales, sub-marcas, etc.
+        4. La decisión debe basarse en equidad de marca y posicionamiento actual
+        """
+    }
+}
+
+# --- PREGUNTAS DEL DIAGNÓSTICO INICIAL ---
+PREGUNTAS_DIAGNOSTICO = [
+    {
+        "pregunta": "¿Qué representa el Marketing 6.0?",
+        "opciones": [
+            "Marketing en redes sociales únicamente",
+            "Convergencia de tecnología avanzada y humanismo",
+            "Marketing tradicional mejorado",
+            "Publicidad digital masiva"
+        ],
+        "correcta": 1
+    },
+    {
+        "pregunta": "Los tres niveles del producto son:",
+        "opciones": [
+            "Precio, calidad y distribución",
+            "Básico, real y aumentado",
+            "Pequeño, mediano y grande",
+            "Nacional, regional y global"
+        ],
+        "correcta": 1
+    },
+    {
+        "pregunta": "¿Cuál es la diferencia clave entre identidad e imagen de marca?",
+        "opciones": [
+            "No hay diferencia real",
+            "Identidad es interna (empresa), imagen es percepción (consumidor)",
+            "Identidad es visual, imagen es conceptual",
+            "Identidad es más importante que imagen"
+        ],
+        "correcta": 1
+    },
+    {
+        "pregunta": "En la etapa de madurez del CVP, ¿qué sucede?",
+        "opciones": [
+            "Las ventas crecen aceleradamente",
+            "Se lanza el producto por primera vez",
+            "El mercado se satura y la competencia es intensa",
+            "El producto desaparece del mercado"
+        ],
+        "correcta": 2
+    },
+    {
+        "pregunta": "La equidad de marca (brand equity) se refiere a:",
+        "opciones": [
+            "El número de productos de la marca",
+            "El valor adicional que la marca aporta al producto",
+            "El logo de la empresa",
+            "La antigüedad de la marca"
+        ],
+        "correcta": 1
+    }
+]
+
+# --- COMPARACIONES DEL LABORATORIO DE CONCEPTOS ---
+COMPARACIONES_LABORATORIO = {
+    "Identidad vs Imagen vs Reputación": {
+        "conceptos": ["Identidad de Marca", "Imagen de Marca", "Reputación de Marca"],
+        "definiciones": [
+            "Cómo la empresa define y comunica quién es la marca (construcción interna y deliberada)",
+            "Percepción que los consumidores tienen de la marca basada en experiencias e interacciones",
+            "Resultado acumulado de percepciones en el tiempo, integra confianza y comportamiento ético"
+        ],
+        "control": ["Alto (empresa)", "Medio (influenciable)", "Bajo (largo plazo)"],
+        "ejemplo": [
+            "Nike define su identidad como 'inspiración atlética e innovación'",
+            "Los consumidores perciben a Nike como 'marca deportiva premium y motivacional'",
+            "Nike tiene reputación de innovación pero controversias laborales en su historia"
+        ]
+    },
+
+    "Producto Básico vs Real vs Aumentado": {
+        "conceptos": ["Producto Básico", "Producto Real", "Producto Aumentado"],
+        "definiciones": [
+            "Beneficio esencial que el consumidor busca satisfacer",
+            "Atributos tangibles e intangibles: calidad, diseño, marca, empaque",
+            "Servicios adicionales y experiencias complementarias que agregan valor"
+        ],
+        "ejemplo": [
+            "Hotel: alojamiento",
+            "Hotel: habitación limpia, diseño moderno, marca reconocida, Wi-Fi",
+            "Hotel: spa, concierge 24/7, check-out tardío, programa de lealtad"
+        ],
+        "importancia": [
+            "Define la necesidad a satisfacer",
+            "Diferenciación competitiva principal",
+            "Fidelización y ventaja sostenible"
+        ]
+    },
+
+    "Extensión de Línea vs Extensión de Marca": {
+        "conceptos": ["Extensión de Línea", "Extensión de Marca"],
+        "definiciones": [
+            "Nuevas versiones de un producto dentro de la MISMA categoría",
+            "Aplicar marca existente a productos en NUEVA categoría"
+        ],
+        "riesgo": ["Bajo (mismo mercado)", "Alto (puede diluir marca)"],
+        "ejemplo": [
+            "Coca-Cola → Coca-Cola Zero, Coca-Cola Light (misma categoría: bebidas)",
+            "Dove jabón → Dove shampoo (nueva categoría: cuidado capilar)"
+        ],
+        "ventaja": [
+            "Satisface diferentes segmentos sin crear nueva marca",
+            "Aprovecha equidad de marca para entrar a nuevos mercados"
+        ]
+    },
+
+    "Marca Individual vs Corporativa": {
+        "conceptos": ["Marca Individual", "Marca Corporativa"],
+        "definiciones": [
+            "Cada producto tiene su propia marca independiente",
+            "Un solo nombre/marca para todos los productos"
+        ],
+        "ventaja": [
+            "Posicionamientos diferenciados; fracaso no afecta portafolio",
+            "Reconocimiento unificado; menores costos de marketing"
+        ],
+        "desventaja": [
+            "Mayores costos de desarrollo y comunicación por marca",
+            "Crisis en un producto afecta toda la organización"
+        ],
+        "ejemplo": [
+            "P&G: Pampers, Ariel, Gillette, Oral-B (marcas independientes)",
+            "Samsung: Samsung TV, Samsung Galaxy, Samsung Electrodomésticos"
+        ]
+    }
+}
+
+# --- RESÚMENES EJECUTIVOS POR CAPÍTULO ---
+RESUMENES_EJECUTIVOS = {
+    "Marketing 6.0 y Valor": """
+    - **Marketing 6.0:** Convergencia de tecnología (IA, big data) con humanismo y sostenibilidad
+    - **Creación de Valor:** Proceso de ofrecer beneficios que satisfacen necesidades del consumidor
+    - **Orientación al Mercado:** Capacidad de identificar y satisfacer necesidades mejor que competencia
+    - **Marketing Relacional:** Construcción de relaciones duraderas, no solo transacciones
+    """,
+
+    "Producto Estratégico": """
+    - **Niveles:** Básico (beneficio esencial), Real (atributos), Aumentado (servicios adicionales)
+    - **Clasificación:** Conveniencia, Comparación, Especialidad, No buscados
+    - **Producto como Experiencia:** El valor incluye dimensiones funcionales, emocionales y simbólicas
+    - **Implicación:** El producto materializa la propuesta de valor de la empresa
+    """,
+
+    "Ciclo de Vida del Producto": """
+    - **Introducción:** Ventas bajas, altos costos, comunicación informativa, generar conocimiento
+    - **Crecimiento:** Ventas aumentan, competencia entra, mejoras del producto, expansión distribución
+    - **Madurez:** Saturación, competencia intensa, defensa de participación, modificaciones
+    - **Declive:** Ventas bajan, decidir mantener/modificar/eliminar, enfoque en nichos
+    - **Clave:** Ajustar marketing mix según etapa actual
+    """,
+
+    "Marca como Activo": """
+    - **Identidad:** Cómo la empresa define la marca (interno)
+    - **Imagen:** Cómo el consumidor percibe la marca (externo)
+    - **Reputación:** Percepción acumulada en el tiempo (credibilidad y ética)
+    - **Equidad de Marca:** Valor adicional que aporta la marca más allá de atributos funcionales
+    - **Modelos:** Aaker (activos/pasivos) y Keller (resonancia de marca)
+    """,
+
+    "Estrategias de Marca": """
+    - **Individual:** Cada producto con marca propia (reduce riesgo, altos costos)
+    - **Corporativa:** Un nombre para todo (reconocimiento, crisis afecta a todos)
+    - **Extensión de Línea:** Nuevas versiones en misma categoría
+    - **Extensión de Marca:** Marca existente en nueva categoría (riesgo de dilución)
+    - **Co-branding:** Alianza entre marcas para combinar fortalezas
+    """,
+
+    "Posicionamiento": """
+    - **Concepto:** Lugar que ocupa producto/marca en mente del consumidor vs competencia
+    - **No es solo comunicación:** Es diseño integral de oferta e imagen
+    - **Declaración:** Para [público] que [necesidad], [marca] es [categoría] que [diferenciación]
+    - **Herramientas:** Mapas perceptuales para visualizar posicionamiento
+    - **Errores:** Sobre-posicionamiento, sub-posicionamiento, confusión, dudas
+    """,
+
+    "Aspectos Legales (Caso Frisby)": """
+    - **Registro Marcario:** Protección legal del nombre, símbolo y elementos de marca
+    - **Lección Frisby:** Planificar registro internacional desde inicio, vigilancia constante
+    - **Protección:** El registro debe ir acompañado de uso real en mercados
+    - **Riesgo:** Marca es activo vulnerable sin gestión legal-estratégica integrada
+    - **Colombia:** Registro ante SIC (Superintendencia de Industria y Comercio)
+    """
+}
+
+# --- GLOSARIO ---
+GLOSARIO = {
+    "Brand Equity (Equidad de Marca)": "Valor adicional que la marca aporta al producto más allá de sus características funcionales.",
+    "Co-branding": "Estrategia de asociación entre dos o más marcas para desarrollo o comercialización de producto/servicio.",
+    "Ciclo de Vida del Producto (CVP)": "Modelo que describe las etapas por las que atraviesa un producto: introducción, crecimiento, madurez y declive.",
+    "Extensión de Línea": "Introducción de nuevas versiones de un producto dentro de la misma categoría.",
+    "Extensión de Marca": "Aplicación de una marca existente a nuevos productos o categorías diferentes.",
+    "Greenwashing": "Práctica engañosa de comunicar sostenibilidad ambiental falsa o exagerada.",
+    "Identidad de Marca": "Forma en que la empresa define y comunica quién es la marca (construcción interna).",
+    "Imagen de Marca": "Percepción que los consumidores tienen de la marca basada en experiencias.",
+    "Marketing 6.0": "Evolución del marketing que integra tecnología avanzada con humanismo y sostenibilidad.",
+    "Marca Corporativa": "Estrategia donde un solo nombre/marca unifica todos los productos de la empresa.",
+    "Marca Individual": "Estrategia donde cada producto tiene su propia marca independiente.",
+    "Posicionamiento": "Lugar que ocupa un producto o marca en la mente del consumidor en relación con competidores.",
+    "Producto Aumentado": "Nivel del producto que incluye servicios adicionales y experiencias complementarias.",
+    "Producto Básico": "Beneficio esencial que el consumidor busca al adquirir un producto.",
+    "Producto Real": "Atributos tangibles e intangibles: calidad, diseño, marca, empaque.",
+    "Propuesta de Valor": "Conjunto de beneficios que una empresa promete entregar al consumidor.",
+    "Reputación de Marca": "Resultado acumulado de percepciones en el tiempo, integra confianza y comportamiento ético."
+}
+
+# --- CATEGORÍAS DEL MAPA CONCEPTUAL ---
+# Cada tema apunta al concepto de CONCEPTOS_CLAVE que lo explica, o a None si
+# todavía no tiene ficha propia.
+
+CATEGORIAS_MAPA = {
+    "🎯 Fundamentos del Marketing": {
+        "Marketing 6.0": "Marketing 6.0",
+        "Creación de Valor": "Propuesta de Valor",
+        "Orientación al Mercado": "Orientación al Mercado",
+    },
+    "📦 El Producto Estratégico": {
+        "Niveles del Producto": "Niveles del Producto",
+        "Clasificación": "Clasificación de Productos",
+        "Producto como Experiencia": None,
+    },
+    "♻️ Ciclo de Vida": {
+        "Introducción": "Etapas del CVP",
+        "Crecimiento": "Etapas del CVP",
+        "Madurez": "Etapas del CVP",
+        "Declive": "Etapas del CVP",
+    },
+    "🏷️ La Marca como Activo": {
+        "Identidad vs Imagen": "Identidad vs Imagen",
+        "Equidad de Marca": "Equidad de Marca",
+        "Reputación": "Identidad vs Imagen",
+    },
+    "🎨 Estrategias de Marca": {
+        "Marca Individual": "Estrategias de Marca",
+        "Marca Corporativa": "Estrategias de Marca",
+        "Extensión": "Estrategias de Marca",
+        "Co-branding": "Estrategias de Marca",
+    },
+    "🎯 Posicionamiento": {
+        "Concepto": None,
+        "Mapas Perceptuales": None,
+        "Declaración": None,
+    },
+    "💡 Innovación": {
+        "Tipos de Innovación": None,
+        "Desarrollo NPD": None,
+        "Sostenibilidad": None,
+    },
+    "⚖️ Aspectos Legales": {
+        "Registro Marcario": None,
+        "Protección": None,
+        "Caso Frisby": None,
+    },
+}
+
+# --- ÁREAS DE CONOCIMIENTO ---
+# Cada área agrupa capítulos de CONCEPTOS_CLAVE y categorías de CATEGORIAS_MAPA;
+# sus conceptos y temas cuentan para el área en "Mi Progreso".
+
+AREAS_CONOCIMIENTO = {
+    "Fundamentos": ["Cap 1: Marketing Estratégico", "Cap 2: Creación de Valor", "🎯 Fundamentos del Marketing"],
+    "Producto": ["Cap 3: El Producto", "📦 El Producto Estratégico", "💡 Innovación"],
+    "Ciclo de Vida": ["Cap 4: Ciclo de Vida", "♻️ Ciclo de Vida"],
+    "Marca": ["Cap 7-8: Marca", "🏷️ La Marca como Activo", "⚖️ Aspectos Legales"],
+    "Estrategia": ["🎨 Estrategias de Marca"],
+    "Posicionamiento": ["🎯 Posicionamiento"],
+}
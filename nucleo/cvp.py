@@ -0,0 +1,172 @@
+"""Motor paramétrico de curvas del ciclo de vida del producto (CVP).
+
+Las ventas siguen el modelo de difusión de Bass y las utilidades combinan ese
+volumen con una curva de experiencia en costos. Todas las funciones operan
+sobre arreglos: con ``k`` productos y ``n`` puntos devuelven matrices
+``(k, n)`` sin bucles de Python por etapa ni por producto.
+"""
+
+import numpy as np
+
+ETAPAS = ("Introducción", "Crecimiento", "Madurez", "Declive")
+
+# Orden de los parámetros del modelo
+PARAMETROS = (
+    "mercado_potencial",  # m: adoptantes totales (escala de las ventas)
+    "innovacion",         # p: coeficiente de innovación de Bass
+    "imitacion",          # q: coeficiente de imitación de Bass
+    "costo_inicial",      # costo unitario al lanzamiento (fracción del precio)
+    "costo_fijo",         # costo fijo por periodo
+    "aprendizaje",        # elasticidad de la curva de experiencia
+)
+
+# Parámetros por defecto según la etapa actual del producto
+PARAMETROS_ETAPA = {
+    "Introducción": {
+        "mercado_potencial": 350, "innovacion": 0.012, "imitacion": 0.31,
+        "costo_inicial": 1.53, "costo_fijo": 16, "aprendizaje": 0.32
+    },
+    "Crecimiento": {
+        "mercado_potencial": 670, "innovacion": 0.011, "imitacion": 0.40,
+        "costo_inicial": 1.98, "costo_fijo": 6.5, "aprendizaje": 0.85
+    },
+    "Madurez": {
+        "mercado_potencial": 830, "innovacion": 0.017, "imitacion": 0.39,
+        "costo_inicial": 0.63, "costo_fijo": 13.5, "aprendizaje": 0.94
+    },
+    "Declive": {
+        "mercado_potencial": 560, "innovacion": 0.024, "imitacion": 0.52,
+        "costo_inicial": 0.43, "costo_fijo": 13, "aprendizaje": 0.52
+    }
+}
+
+HORIZONTE = 10.0  # unidades de tiempo del eje del gráfico
+
+
+def curvas_bass(mercado_potencial, innovacion, imitacion, costo_inicial,
+                costo_fijo, aprendizaje, n_puntos=200, horizonte=HORIZONTE):
+    """Calcula curvas de ventas y utilidades para uno o varios productos.
+
+    Cada parámetro puede ser un escalar o un arreglo de longitud ``k``.
+    Devuelve ``(t, ventas, utilidades)`` con ``t`` de forma ``(n_puntos,)`` y
+    ``ventas``/``utilidades`` de forma ``(k, n_puntos)``.
+    """
+    m, p, q, c0, fijo, b = (
+        np.atleast_1d(np.asarray(valor, dtype=float))[:, np.newaxis]
+        for valor in (mercado_potencial, innovacion, imitacion,
+                      costo_inicial, costo_fijo, aprendizaje)
+    )
+    t = np.linspace(0, horizonte, n_puntos)
+
+    decaimiento = np.exp(-(p + q) * t)
+    denominador = 1 + (q / p) * decaimiento
+    acumulado = (1 - decaimiento) / denominador                       # F(t)
+    ventas = m * ((p + q) ** 2 / p) * decaimiento / denominador ** 2  # m·f(t)
+
+    # El costo unitario baja con la producción acumulada (curva de experiencia)
+    costo_unitario = c0 * (1 + 99 * acumulado) ** -b
+    utilidades = ventas * (1 - costo_unitario) - fijo
+
+    return t, ventas, utilidades
+
+
+def parametros_producto(producto_info):
+    """Parámetros del modelo para un producto: los de su etapa, con ajustes propios.
+
+    Un producto puede declarar ``parametros_cvp`` con cualquier subconjunto de
+    ``PARAMETROS`` para sobrescribir los valores por defecto de su etapa.
+    """
+    parametros = dict(PARAMETROS_ETAPA[producto_info['etapa_actual']])
+    parametros.update(producto_info.get('parametros_cvp', {}))
+    return parametros
+
+
+def matriz_parametros(productos):
+    """Apila los parámetros de varios productos en una matriz ``(k, 6)``."""
+    return np.array(
+        [[parametros_producto(info)[nombre] for nombre in PARAMETROS] for info in productos],
+        dtype=float
+    ).reshape(-1, len(PARAMETROS))
+
+
+def curvas_productos(productos, n_puntos=200, horizonte=HORIZONTE):
+    """Curvas de ventas y utilidades de varios productos en una sola operación."""
+    matriz = matriz_parametros(productos)
+    return curvas_bass(*matriz.T, n_puntos=n_puntos, horizonte=horizonte)
+
+
+def suavizar(ventas, ventana=3):
+    """Media móvil por filas de una matriz ``(k, n)``; devuelve ``(k, n - ventana + 1)``."""
+    acumulada = np.cumsum(np.pad(ventas, ((0, 0), (1, 0))), axis=1, dtype=float)
+    return (acumulada[:, ventana:] - acumulada[:, :-ventana]) / ventana
+
+
+def clasificar_etapas(ventas, ventana=3, horizonte=6, umbral=0.02):
+    """Clasifica cada fila de una matriz de ventas mensuales en una etapa del CVP.
+
+    Sobre la serie suavizada se calculan, para todos los SKU a la vez, la tasa
+    mensual de crecimiento de los últimos ``horizonte`` meses (primera
+    derivada) y su aceleración (segunda derivada):
+
+    - Introducción: crece por encima de ``umbral`` y acelera.
+    - Crecimiento: crece por encima de ``umbral`` pero ya desacelera.
+    - Declive: cae más que ``umbral`` por debajo del 90% de su pico, o quedó
+      bajo la mitad de su pico sin volver a crecer.
+    - Madurez: el resto (ventas estables o apenas bajando desde el pico).
+
+    Devuelve ``(etapas, tasa)``: índices sobre ``ETAPAS`` y la tasa mensual.
+    """
+    suavizado = suavizar(np.asarray(ventas, dtype=float), ventana)
+    horizonte = min(horizonte, suavizado.shape[1] - 1)
+    if horizonte < 2:
+        raise ValueError(f"Se necesitan al menos {ventana + 2} meses de ventas para clasificar")
+
+    pico = suavizado.max(axis=1)
+    actual = suavizado[:, -1]
+    medio = suavizado[:, -1 - horizonte // 2]
+    previo = suavizado[:, -1 - horizonte]
+
+    # Piso del 1% del pico para que una base casi nula no dispare la tasa
+    base = np.maximum(previo, 0.01 * pico + 1e-9)
+    tasa = (actual - previo) / (horizonte * base)
+    aceleracion = (actual - medio) - (medio - previo)
+    nivel = actual / np.maximum(pico, 1e-9)
+
+    etapas = np.select(
+        [
+            (tasa > umbral) & (aceleracion > 0),
+            tasa > umbral,
+            ((tasa < -umbral) & (nivel < 0.9)) | (nivel < 0.5),
+        ],
+        [0, 1, 3],
+        default=2
+    )
+    return etapas, tasa
+
+
+def simular_escenarios(parametros, n_escenarios=10_000, dispersion_lanzamiento=0.2,
+                       dispersion_pico=0.2, dispersion_declive=0.2, percentiles=(5, 50, 95),
+                       semilla=0, n_puntos=200, horizonte=HORIZONTE):
+    """Simulación Monte Carlo de trayectorias de ventas alrededor de ``parametros``.
+
+    Cada escenario multiplica la innovación (velocidad de lanzamiento), el
+    mercado potencial (pico) y la imitación (rapidez del declive tras el pico)
+    por factores log-normales con la dispersión indicada. Todas las
+    trayectorias se calculan en una sola llamada a ``curvas_bass``.
+
+    Devuelve ``(t, bandas)`` con ``bandas`` de forma ``(len(percentiles), n_puntos)``.
+    """
+    rng = np.random.default_rng(semilla)
+    factores = np.exp(rng.standard_normal((3, n_escenarios)) * np.array(
+        [[dispersion_lanzamiento], [dispersion_pico], [dispersion_declive]]
+    ))
+    valores = dict(parametros)
+    valores["innovacion"] = valores["innovacion"] * factores[0]
+    valores["mercado_potencial"] = valores["mercado_potencial"] * factores[1]
+    valores["imitacion"] = valores["imitacion"] * factores[2]
+
+    t, ventas, _ = curvas_bass(
+        **{nombre: valores[nombre] for nombre in PARAMETROS},
+        n_puntos=n_puntos, horizonte=horizonte
+    )
+    return t, np.percentile(ventas, percentiles, axis=0)
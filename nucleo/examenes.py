@@ -0,0 +1,228 @@
+"""Generación por lotes de variantes de examen reproducibles.
+
+``generar_variantes`` arma cientos de exámenes de una vez con numpy, sin
+bucles de Python por variante:
+
+- reparte las preguntas de cada examen entre los temas lo más parejo posible
+  (sin pedirle a un tema más preguntas de las que tiene); los cupos que
+  sobran se asignan a temas distintos en cada variante;
+- dentro de cada tema elige al azar, ordena las preguntas al azar y baraja
+  las opciones de cada pregunta por separado en cada variante;
+- vuelve a sortear las variantes repetidas hasta que todas son distintas.
+
+La misma semilla con el mismo banco produce siempre el mismo lote.
+``exportar_zip`` empaqueta los exámenes y las claves de respuestas en CSV y
+JSON; ``python -m nucleo.examenes`` hace lo mismo desde la línea de comandos.
+"""
+
+import argparse
+import csv
+import io
+import json
+import sys
+import zipfile
+
+import numpy as np
+
+REINTENTOS = 20
+
+
+def _cuotas(tamanos, n_preguntas):
+    """Preguntas por tema lo más parejas posible y cuántas quedan por repartir de a una."""
+    cuotas = np.zeros(len(tamanos), dtype=np.int64)
+    while True:
+        abiertos = np.flatnonzero(cuotas < tamanos)
+        restantes = n_preguntas - int(cuotas.sum())
+        if restantes == 0 or len(abiertos) == 0 or restantes < len(abiertos):
+            return cuotas, restantes
+        cuotas[abiertos] = np.minimum(cuotas[abiertos] + restantes // len(abiertos), tamanos[abiertos])
+
+
+def _muestra_sin_reemplazo(rng, tamano, cantidad, filas):
+    """Matriz ``(filas, cantidad)`` de índices distintos por fila en ``range(tamano)``."""
+    if cantidad * cantidad > tamano:
+        # Tema pequeño: permutación completa por fila
+        return np.argsort(rng.random((filas, tamano)), axis=1)[:, :cantidad]
+    # Tema grande: enteros al azar, sorteando de nuevo las filas con repetidos
+    muestra = rng.integers(0, tamano, (filas, cantidad))
+    while True:
+        ordenada = np.sort(muestra, axis=1)
+        repetidas = np.flatnonzero((ordenada[:, 1:] == ordenada[:, :-1]).any(axis=1))
+        if not len(repetidas):
+            return muestra
+        muestra[repetidas] = rng.integers(0, tamano, (len(repetidas), cantidad))
+
+
+def sortear_grupos(rng, miembros, cupos):
+    """Matriz ``(filas, n_preguntas)`` con posiciones del banco, en orden al azar.
+
+    ``miembros[g]`` son las posiciones de las preguntas del grupo ``g`` y
+    ``cupos[f, g]`` cuántas toma la fila ``f`` de ese grupo (todas las filas
+    deben sumar lo mismo). El trabajo es proporcional a las preguntas
+    elegidas, no al tamaño del banco.
+    """
+    filas = len(cupos)
+    bloques = []
+    usadas = []
+    for grupo, posiciones in enumerate(miembros):
+        maximo = int(cupos[:, grupo].max())
+        if maximo == 0:
+            continue
+        bloques.append(posiciones[_muestra_sin_reemplazo(rng, len(posiciones), maximo, filas)])
+        usadas.append(np.arange(maximo) < cupos[:, grupo, None])
+    seleccion = np.concatenate(bloques, axis=1)[np.concatenate(usadas, axis=1)].reshape(filas, -1)
+
+    # Orden de presentación al azar
+    return np.take_along_axis(seleccion, np.argsort(rng.random(seleccion.shape), axis=1), axis=1)
+
+
+def _cupos_temas(rng, tamanos, cuotas, extras, n_variantes):
+    cupos = np.tile(cuotas, (n_variantes, 1))
+    if extras:
+        # Los cupos sobrantes van a temas distintos en cada variante
+        abiertos = np.flatnonzero(cuotas < tamanos)
+        elegidos = abiertos[np.argsort(rng.random((n_variantes, len(abiertos))), axis=1)[:, :extras]]
+        np.add.at(cupos, (np.arange(n_variantes)[:, None], elegidos), 1)
+    return cupos
+
+
+def barajar_opciones(rng, preguntas, seleccion):
+    """Orden de las opciones de cada pregunta elegida y lugar de la correcta.
+
+    Devuelve ``opciones`` ``(..., K)`` con el índice original de la opción
+    mostrada en cada lugar (``-1`` si la pregunta tiene menos de ``K``
+    opciones) y ``respuestas`` con el lugar de la opción correcta.
+    """
+    n_opciones = np.array([len(pregunta['opciones']) for pregunta in preguntas])
+    correctas = np.array([pregunta['correcta'] for pregunta in preguntas])
+    maximo = int(n_opciones.max())
+    claves = rng.random((*seleccion.shape, maximo))
+    invalidas = np.arange(maximo) >= n_opciones[seleccion][..., None]
+    claves[invalidas] = np.inf
+    opciones = np.argsort(claves, axis=-1)
+    opciones[np.take_along_axis(invalidas, opciones, axis=-1)] = -1
+    respuestas = np.argmax(opciones == correctas[seleccion][..., None], axis=-1)
+    return opciones, respuestas
+
+
+def generar_variantes(preguntas, n_variantes, n_preguntas, semilla=0):
+    """Lote de ``n_variantes`` exámenes con conjuntos de ``n_preguntas`` preguntas distintos.
+
+    ``preguntas`` es una secuencia de preguntas del banco. Devuelve un
+    diccionario de arreglos: ``preguntas`` ``(V, n)`` con posiciones en
+    ``preguntas``, ``opciones`` ``(V, n, K)`` con el índice original de la
+    opción mostrada en cada lugar (``-1`` si la pregunta tiene menos de ``K``
+    opciones) y ``respuestas`` ``(V, n)`` con el lugar de la opción correcta.
+    """
+    if not 0 < n_preguntas <= len(preguntas):
+        raise ValueError(f"se piden {n_preguntas} preguntas por examen y el banco tiene {len(preguntas)}")
+    rng = np.random.default_rng(semilla)
+
+    _, codigos = np.unique([pregunta['tema'] for pregunta in preguntas], return_inverse=True)
+    orden = np.argsort(codigos, kind="stable")
+    tamanos = np.bincount(codigos)
+    miembros = np.split(orden, np.cumsum(tamanos)[:-1])
+    cuotas, extras = _cuotas(tamanos, n_preguntas)
+
+    seleccion = sortear_grupos(rng, miembros, _cupos_temas(rng, tamanos, cuotas, extras, n_variantes))
+    for _ in range(REINTENTOS):
+        # Dos variantes con las mismas preguntas en otro orden cuentan como repetidas
+        _, primeras = np.unique(np.sort(seleccion, axis=1), axis=0, return_index=True)
+        repetidas = np.setdiff1d(np.arange(n_variantes), primeras)
+        if not len(repetidas):
+            break
+        seleccion[repetidas] = sortear_grupos(
+            rng, miembros, _cupos_temas(rng, tamanos, cuotas, extras, len(repetidas))
+        )
+    else:
+        raise ValueError(f"el banco no alcanza para {n_variantes} variantes distintas")
+
+    opciones, respuestas = barajar_opciones(rng, preguntas, seleccion)
+    return {"preguntas": seleccion, "opciones": opciones, "respuestas": respuestas}
+
+
+def _letra(indice):
+    return chr(ord("A") + int(indice))
+
+
+def exportar_zip(preguntas, lote, semilla=None):
+    """ZIP con ``examenes.csv``, ``examenes.json``, ``claves.csv`` y ``claves.json``."""
+    maximo = lote["opciones"].shape[2]
+    examenes_csv = io.StringIO()
+    claves_csv = io.StringIO()
+    examenes = csv.writer(examenes_csv)
+    claves = csv.writer(claves_csv)
+    examenes.writerow(["variante", "numero", "id", "tema", "pregunta", *map(_letra, range(maximo))])
+    claves.writerow(["variante", "numero", "id", "respuesta"])
+    examenes_json = []
+    claves_json = {}
+
+    for variante, (posiciones, opciones, respuestas) in enumerate(
+        zip(lote["preguntas"], lote["opciones"], lote["respuestas"]), 1
+    ):
+        items = []
+        for numero, (posicion, orden, respuesta) in enumerate(zip(posiciones, opciones, respuestas), 1):
+            pregunta = preguntas[posicion]
+            textos = [pregunta['opciones'][i] for i in orden if i >= 0]
+            examenes.writerow([variante, numero, pregunta['id'], pregunta['tema'], pregunta['pregunta'], *textos])
+            claves.writerow([variante, numero, pregunta['id'], _letra(respuesta)])
+            items.append({"id": pregunta['id'], "tema": pregunta['tema'],
+                          "pregunta": pregunta['pregunta'], "opciones": textos})
+        examenes_json.append({"variante": variante, "preguntas": items})
+        claves_json[variante] = "".join(map(_letra, respuestas))
+
+    archivo = io.BytesIO()
+    with zipfile.ZipFile(archivo, "w", zipfile.ZIP_DEFLATED) as zip_:
+        zip_.writestr("examenes.csv", examenes_csv.getvalue())
+        zip_.writestr("claves.csv", claves_csv.getvalue())
+        zip_.writestr("examenes.json", json.dumps(
+            {"semilla": semilla, "variantes": examenes_json}, ensure_ascii=False, indent=1
+        ))
+        zip_.writestr("claves.json", json.dumps(
+            {"semilla": semilla, "claves": claves_json}, ensure_ascii=False, indent=1
+        ))
+    return archivo.getvalue()
+
+
+def preguntas_de_niveles(niveles):
+    """Preguntas del banco de ``niveles`` que pueden ir a un examen.
+
+    Deja fuera las que la analítica de ítems marcó para revisar (ver
+    ``nucleo.analitica``).
+    """
+    from nucleo import BANCO_PREGUNTAS, INDICES
+
+    revisar = INDICES['items_a_revisar']
+    return [pregunta for nivel in niveles for pregunta in BANCO_PREGUNTAS[nivel] if pregunta['id'] not in revisar]
+
+
+def generar_lote_zip(niveles, n_variantes, n_preguntas, semilla=0):
+    """Trabajo completo: arma el lote con las preguntas de ``niveles`` y lo devuelve como ZIP."""
+    preguntas = preguntas_de_niveles(niveles)
+    lote = generar_variantes(preguntas, n_variantes, n_preguntas, semilla)
+    return exportar_zip(preguntas, lote, semilla)
+
+
+def main():
+    from nucleo.puntuacion import NIVELES_QUIZ
+
+    parser = argparse.ArgumentParser(description="Genera variantes de examen con sus claves de respuestas.")
+    parser.add_argument("salida", help="archivo ZIP de salida")
+    parser.add_argument("--variantes", type=int, default=500)
+    parser.add_argument("--preguntas", type=int, default=10)
+    parser.add_argument("--niveles", nargs="+", choices=NIVELES_QUIZ, default=list(NIVELES_QUIZ))
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    try:
+        datos = generar_lote_zip(args.niveles, args.variantes, args.preguntas, args.semilla)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        sys.exit(1)
+    with open(args.salida, "wb") as archivo:
+        archivo.write(datos)
+    print(f"{args.variantes} variantes de {args.preguntas} preguntas en {args.salida} ({len(datos):,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Teoría de respuesta al ítem (modelos 1PL y 2PL) para el quiz adaptativo.
+
+Cada pregunta compilada tiene discriminación ``a`` y dificultad ``b`` (ver
+``nucleo.paquete``): si el contenido no las declara, ``a = 1`` y ``b`` sale
+del nivel, lo que equivale al modelo de Rasch. La probabilidad de acertar con
+habilidad θ es ``1 / (1 + exp(-a·(θ - b)))``.
+
+``EstimacionHabilidad`` guarda el logaritmo de la posterior de θ sobre una
+rejilla fija y la actualiza con cada respuesta en O(tamaño de la rejilla): el
+estimador es la media posterior (EAP), que sigue definida aunque todas las
+respuestas sean correctas. ``siguiente_item`` elige entre las preguntas no
+respondidas la de máxima información de Fisher en θ con una sola pasada
+vectorizada sobre los arreglos de parámetros del banco.
+
+Esa pasada es O(n) por pregunta. ``IndiceInformacion`` la hace una vez por
+banco para cada punto de la rejilla y guarda los ``PROFUNDIDAD`` ítems más
+informativos en orden: después elegir cuesta O(profundidad + respondidas),
+sin importar el tamaño del banco.
+"""
+
+import numpy as np
+
+from nucleo.puntuacion import DIFICULTAD_NIVEL, NIVELES_QUIZ
+
+REJILLA = np.linspace(-4.0, 4.0, 81)
+ERROR_ESTABLE = 0.45  # error estándar de θ por debajo del cual el nivel se da por estable
+CANDIDATOS = 3        # se sortea entre los ítems más informativos para no repetir siempre el mismo
+PROFUNDIDAD = 64      # ítems más informativos que guarda IndiceInformacion por punto de la rejilla
+
+
+def probabilidad(theta, discriminacion, dificultad):
+    return 1.0 / (1.0 + np.exp(-discriminacion * (theta - dificultad)))
+
+
+def informacion(theta, discriminacion, dificultad):
+    """Información de Fisher de cada ítem en ``theta``: ``a² · p · (1 - p)``."""
+    p = probabilidad(theta, discriminacion, dificultad)
+    return discriminacion * discriminacion * p * (1.0 - p)
+
+
+def nivel_habilidad(theta):
+    """Nivel del quiz cuya dificultad típica está más cerca de ``theta``."""
+    return min(NIVELES_QUIZ, key=lambda nivel: abs(DIFICULTAD_NIVEL[nivel] - theta))
+
+
+class EstimacionHabilidad:
+    """Estimación incremental de la habilidad de un estudiante.
+
+    La previa es normal con media ``media_previa`` (por ejemplo, la dificultad
+    del nivel que eligió el estudiante al empezar) y desviación
+    ``desviacion_previa``.
+    """
+
+    def __init__(self, media_previa=0.0, desviacion_previa=1.0):
+        self.log_posterior = -0.5 * ((REJILLA - media_previa) / desviacion_previa) ** 2
+        self.respondidas = 0
+        self._resumir()
+
+    def registrar(self, discriminacion, dificultad, acierto):
+        p = probabilidad(REJILLA, discriminacion, dificultad)
+        self.log_posterior += np.log(p if acierto else 1.0 - p)
+        self.respondidas += 1
+        self._resumir()
+
+    def _resumir(self):
+        pesos = np.exp(self.log_posterior - self.log_posterior.max())
+        pesos /= pesos.sum()
+        self.theta = float(pesos @ REJILLA)
+        self.error = float(np.sqrt(pesos @ (REJILLA - self.theta) ** 2))
+
+    @property
+    def estable(self):
+        return self.error < ERROR_ESTABLE
+
+
+def siguiente_item(theta, discriminacion, dificultad, excluidos=(), candidatos=CANDIDATOS, rng=None):
+    """Posición del próximo ítem, o ``None`` si no quedan.
+
+    ``discriminacion`` y ``dificultad`` son arreglos (o buffers ``float32``)
+    con un valor por pregunta del banco; ``excluidos`` son las posiciones ya
+    respondidas. Se elige al azar entre los ``candidatos`` ítems de mayor
+    información en ``theta``.
+    """
+    info = informacion(theta, np.asarray(discriminacion), np.asarray(dificultad))
+    excluidos = np.asarray(excluidos, dtype=np.intp)
+    info[excluidos] = -np.inf
+    disponibles = len(info) - len(excluidos)
+    if disponibles <= 0:
+        return None
+    cantidad = min(candidatos, disponibles)
+    mejores = np.argpartition(info, -cantidad)[-cantidad:]
+    rng = rng or np.random.default_rng()
+    return int(rng.choice(mejores))
+
+
+class IndiceInformacion:
+    """Ítems del banco ordenados por información en cada punto de ``REJILLA``.
+
+    Se construye una vez por banco en O(puntos · n). ``siguiente`` toma θ en
+    el punto más cercano de la rejilla (la misma que usa la estimación EAP) y
+    recorre su lista saltando los respondidos; solo si el estudiante ya
+    respondió casi todos los de la lista vuelve a la pasada completa.
+    """
+
+    def __init__(self, discriminacion, dificultad, profundidad=PROFUNDIDAD):
+        self.discriminacion = np.asarray(discriminacion)
+        self.dificultad = np.asarray(dificultad)
+        self.n = len(self.dificultad)
+        cantidad = min(profundidad, self.n)
+        self.orden = np.empty((len(REJILLA), cantidad), dtype=np.intp)
+        for punto, theta in enumerate(REJILLA):
+            info = informacion(theta, self.discriminacion, self.dificultad)
+            mejores = np.argpartition(info, -cantidad)[-cantidad:]
+            self.orden[punto] = mejores[np.argsort(-info[mejores], kind="stable")]
+
+    def siguiente(self, theta, excluidos=(), candidatos=CANDIDATOS, rng=None):
+        """Como ``siguiente_item``, sin recorrer el banco."""
+        excluidos = np.asarray(excluidos, dtype=np.intp)
+        cantidad = min(candidatos, self.n - len(excluidos))
+        if cantidad <= 0:
+            return None
+        lista = self.orden[int(np.abs(REJILLA - theta).argmin())]
+        libres = lista[~np.isin(lista, excluidos)][:cantidad]
+        if len(libres) < cantidad:
+            return siguiente_item(theta, self.discriminacion, self.dificultad, excluidos, candidatos, rng)
+        rng = rng or np.random.default_rng()
+        return int(rng.choice(libres))
@@ -0,0 +1,454 @@
+"""Paquete precompilado y validado del contenido del curso.
+
+``python -m nucleo.paquete`` valida ``nucleo/contenido.py``, asigna IDs
+estables a preguntas y conceptos, construye los índices de búsqueda
+(``INDICES``) y escribe dos archivos:
+
+- ``datos/banco.bin``: el banco de preguntas y sus índices en arreglos planos
+  que cada proceso mapea en memoria sin decodificarlos (ver ``nucleo.banco``);
+- ``datos/contenido.pkl``: el resto del contenido, pequeño y escrito a mano,
+  junto con el hash SHA-256 de la fuente y el de los datos.
+
+Si existe ``datos/metadatos_items.json`` (ver ``nucleo.analitica``), sus
+parámetros TRI calibrados reemplazan a los de la fuente en las preguntas que
+cubre, y las preguntas marcadas para revisar quedan en
+``INDICES["items_a_revisar"]``. El archivo forma parte del hash de la fuente:
+cambiarlo también obliga a recompilar.
+
+``cargar_contenido()`` los abre una sola vez por proceso; si faltan, están
+dañados o la fuente cambió desde que se compilaron, recompila desde la fuente
+y los reescribe (si el disco lo permite).
+
+Como el contenido llega validado, las páginas pueden indexar directamente
+(``INDICES["conceptos"][nombre]``) sin recorrer ni comprobar las estructuras.
+
+El diccionario devuelto es compartido por todas las sesiones: es de solo
+lectura en su primer nivel y el resto de la estructura no debe modificarse.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import re
+import sys
+import unicodedata
+from array import array
+from functools import lru_cache
+from types import MappingProxyType
+
+from nucleo.banco import abrir as abrir_banco, escribir as escribir_banco
+from nucleo.puntuacion import DIFICULTAD_NIVEL
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUTA_FUENTE = os.path.join(RAIZ, "nucleo", "contenido.py")
+RUTA_PAQUETE = os.path.join(RAIZ, "datos", "contenido.pkl")
+RUTA_BANCO = os.path.join(RAIZ, "datos", "banco.bin")
+RUTA_METADATOS = os.path.join(RAIZ, "datos", "metadatos_items.json")
+
+FIRMA = b"MKTCONT"
+FORMATO = 6
+
+NOMBRES = (
+    "CONCEPTOS_CLAVE",
+    "BANCO_PREGUNTAS",
+    "CASOS_ESTRATEGICOS",
+    "PREGUNTAS_DIAGNOSTICO",
+    "COMPARACIONES_LABORATORIO",
+    "RESUMENES_EJECUTIVOS",
+    "GLOSARIO",
+    "CATEGORIAS_MAPA",
+    "AREAS_CONOCIMIENTO",
+)
+
+
+def hash_fuente(ruta=RUTA_FUENTE, ruta_metadatos=RUTA_METADATOS):
+    resumen = hashlib.sha256()
+    with open(ruta, "rb") as archivo:
+        resumen.update(archivo.read())
+    if os.path.exists(ruta_metadatos):
+        with open(ruta_metadatos, "rb") as archivo:
+            resumen.update(b"\0metadatos\0" + archivo.read())
+    return resumen.digest()
+
+
+def cargar_metadatos(ruta=RUTA_METADATOS):
+    """Metadatos por ID de pregunta escritos por ``nucleo.analitica``; vacío si no hay archivo.
+
+    Lanza ``ValueError`` si el archivo no se puede leer o sus parámetros no son válidos.
+    """
+    try:
+        with open(ruta, encoding="utf-8") as archivo:
+            items = json.load(archivo)["items"]
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, KeyError, TypeError) as error:
+        raise ValueError(f"Metadatos de ítems ilegibles en {ruta}: {error}") from None
+
+    errores = []
+    for id_item, datos in items.items():
+        if "dificultad" in datos and not isinstance(datos["dificultad"], (int, float)):
+            errores.append(f"{id_item}: 'dificultad' debe ser un número")
+        discriminacion = datos.get("discriminacion", 1.0)
+        if not isinstance(discriminacion, (int, float)) or discriminacion <= 0:
+            errores.append(f"{id_item}: 'discriminacion' debe ser un número positivo")
+    if errores:
+        raise ValueError(f"Metadatos de ítems inválidos en {ruta}:\n- " + "\n- ".join(errores))
+    return items
+
+
+def _validar_opciones(errores, ruta, item, clave_correcta):
+    opciones = item.get("opciones")
+    if not isinstance(opciones, list) or len(opciones) < 2:
+        errores.append(f"{ruta}: necesita al menos dos opciones")
+        return
+    correcta = item.get(clave_correcta)
+    if not isinstance(correcta, int) or not 0 <= correcta < len(opciones):
+        errores.append(f"{ruta}: '{clave_correcta}' fuera de rango ({correcta!r})")
+
+
+def _normalizar(texto):
+    return " ".join(texto.casefold().split())
+
+
+def _slug(texto):
+    ascii_ = unicodedata.normalize("NFKD", texto).encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]+", "-", ascii_.lower()).strip("-")
+
+
+def id_pregunta(nivel, texto):
+    """ID estable de una pregunta del banco: no cambia si se reordena el banco.
+
+    Además del ID, cada pregunta compilada lleva ``numero``, su posición en el
+    banco (contigua por nivel): es el entero que guardan las sesiones, válido
+    mientras no se recompile el banco.
+
+    Son 64 bits del SHA-1 del enunciado normalizado: con cientos de miles de
+    preguntas una colisión es improbable, y ``validar`` la rechaza si ocurre.
+    """
+    return f"{nivel}-{hashlib.sha1(_normalizar(texto).encode()).hexdigest()[:16]}"
+
+
+def _faltantes(errores, ruta, item, campos):
+    faltan = [campo for campo in campos if campo not in item]
+    if faltan:
+        errores.append(f"{ruta}: faltan los campos {', '.join(faltan)}")
+
+
+def validar(contenido):
+    """Comprueba la estructura del contenido; lanza ``ValueError`` con todos los problemas."""
+    errores = []
+    for nombre in NOMBRES:
+        if nombre not in contenido:
+            errores.append(f"falta {nombre}")
+    if errores:
+        raise ValueError("Contenido inválido:\n- " + "\n- ".join(errores))
+
+    capitulo_de = {}
+    for capitulo, conceptos in contenido["CONCEPTOS_CLAVE"].items():
+        for concepto, datos in conceptos.items():
+            ruta = f"CONCEPTOS_CLAVE[{capitulo!r}][{concepto!r}]"
+            if concepto in capitulo_de:
+                errores.append(f"{ruta}: el concepto ya existe en {capitulo_de[concepto]!r}")
+            capitulo_de[concepto] = capitulo
+            _faltantes(errores, ruta, datos, ("definicion", "ejemplo", "pregunta", "opciones", "respuesta_correcta"))
+            _validar_opciones(errores, ruta, datos, "respuesta_correcta")
+
+    vistas = {}
+    ids = {}
+    for nivel, preguntas in contenido["BANCO_PREGUNTAS"].items():
+        for i, pregunta in enumerate(preguntas):
+            ruta = f"BANCO_PREGUNTAS[{nivel!r}][{i}]"
+            _faltantes(errores, ruta, pregunta, ("pregunta", "opciones", "correcta", "explicacion", "tema"))
+            _validar_opciones(errores, ruta, pregunta, "correcta")
+            if not isinstance(pregunta.get("dificultad", 0.0), (int, float)):
+                errores.append(f"{ruta}: 'dificultad' debe ser un número")
+            discriminacion = pregunta.get("discriminacion", 1.0)
+            if not isinstance(discriminacion, (int, float)) or discriminacion <= 0:
+                errores.append(f"{ruta}: 'discriminacion' debe ser un número positivo")
+            texto = _normalizar(pregunta.get("pregunta", ""))
+            if texto in vistas:
+                errores.append(f"{ruta}: texto duplicado de {vistas[texto]}")
+            else:
+                id_ = id_pregunta(nivel, pregunta.get("pregunta", ""))
+                if id_ in ids:
+                    errores.append(f"{ruta}: el ID {id_!r} coincide con el de {ids[id_]}")
+                ids.setdefault(id_, ruta)
+            vistas.setdefault(texto, ruta)
+
+    for i, pregunta in enumerate(contenido["PREGUNTAS_DIAGNOSTICO"]):
+        ruta = f"PREGUNTAS_DIAGNOSTICO[{i}]"
+        _faltantes(errores, ruta, pregunta, ("pregunta", "opciones", "correcta"))
+        _validar_opciones(errores, ruta, pregunta, "correcta")
+
+    for clave, caso in contenido["CASOS_ESTRATEGICOS"].items():
+        ruta = f"CASOS_ESTRATEGICOS[{clave!r}]"
+        _faltantes(errores, ruta, caso, ("titulo", "contexto", "opciones", "leccion_final"))
+        if not any(opcion.get("correcta") for opcion in caso.get("opciones", [])):
+            errores.append(f"{ruta}: ninguna opción está marcada como correcta")
+
+    for titulo, columnas in contenido["COMPARACIONES_LABORATORIO"].items():
+        if len({len(valores) for valores in columnas.values()}) > 1:
+            errores.append(f"COMPARACIONES_LABORATORIO[{titulo!r}]: las columnas tienen distinto largo")
+
+    temas_mapa = {}
+    for categoria, temas in contenido["CATEGORIAS_MAPA"].items():
+        if not temas:
+            errores.append(f"CATEGORIAS_MAPA[{categoria!r}]: no tiene temas")
+        for tema, concepto in temas.items():
+            ruta = f"CATEGORIAS_MAPA[{categoria!r}][{tema!r}]"
+            if tema in temas_mapa:
+                errores.append(f"{ruta}: el tema ya aparece en {temas_mapa[tema]!r}")
+            temas_mapa[tema] = categoria
+            if concepto is not None and concepto not in capitulo_de:
+                errores.append(f"{ruta}: {concepto!r} no existe en CONCEPTOS_CLAVE")
+
+    area_de = {}
+    for area, grupos in contenido["AREAS_CONOCIMIENTO"].items():
+        for grupo in grupos:
+            ruta = f"AREAS_CONOCIMIENTO[{area!r}]"
+            if grupo not in contenido["CONCEPTOS_CLAVE"] and grupo not in contenido["CATEGORIAS_MAPA"]:
+                errores.append(f"{ruta}: {grupo!r} no es un capítulo ni una categoría del mapa")
+            elif grupo in area_de:
+                errores.append(f"{ruta}: {grupo!r} ya está en {area_de[grupo]!r}")
+            else:
+                area_de[grupo] = area
+    areas_nombre = {}
+    for grupos in (contenido["CONCEPTOS_CLAVE"], contenido["CATEGORIAS_MAPA"]):
+        for grupo, nombres in grupos.items():
+            for nombre in nombres:
+                area = area_de.get(grupo)
+                if area is not None and areas_nombre.setdefault(nombre, (area, grupo))[0] != area:
+                    otra, otro_grupo = areas_nombre[nombre]
+                    errores.append(
+                        f"AREAS_CONOCIMIENTO: {nombre!r} queda en {otra!r} por {otro_grupo!r} y en {area!r} por {grupo!r}"
+                    )
+
+    if errores:
+        raise ValueError("Contenido inválido:\n- " + "\n- ".join(errores))
+
+
+def avisos(contenido, metadatos=None):
+    """Problemas que no impiden compilar: temas del mapa sin ficha, conceptos fuera del mapa,
+    capítulos o categorías sin área y metadatos de preguntas que ya no están en el banco."""
+    resultado = []
+    enlazados = set()
+    for categoria, temas in contenido["CATEGORIAS_MAPA"].items():
+        for tema, concepto in temas.items():
+            if concepto is None:
+                resultado.append(f"CATEGORIAS_MAPA[{categoria!r}][{tema!r}]: tema sin concepto en CONCEPTOS_CLAVE")
+            enlazados.add(concepto)
+    for capitulo, conceptos in contenido["CONCEPTOS_CLAVE"].items():
+        for concepto in conceptos:
+            if concepto not in enlazados:
+                resultado.append(f"CONCEPTOS_CLAVE[{capitulo!r}][{concepto!r}]: no aparece en el mapa conceptual")
+    con_area = {grupo for grupos in contenido["AREAS_CONOCIMIENTO"].values() for grupo in grupos}
+    for nombre in ("CONCEPTOS_CLAVE", "CATEGORIAS_MAPA"):
+        for grupo in contenido[nombre]:
+            if grupo not in con_area:
+                resultado.append(f"{nombre}[{grupo!r}]: no pertenece a ningún área de AREAS_CONOCIMIENTO")
+    for id_item in metadatos or {}:
+        if id_item not in contenido["INDICES"]["preguntas"]:
+            resultado.append(f"metadatos de ítems: {id_item!r} no está en el banco")
+    return resultado
+
+
+def _indexar(contenido, metadatos=None):
+    """Copia del contenido con IDs estables y la entrada ``INDICES``.
+
+    Los índices comparten los diccionarios de preguntas y conceptos con el
+    resto del contenido. Al compilar, ``BANCO_PREGUNTAS`` y los índices de
+    preguntas van al banco mapeado; esta versión en memoria solo se usa si no
+    se puede escribir en el disco.
+    """
+    conceptos_clave = {}
+    por_nombre = {}
+    for capitulo, conceptos in contenido["CONCEPTOS_CLAVE"].items():
+        conceptos_clave[capitulo] = {}
+        for nombre, datos in conceptos.items():
+            datos = {**datos, "id": _slug(nombre), "nombre": nombre, "capitulo": capitulo}
+            conceptos_clave[capitulo][nombre] = por_nombre[nombre] = datos
+
+    metadatos = metadatos or {}
+    banco = {}
+    por_id = {}
+    por_tema = {}
+    numero = 0
+    for nivel, preguntas in contenido["BANCO_PREGUNTAS"].items():
+        banco[nivel] = []
+        for pregunta in preguntas:
+            id_ = id_pregunta(nivel, pregunta["pregunta"])
+            calibrados = metadatos.get(id_, {})
+            pregunta = {
+                "discriminacion": 1.0,
+                "dificultad": DIFICULTAD_NIVEL.get(nivel, 0.0),
+                **pregunta,
+                **{campo: calibrados[campo] for campo in ("discriminacion", "dificultad") if campo in calibrados},
+                "id": id_,
+                "nivel": nivel,
+                "numero": numero,
+            }
+            banco[nivel].append(pregunta)
+            numero += 1
+            por_id[pregunta["id"]] = pregunta
+            por_tema.setdefault(pregunta["tema"], []).append(pregunta)
+
+    temas_mapa = {
+        tema: por_nombre.get(concepto)
+        for temas in contenido["CATEGORIAS_MAPA"].values()
+        for tema, concepto in temas.items()
+    }
+
+    area_concepto = {
+        nombre: area
+        for area, grupos in contenido["AREAS_CONOCIMIENTO"].items()
+        for grupo in grupos
+        for nombre in [*contenido["CONCEPTOS_CLAVE"].get(grupo, ()), *contenido["CATEGORIAS_MAPA"].get(grupo, ())]
+    }
+
+    return {
+        **contenido,
+        "CONCEPTOS_CLAVE": conceptos_clave,
+        "BANCO_PREGUNTAS": banco,
+        "INDICES": {
+            "conceptos": por_nombre,
+            "conceptos_por_id": {datos["id"]: datos for datos in por_nombre.values()},
+            "preguntas": por_id,
+            "preguntas_por_numero": tuple(pregunta for preguntas in banco.values() for pregunta in preguntas),
+            "preguntas_por_tema": {tema: tuple(preguntas) for tema, preguntas in por_tema.items()},
+            "parametros_irt": (
+                array("f", (pregunta["discriminacion"] for pregunta in por_id.values())),
+                array("f", (pregunta["dificultad"] for pregunta in por_id.values())),
+            ),
+            "temas_mapa": temas_mapa,
+            "area_concepto": area_concepto,
+            "items_a_revisar": frozenset(
+                id_ for id_, datos in metadatos.items() if datos.get("revisar") and id_ in por_id
+            ),
+        },
+    }
+
+
+def _desde_fuente():
+    from nucleo import contenido as fuente
+
+    contenido = {nombre: getattr(fuente, nombre) for nombre in NOMBRES}
+    validar(contenido)
+    return _indexar(contenido, cargar_metadatos())
+
+
+# Entradas de INDICES que se sirven desde el banco mapeado
+INDICES_BANCO = ("preguntas", "preguntas_por_numero", "preguntas_por_tema", "parametros_irt")
+
+
+def compilar(ruta=RUTA_PAQUETE, ruta_banco=RUTA_BANCO, contenido=None):
+    """Valida la fuente y escribe el banco y el paquete de forma atómica; devuelve el contenido.
+
+    ``contenido`` permite pasar el resultado de ``_desde_fuente`` si ya se calculó.
+    """
+    if contenido is None:
+        contenido = _desde_fuente()
+    fuente = hash_fuente()
+    escribir_banco(ruta_banco, contenido["BANCO_PREGUNTAS"], fuente)
+
+    resto = {nombre: valor for nombre, valor in contenido.items() if nombre != "BANCO_PREGUNTAS"}
+    resto["INDICES"] = {
+        nombre: indice for nombre, indice in contenido["INDICES"].items() if nombre not in INDICES_BANCO
+    }
+    datos = pickle.dumps(resto, protocol=pickle.HIGHEST_PROTOCOL)
+    encabezado = FIRMA + bytes([FORMATO]) + fuente + hashlib.sha256(datos).digest()
+
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(encabezado + datos)
+    os.replace(temporal, ruta)
+    return contenido
+
+
+def leer_paquete(ruta=RUTA_PAQUETE, ruta_banco=RUTA_BANCO):
+    """Contenido del paquete con el banco mapeado, o ``None`` si falta algo, está dañado o la fuente cambió."""
+    try:
+        with open(ruta, "rb") as archivo:
+            bruto = archivo.read()
+    except OSError:
+        return None
+
+    inicio_datos = len(FIRMA) + 1 + 64
+    if bruto[:len(FIRMA)] != FIRMA or bruto[len(FIRMA)] != FORMATO:
+        return None
+    fuente_compilada = bruto[len(FIRMA) + 1:len(FIRMA) + 33]
+    hash_datos = bruto[len(FIRMA) + 33:inicio_datos]
+    datos = memoryview(bruto)[inicio_datos:]
+
+    if os.path.exists(RUTA_FUENTE) and fuente_compilada != hash_fuente():
+        return None
+    if hashlib.sha256(datos).digest() != hash_datos:
+        return None
+    banco = abrir_banco(ruta_banco, fuente_compilada)
+    if banco is None:
+        return None
+
+    contenido = pickle.loads(datos)
+    contenido["BANCO_PREGUNTAS"] = banco
+    contenido["INDICES"]["preguntas"] = banco.por_id
+    contenido["INDICES"]["preguntas_por_numero"] = banco.todas
+    contenido["INDICES"]["preguntas_por_tema"] = banco.por_tema
+    contenido["INDICES"]["parametros_irt"] = (banco.discriminacion, banco.dificultad)
+    return contenido
+
+
+@lru_cache(maxsize=1)
+def cargar_contenido():
+    """Contenido compartido por el proceso: paquete si está al día, si no recompila."""
+    contenido = leer_paquete()
+    if contenido is None:
+        try:
+            compilar()
+            contenido = leer_paquete()
+        except OSError:
+            pass
+    if contenido is None:
+        contenido = _desde_fuente()  # disco de solo lectura: se usa sin escribirlo
+    return MappingProxyType(contenido)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Valida el contenido del curso y compila el paquete.")
+    parser.add_argument("--verificar", action="store_true", help="solo valida, no escribe el paquete")
+    parser.add_argument("--estricto", action="store_true", help="trata los avisos como errores")
+    parser.add_argument("--salida", default=RUTA_PAQUETE, help=f"ruta del paquete (por defecto {RUTA_PAQUETE})")
+    parser.add_argument("--banco", default=RUTA_BANCO, help=f"ruta del banco mapeado (por defecto {RUTA_BANCO})")
+    args = parser.parse_args()
+
+    try:
+        contenido = _desde_fuente()
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        sys.exit(1)
+
+    pendientes = avisos(contenido, cargar_metadatos())
+    for aviso in pendientes:
+        print(f"aviso: {aviso}", file=sys.stderr)
+    # En modo estricto los avisos impiden escribir: la app no debe cargar un paquete rechazado
+    if args.estricto and pendientes:
+        print("Hay avisos y --estricto: no se escribe el paquete", file=sys.stderr)
+        sys.exit(1)
+    if not args.verificar:
+        compilar(args.salida, args.banco, contenido)
+
+    resumen = ", ".join(f"{nombre}: {len(contenido[nombre])}" for nombre in NOMBRES)
+    indices = ", ".join(f"{nombre}: {len(indice)}" for nombre, indice in contenido["INDICES"].items())
+    if args.verificar:
+        print(f"Contenido válido\n{resumen}\nÍndices: {indices}")
+    else:
+        print(
+            f"Paquete escrito en {args.salida} ({os.path.getsize(args.salida):,} bytes)\n"
+            f"Banco escrito en {args.banco} ({os.path.getsize(args.banco):,} bytes)\n"
+            f"{resumen}\nÍndices: {indices}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""Ensamblado de exámenes que cumplen un plan (cupos por tema y por nivel).
+
+Un plan es un diccionario como::
+
+    {"preguntas": 10,
+     "temas": {"Marca": 2, "Ciclo de Vida": 2},
+     "niveles": {"basico": 4, "intermedio": 4, "avanzado": 2}}
+
+Los cupos nombrados son exactos; los temas (o niveles) que el plan no nombra
+comparten lo que falte para completar ``preguntas``.
+
+Cumplir a la vez los cupos de temas y de niveles es un problema de
+transporte: cuántas preguntas tomar de cada celda (tema, nivel) sin pasar de
+las que hay. Se resuelve como flujo máximo en una red diminuta (fuente ->
+temas -> celdas -> niveles -> sumidero), con caminos de aumento en orden al
+azar para que distintos formularios repartan distinto. Si el flujo no llega a
+``preguntas`` el plan es inviable y el error dice qué cupos no se alcanzaron.
+Con los cupos por celda resueltos, ``nucleo.examenes.sortear_grupos`` elige
+las preguntas de todos los formularios a la vez.
+
+``python -m nucleo.planes plan.json salida.zip`` arma un lote desde la línea
+de comandos con el mismo ZIP que ``python -m nucleo.examenes``.
+"""
+
+import argparse
+import json
+import random
+import sys
+
+import numpy as np
+
+from nucleo.examenes import (
+    REINTENTOS, _cuotas, barajar_opciones, exportar_zip, preguntas_de_niveles, sortear_grupos
+)
+
+FLUJOS_DISTINTOS = 32  # repartos por celda distintos por lote; los formularios se asignan entre ellos
+RESTO = None           # nodo de los temas o niveles que el plan no nombra
+ETIQUETAS = {"tema": ("tema", "temas"), "nivel": ("nivel", "niveles")}  # (singular, plural) en los mensajes
+
+
+class _Red:
+    """Red de flujo con aristas en arreglos; la arista inversa de ``e`` es ``e ^ 1``."""
+
+    def __init__(self, nodos):
+        self.salientes = [[] for _ in range(nodos)]
+        self.destino = []
+        self.capacidad = []
+
+    def arista(self, origen, destino, capacidad):
+        self.salientes[origen].append(len(self.destino))
+        self.destino.append(destino)
+        self.capacidad.append(capacidad)
+        self.salientes[destino].append(len(self.destino))
+        self.destino.append(origen)
+        self.capacidad.append(0)
+        return len(self.destino) - 2
+
+    def flujo_maximo(self, fuente, sumidero, rng):
+        capacidad = self.capacidad
+        total = 0
+        while True:
+            padre = {fuente: None}
+            pila = [fuente]
+            while pila and sumidero not in padre:
+                nodo = pila.pop()
+                aristas = self.salientes[nodo][:]
+                rng.shuffle(aristas)
+                for arista in aristas:
+                    siguiente = self.destino[arista]
+                    if capacidad[arista] > 0 and siguiente not in padre:
+                        padre[siguiente] = arista
+                        pila.append(siguiente)
+            if sumidero not in padre:
+                return total
+
+            camino = []
+            nodo = sumidero
+            while padre[nodo] is not None:
+                camino.append(padre[nodo])
+                nodo = self.destino[padre[nodo] ^ 1]
+            cuello = min(capacidad[arista] for arista in camino)
+            for arista in camino:
+                capacidad[arista] -= cuello
+                capacidad[arista ^ 1] += cuello
+            total += cuello
+
+
+def _entero(valor):
+    return isinstance(valor, int) and not isinstance(valor, bool)
+
+
+def _validar_plan(plan):
+    """Problemas de forma del plan (claves y tipos), antes de compararlo con el banco."""
+    if not isinstance(plan, dict):
+        return ["el plan debe ser un objeto con 'preguntas', 'temas' y 'niveles'"]
+    errores = []
+    if "preguntas" not in plan:
+        errores.append("falta 'preguntas' (cantidad de preguntas por examen)")
+    elif not _entero(plan["preguntas"]):
+        errores.append(f"'preguntas' debe ser un entero, no {plan['preguntas']!r}")
+    for clave in ("temas", "niveles"):
+        cupos = plan.get(clave, {})
+        if not isinstance(cupos, dict):
+            errores.append(f"'{clave}' debe ser un objeto nombre -> cupo")
+            continue
+        for nombre, cupo in cupos.items():
+            if not _entero(cupo) or cupo < 0:
+                errores.append(f"'{clave}': el cupo de {nombre!r} debe ser un entero no negativo, no {cupo!r}")
+    return errores
+
+
+def _nodos(nombres, cupos, n_preguntas, etiquetas, errores):
+    """Nodo de cada nombre (él mismo si el plan lo nombra, ``RESTO`` si no) y cupo de cada nodo.
+
+    ``etiquetas`` es ``(singular, plural)`` para los mensajes de error.
+    """
+    etiqueta, plural = etiquetas
+    desconocidos = set(cupos) - set(nombres)
+    if desconocidos:
+        errores.append(f"{plural} que no existen en el banco: {', '.join(sorted(desconocidos))}")
+    nodo = {nombre: nombre if nombre in cupos else RESTO for nombre in nombres}
+    cupo_nodo = {nombre: cupo for nombre, cupo in cupos.items() if nombre in nombres}
+    sobrante = n_preguntas - sum(cupo_nodo.values())
+    if sobrante < 0:
+        errores.append(f"los cupos por {etiqueta} suman {n_preguntas - sobrante}, más que las {n_preguntas} preguntas")
+    cupo_nodo[RESTO] = max(sobrante, 0)
+    return nodo, cupo_nodo
+
+
+class Ensamblador:
+    """Prepara el banco y un plan una vez para armar formularios en lotes.
+
+    Lanza ``ValueError`` con todos los problemas si el plan no se puede
+    cumplir con las preguntas disponibles.
+    """
+
+    def __init__(self, preguntas, plan, semilla=0):
+        errores = _validar_plan(plan)
+        if errores:
+            raise ValueError("Plan inválido:\n- " + "\n- ".join(errores))
+        self.preguntas = preguntas
+        self.n_preguntas = plan["preguntas"]
+        self._rng_flujo = random.Random(semilla)
+        self._rng = np.random.default_rng(semilla)
+
+        celdas = {}
+        for posicion, pregunta in enumerate(preguntas):
+            celdas.setdefault((pregunta['tema'], pregunta['nivel']), []).append(posicion)
+        self.celdas = list(celdas)
+        self.miembros = [np.array(posiciones) for posiciones in celdas.values()]
+
+        if not 0 < self.n_preguntas <= len(preguntas):
+            errores.append(f"se piden {self.n_preguntas} preguntas por examen y el banco tiene {len(preguntas)}")
+        nodo_tema, cupo_tema = _nodos(
+            {tema for tema, _ in celdas}, plan.get("temas", {}), self.n_preguntas, ETIQUETAS["tema"], errores
+        )
+        nodo_nivel, cupo_nivel = _nodos(
+            {nivel for _, nivel in celdas}, plan.get("niveles", {}), self.n_preguntas, ETIQUETAS["nivel"], errores
+        )
+        if errores:
+            raise ValueError("Plan inválido:\n- " + "\n- ".join(errores))
+
+        # Nodos: 0 fuente, 1 sumidero, luego temas y niveles
+        temas = list(cupo_tema)
+        niveles = list(cupo_nivel)
+        indice_tema = {tema: 2 + i for i, tema in enumerate(temas)}
+        indice_nivel = {nivel: 2 + len(temas) + i for i, nivel in enumerate(niveles)}
+        self._red = _Red(2 + len(temas) + len(niveles))
+        self._entradas = {tema: self._red.arista(0, indice_tema[tema], cupo) for tema, cupo in cupo_tema.items()}
+        self._salidas = {
+            nivel: self._red.arista(indice_nivel[nivel], 1, cupo) for nivel, cupo in cupo_nivel.items()
+        }
+        self._aristas_celda = [
+            self._red.arista(indice_tema[nodo_tema[tema]], indice_nivel[nodo_nivel[nivel]], len(posiciones))
+            for (tema, nivel), posiciones in celdas.items()
+        ]
+        self._capacidad_inicial = list(self._red.capacidad)
+
+        if self._resolver() is None:
+            raise ValueError(self._diagnostico(cupo_tema, cupo_nivel))
+
+    def _resolver(self):
+        """Cupos por celda de un reparto al azar que cumple el plan, o ``None`` si no existe."""
+        self._red.capacidad = list(self._capacidad_inicial)
+        if self._red.flujo_maximo(0, 1, self._rng_flujo) < self.n_preguntas:
+            return None
+        return [self._capacidad_inicial[arista] - self._red.capacidad[arista] for arista in self._aristas_celda]
+
+    def _diagnostico(self, cupo_tema, cupo_nivel):
+        capacidad = self._red.capacidad
+        asignadas = sum(self._capacidad_inicial[a] - capacidad[a] for a in self._entradas.values())
+        problemas = [f"se pueden cumplir a la vez como máximo {asignadas} de las {self.n_preguntas} preguntas"]
+        for (etiqueta, plural), aristas, cupos in (
+            (ETIQUETAS["tema"], self._entradas, cupo_tema), (ETIQUETAS["nivel"], self._salidas, cupo_nivel)
+        ):
+            for nombre, arista in aristas.items():
+                logradas = self._capacidad_inicial[arista] - capacidad[arista]
+                if logradas < cupos[nombre]:
+                    nombre_legible = f"{plural} sin cupo propio" if nombre is RESTO else f"{etiqueta} '{nombre}'"
+                    problemas.append(f"{nombre_legible}: pide {cupos[nombre]}, se cubren {logradas}")
+        return "Plan inviable:\n- " + "\n- ".join(problemas)
+
+    def armar(self, n_formas):
+        """Lote de ``n_formas`` formularios distintos con el mismo formato que ``generar_variantes``."""
+        repartos = np.array([self._resolver() for _ in range(min(n_formas, FLUJOS_DISTINTOS))])
+
+        def sortear(filas):
+            cupos = repartos[self._rng.integers(0, len(repartos), filas)]
+            return sortear_grupos(self._rng, self.miembros, cupos)
+
+        seleccion = sortear(n_formas)
+        for _ in range(REINTENTOS):
+            _, primeras = np.unique(np.sort(seleccion, axis=1), axis=0, return_index=True)
+            repetidas = np.setdiff1d(np.arange(n_formas), primeras)
+            if not len(repetidas):
+                break
+            seleccion[repetidas] = sortear(len(repetidas))
+        else:
+            raise ValueError(f"el banco no alcanza para {n_formas} formularios distintos con este plan")
+
+        opciones, respuestas = barajar_opciones(self._rng, self.preguntas, seleccion)
+        return {"preguntas": seleccion, "opciones": opciones, "respuestas": respuestas}
+
+
+def _niveles_parejos(preguntas, cupos_temas, n_preguntas):
+    """Cupos por nivel compatibles con ``cupos_temas`` con el menor máximo posible.
+
+    Sube el tope común por nivel de a uno hasta que el flujo cubre todas las
+    preguntas y devuelve cuántas tomó de cada nivel ese flujo.
+    """
+    tamanos = {}
+    for pregunta in preguntas:
+        celda = (pregunta['tema'], pregunta['nivel'])
+        tamanos[celda] = tamanos.get(celda, 0) + 1
+    temas = list(cupos_temas)
+    niveles = sorted({nivel for _, nivel in tamanos})
+    indice_nivel = {nivel: 2 + len(temas) + i for i, nivel in enumerate(niveles)}
+    tope = -(-n_preguntas // len(niveles))
+    while True:
+        red = _Red(2 + len(temas) + len(niveles))
+        for i, tema in enumerate(temas):
+            red.arista(0, 2 + i, cupos_temas[tema])
+        for (tema, nivel), tamano in tamanos.items():
+            red.arista(2 + temas.index(tema), indice_nivel[nivel], tamano)
+        salidas = {nivel: red.arista(indice_nivel[nivel], 1, tope) for nivel in niveles}
+        if red.flujo_maximo(0, 1, random.Random(0)) == n_preguntas:
+            return {nivel: tope - red.capacidad[arista] for nivel, arista in salidas.items()}
+        tope += 1
+
+
+def plan_balanceado(preguntas, n_preguntas, niveles=True, semilla=None):
+    """Plan que reparte ``n_preguntas`` lo más parejo posible entre temas (y niveles).
+
+    Las preguntas que sobran del reparto parejo por tema se asignan a temas al
+    azar. Los niveles se reparten después, lo más parejo que permiten los
+    cupos por tema (un tema con preguntas de un solo nivel fija esas).
+    """
+    if not 0 < n_preguntas <= len(preguntas):
+        raise ValueError(f"se piden {n_preguntas} preguntas por examen y el banco tiene {len(preguntas)}")
+    rng = np.random.default_rng(semilla)
+    nombres, tamanos = np.unique([pregunta['tema'] for pregunta in preguntas], return_counts=True)
+    cuotas, extras = _cuotas(tamanos, n_preguntas)
+    cuotas[rng.permutation(np.flatnonzero(cuotas < tamanos))[:extras]] += 1
+    plan = {
+        "preguntas": n_preguntas,
+        "temas": {str(nombre): int(cuota) for nombre, cuota in zip(nombres, cuotas)},
+    }
+    if niveles:
+        plan["niveles"] = _niveles_parejos(preguntas, plan["temas"], n_preguntas)
+    return plan
+
+
+def main():
+    from nucleo.puntuacion import NIVELES_QUIZ
+
+    parser = argparse.ArgumentParser(description="Arma formularios de examen que cumplen un plan de temas y niveles.")
+    parser.add_argument("plan", help="plan en JSON: preguntas, temas y niveles")
+    parser.add_argument("salida", help="archivo ZIP de salida")
+    parser.add_argument("--formas", type=int, default=500)
+    parser.add_argument("--niveles", nargs="+", choices=NIVELES_QUIZ, default=list(NIVELES_QUIZ))
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    preguntas = preguntas_de_niveles(args.niveles)
+    try:
+        with open(args.plan, encoding="utf-8") as archivo:
+            try:
+                plan = json.load(archivo)
+            except json.JSONDecodeError as error:
+                raise ValueError(f"Plan ilegible en {args.plan}: {error}") from None
+        lote = Ensamblador(preguntas, plan, args.semilla).armar(args.formas)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        sys.exit(1)
+    datos = exportar_zip(preguntas, lote, args.semilla)
+    with open(args.salida, "wb") as archivo:
+        archivo.write(datos)
+    print(f"{args.formas} formularios de {plan['preguntas']} preguntas en {args.salida} ({len(datos):,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
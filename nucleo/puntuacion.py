@@ -0,0 +1,55 @@
+"""Reglas de puntuación y calificación, sin dependencias de la interfaz."""
+
+NIVELES_QUIZ = ("basico", "intermedio", "avanzado")
+# Dificultad TRI por defecto de las preguntas de cada nivel (ver nucleo.irt)
+DIFICULTAD_NIVEL = {"basico": -1.0, "intermedio": 0.0, "avanzado": 1.0}
+
+
+def calcular_nivel_estudiante(progreso):
+    """Calcula el nivel del estudiante basado en su progreso"""
+    puntos = progreso['puntos_totales']
+    if puntos < 100:
+        return "🌱 Principiante", "#95a5a6"
+    elif puntos < 300:
+        return "📚 Aprendiz", "#3498db"
+    elif puntos < 600:
+        return "🎯 Competente", "#9b59b6"
+    elif puntos < 1000:
+        return "⭐ Avanzado", "#e67e22"
+    else:
+        return "🏆 Experto", "#f39c12"
+
+
+def es_correcta(pregunta, respuesta):
+    """Indica si ``respuesta`` (índice de opción) es la correcta de ``pregunta``"""
+    return respuesta == pregunta['correcta']
+
+
+def calificar(preguntas, respuestas):
+    """Califica una lista de respuestas contra sus preguntas.
+
+    Devuelve un diccionario con ``aciertos`` (un booleano por pregunta),
+    ``total_correctas`` y ``porcentaje`` (0-100).
+    """
+    aciertos = [es_correcta(pregunta, respuesta) for pregunta, respuesta in zip(preguntas, respuestas)]
+    total_correctas = sum(aciertos)
+    return {
+        'aciertos': aciertos,
+        'total_correctas': total_correctas,
+        'porcentaje': total_correctas / len(preguntas) * 100 if preguntas else 0.0,
+    }
+
+
+def nivel_diagnostico(porcentaje):
+    """Nivel estimado a partir del porcentaje de aciertos del diagnóstico"""
+    if porcentaje >= 80:
+        return "⭐ Avanzado"
+    elif porcentaje >= 60:
+        return "🎯 Intermedio"
+    else:
+        return "🌱 Principiante"
+
+
+def puntos_quiz(nivel):
+    """Puntos por respuesta correcta en el quiz adaptativo según el nivel"""
+    return 10 + 5 * NIVELES_QUIZ.index(nivel)
@@ -0,0 +1,224 @@
+"""Repetición espaciada (SM-2) sobre las preguntas del banco y de los conceptos.
+
+Cada estudiante tiene una ``Agenda``: por ítem guarda repeticiones seguidas,
+intervalo en días, factor de facilidad y vencimiento, y mantiene un montículo
+ordenado por vencimiento. ``proxima()`` devuelve el ítem que vence antes en
+O(log n); las entradas que quedan viejas al reprogramar un ítem se descartan
+al llegar a la cima en vez de buscarlas dentro del montículo.
+
+Las claves de los ítems son el ``id`` de las preguntas del banco y
+``"concepto:" + id`` para la pregunta de comprensión de cada concepto.
+
+La agenda se guarda con el resto del progreso en el almacén
+(``nucleo.almacen``) como ``Agenda.datos()``: ítem -> valores de
+``CAMPOS_TARJETA``; el vencimiento y el montículo se reconstruyen al cargarla.
+
+``recalcular_lote`` recalcula los vencimientos de las tarjetas de todos los
+estudiantes a la vez con numpy; ``python -m nucleo.repeticion`` lo aplica como
+trabajo nocturno a las tarjetas del almacén de progreso (o a un archivo CSV o
+Parquet con una tarjeta por fila, ver ``COLUMNAS``).
+"""
+
+import argparse
+import heapq
+import itertools
+import os
+import time
+
+DIA = 86_400
+FACILIDAD_INICIAL = 2.5
+FACILIDAD_MINIMA = 1.3
+INTERVALO_MAXIMO = 365  # días
+PREFIJO_CONCEPTO = "concepto:"
+CAMPOS_TARJETA = ("repeticiones", "intervalo", "facilidad", "ultima_revision")
+COLUMNAS = ("estudiante", "item", *CAMPOS_TARJETA)
+
+
+def calidad_respuesta(acierto):
+    """Calidad SM-2 (0-5) de una respuesta de opción múltiple."""
+    return 4 if acierto else 1
+
+
+def sm2(repeticiones, intervalo, facilidad, calidad):
+    """Un paso de SM-2; devuelve ``(repeticiones, intervalo_dias, facilidad)``."""
+    if calidad >= 3:
+        if repeticiones == 0:
+            intervalo = 1
+        elif repeticiones == 1:
+            intervalo = 6
+        else:
+            intervalo = min(round(intervalo * facilidad), INTERVALO_MAXIMO)
+        repeticiones += 1
+    else:
+        repeticiones, intervalo = 0, 1
+    facilidad = max(FACILIDAD_MINIMA, facilidad + 0.1 - (5 - calidad) * (0.08 + (5 - calidad) * 0.02))
+    return repeticiones, intervalo, facilidad
+
+
+class Tarjeta:
+    __slots__ = ("repeticiones", "intervalo", "facilidad", "ultima_revision", "vence")
+
+    def __init__(self):
+        self.repeticiones = 0
+        self.intervalo = 0
+        self.facilidad = FACILIDAD_INICIAL
+        self.ultima_revision = 0.0
+        self.vence = 0.0
+
+
+class Agenda:
+    """Tarjetas SM-2 de un estudiante con una cola de prioridad por vencimiento."""
+
+    def __init__(self):
+        self.tarjetas = {}
+        self._cola = []
+        self._orden = itertools.count()  # desempata vencimientos iguales sin comparar claves
+        self.cambios = 0  # sube con cada registro o descarte: permite saber si hay que guardarla
+
+    @classmethod
+    def desde_datos(cls, datos, vigente=None):
+        """Agenda a partir de lo que devolvió ``datos()``.
+
+        Si se da ``vigente`` (ítem -> bool, ver ``item_vigente``) se descartan
+        las tarjetas de ítems que ya no están en el contenido.
+        """
+        agenda = cls()
+        for item, valores in datos.items():
+            if vigente is not None and not vigente(item):
+                continue
+            tarjeta = agenda.tarjetas[item] = Tarjeta()
+            tarjeta.repeticiones, tarjeta.intervalo, tarjeta.facilidad, tarjeta.ultima_revision = valores
+            tarjeta.vence = tarjeta.ultima_revision + tarjeta.intervalo * DIA
+            agenda._cola.append((tarjeta.vence, next(agenda._orden), item))
+        heapq.heapify(agenda._cola)
+        return agenda
+
+    def __len__(self):
+        return len(self.tarjetas)
+
+    def __contains__(self, item):
+        return item in self.tarjetas
+
+    def registrar(self, item, calidad, ahora=None):
+        """Aplica una respuesta de calidad ``calidad`` (0-5) y reprograma el ítem."""
+        ahora = time.time() if ahora is None else ahora
+        tarjeta = self.tarjetas.get(item)
+        if tarjeta is None:
+            tarjeta = self.tarjetas[item] = Tarjeta()
+        tarjeta.repeticiones, tarjeta.intervalo, tarjeta.facilidad = sm2(
+            tarjeta.repeticiones, tarjeta.intervalo, tarjeta.facilidad, calidad
+        )
+        tarjeta.ultima_revision = ahora
+        tarjeta.vence = ahora + tarjeta.intervalo * DIA
+        self.cambios += 1
+        heapq.heappush(self._cola, (tarjeta.vence, next(self._orden), item))
+        return tarjeta
+
+    def descartar(self, item):
+        """Quita la tarjeta del ítem; su entrada en el montículo se descarta al llegar a la cima."""
+        if self.tarjetas.pop(item, None) is not None:
+            self.cambios += 1
+
+    def proxima(self):
+        """``(item, vence)`` del ítem que vence antes, o ``None`` si la agenda está vacía."""
+        while self._cola:
+            vence, _, item = self._cola[0]
+            tarjeta = self.tarjetas.get(item)
+            if tarjeta is not None and tarjeta.vence == vence:
+                return item, vence
+            heapq.heappop(self._cola)  # entrada de una programación anterior o de un ítem descartado
+        return None
+
+    def datos(self):
+        """Tarjetas serializables en JSON: ítem -> valores de ``CAMPOS_TARJETA``."""
+        return {
+            item: [t.repeticiones, t.intervalo, t.facilidad, t.ultima_revision]
+            for item, t in self.tarjetas.items()
+        }
+
+    def filas(self, estudiante):
+        """Tarjetas como filas con ``COLUMNAS``, para el trabajo por lotes."""
+        return [(estudiante, item, *valores) for item, valores in self.datos().items()]
+
+
+def item_vigente(item, indices):
+    """Indica si la clave de la agenda sigue existiendo en ``INDICES``.
+
+    Editar el enunciado de una pregunta le da otro ID y renombrar un concepto
+    cambia el suyo: las tarjetas guardadas con la clave anterior quedan huérfanas.
+    """
+    if item.startswith(PREFIJO_CONCEPTO):
+        return item[len(PREFIJO_CONCEPTO):] in indices["conceptos_por_id"]
+    return item in indices["preguntas"]
+
+
+def filas_almacen(ruta):
+    """Tarjetas de todos los estudiantes del almacén de progreso, como filas con ``COLUMNAS``."""
+    from nucleo.almacen import leer_todos
+
+    return [
+        (estudiante, item, *valores)
+        for estudiante, datos in leer_todos(ruta)
+        for item, valores in datos.get("agenda", {}).items()
+    ]
+
+
+def recalcular_lote(ultima_revision, intervalo, fin_del_dia):
+    """Vencimiento de cada tarjeta y si vence antes de ``fin_del_dia``.
+
+    Recibe arreglos con una entrada por tarjeta y aplica la política actual
+    (incluido ``INTERVALO_MAXIMO``) a todas a la vez.
+    """
+    import numpy as np
+
+    dias = np.minimum(np.asarray(intervalo, dtype=np.float64), INTERVALO_MAXIMO)
+    vence = np.asarray(ultima_revision, dtype=np.float64) + dias * DIA
+    return vence, vence <= fin_del_dia
+
+
+def main():
+    from nucleo.almacen import RUTA_PROGRESO
+
+    parser = argparse.ArgumentParser(description="Recalcula los vencimientos de repaso de todos los estudiantes.")
+    parser.add_argument("salida", help="archivo de salida (CSV o Parquet) con 'vence' y 'vence_hoy'")
+    parser.add_argument("--base", default=RUTA_PROGRESO, help=f"base de progreso (por defecto {RUTA_PROGRESO})")
+    parser.add_argument("--tarjetas", help="leer las tarjetas de un CSV o Parquet con las columnas "
+                        + ", ".join(COLUMNAS) + " en vez de la base")
+    parser.add_argument("--ahora", type=float, default=None, help="marca de tiempo de referencia (por defecto, ahora)")
+    args = parser.parse_args()
+
+    import pandas as pd
+
+    if args.tarjetas:
+        if args.tarjetas.endswith(".parquet"):
+            tabla = pd.read_parquet(args.tarjetas, columns=list(COLUMNAS))
+        else:
+            tabla = pd.read_csv(args.tarjetas, usecols=list(COLUMNAS))
+    else:
+        tabla = pd.DataFrame(filas_almacen(args.base), columns=list(COLUMNAS))
+    if tabla.empty:
+        print("No hay tarjetas de repaso.")
+        return
+    ahora = time.time() if args.ahora is None else args.ahora
+    fin_del_dia = (ahora // DIA + 1) * DIA
+    tabla["vence"], tabla["vence_hoy"] = recalcular_lote(
+        tabla["ultima_revision"].to_numpy(), tabla["intervalo"].to_numpy(), fin_del_dia
+    )
+
+    temporal = f"{args.salida}.{os.getpid()}.tmp"
+    if args.salida.endswith(".parquet"):
+        tabla.to_parquet(temporal, index=False)
+    else:
+        tabla.to_csv(temporal, index=False)
+    os.replace(temporal, args.salida)
+
+    por_estudiante = tabla.groupby("estudiante")["vence_hoy"].sum()
+    print(
+        f"{len(tabla):,} tarjetas de {len(por_estudiante):,} estudiantes; "
+        f"{int(tabla['vence_hoy'].sum()):,} vencen hoy "
+        f"(mediana por estudiante: {por_estudiante.median():.0f})"
+    )
+
+
+if __name__ == "__main__":
+    main()
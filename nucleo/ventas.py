@@ -0,0 +1,86 @@
+"""Lectura por bloques de ventas mensuales reales (CSV o Parquet).
+
+El archivo debe tener las columnas ``sku``, ``mes`` y ``ventas`` (una fila por
+SKU y mes). Se lee en bloques de ``TAMANO_BLOQUE`` filas: de cada bloque solo se
+conservan códigos enteros de SKU y mes y las ventas en ``float32``, así que un
+catálogo de decenas de miles de SKU no pasa nunca entero por un DataFrame.
+"""
+
+import numpy as np
+import pandas as pd
+
+COLUMNAS = ("sku", "mes", "ventas")
+TAMANO_BLOQUE = 200_000
+
+
+def _bloques_csv(archivo, tamano_bloque):
+    yield from pd.read_csv(
+        archivo, usecols=list(COLUMNAS), dtype={"sku": str}, chunksize=tamano_bloque
+    )
+
+
+def _bloques_parquet(archivo, tamano_bloque):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("Para leer archivos Parquet se necesita instalar pyarrow") from None
+
+    lector = pq.ParquetFile(archivo)
+    for lote in lector.iter_batches(batch_size=tamano_bloque, columns=list(COLUMNAS)):
+        yield lote.to_pandas()
+
+
+def leer_ventas(archivo, nombre_archivo, tamano_bloque=TAMANO_BLOQUE):
+    """Construye la matriz SKU × mes a partir de un archivo de ventas.
+
+    Devuelve ``(skus, meses, matriz)``: los SKU en orden de aparición, los meses
+    como ``pd.PeriodIndex`` mensual continuo y una matriz ``float32`` de forma
+    ``(len(skus), len(meses))`` con las ventas sumadas (0 en meses sin datos).
+    Lanza ``ValueError`` si el formato o las columnas no son válidos.
+    """
+    extension = nombre_archivo.rsplit(".", 1)[-1].lower()
+    if extension == "csv":
+        bloques = _bloques_csv(archivo, tamano_bloque)
+    elif extension == "parquet":
+        bloques = _bloques_parquet(archivo, tamano_bloque)
+    else:
+        raise ValueError("Formato no soportado: usa un archivo .csv o .parquet")
+
+    indice_sku = {}
+    codigos, periodos, valores = [], [], []
+    try:
+        for bloque in bloques:
+            # Códigos locales del bloque → códigos globales del catálogo
+            locales, unicos = pd.factorize(bloque["sku"].astype(str))
+            globales = np.array(
+                [indice_sku.setdefault(sku, len(indice_sku)) for sku in unicos],
+                dtype=np.int32
+            )
+            fechas = pd.to_datetime(bloque["mes"])
+            codigos.append(globales[locales])
+            periodos.append((fechas.dt.year * 12 + fechas.dt.month - 1).to_numpy(np.int32))
+            valores.append(pd.to_numeric(bloque["ventas"]).fillna(0).to_numpy(np.float32))
+    except (KeyError, ValueError, TypeError) as error:
+        raise ValueError(
+            f"El archivo debe tener las columnas {', '.join(COLUMNAS)} con meses y ventas válidos ({error})"
+        ) from None
+
+    if not indice_sku:
+        raise ValueError("El archivo no contiene filas de ventas")
+
+    codigos = np.concatenate(codigos)
+    periodos = np.concatenate(periodos)
+    valores = np.concatenate(valores)
+
+    primero = periodos.min()
+    n_meses = int(periodos.max() - primero) + 1
+    celdas = codigos.astype(np.int64) * n_meses + (periodos - primero)
+    matriz = np.bincount(
+        celdas, weights=valores, minlength=len(indice_sku) * n_meses
+    ).astype(np.float32).reshape(len(indice_sku), n_meses)
+
+    meses = pd.period_range(
+        pd.Period(year=int(primero) // 12, month=int(primero) % 12 + 1, freq="M"),
+        periods=n_meses, freq="M"
+    )
+    return np.array(list(indice_sku), dtype=object), meses, matriz
@@ -0,0 +1,94 @@
+"""Casos de decisión estratégica."""
+
+import streamlit as st
+
+from comun import actualizar_puntos, marcar_actividad
+from nucleo import CASOS_ESTRATEGICOS
+
+# --- PÁGINA 7: CASOS DE DECISIÓN ---
+
+def pagina_casos_decision():
+    st.markdown("<h1 class='main-header'>⚖️ Casos de Decisión Estratégica</h1>", unsafe_allow_html=True)
+    
+    st.markdown("Analiza casos reales, toma decisiones estratégicas y aprende de las consecuencias.")
+    
+    st.markdown("---")
+    
+    # Selector de caso
+    casos_disponibles = list(CASOS_ESTRATEGICOS.keys())
+    nombres_casos = [CASOS_ESTRATEGICOS[caso]['titulo'] for caso in casos_disponibles]
+    
+    caso_seleccionado_idx = st.selectbox(
+        "📚 Selecciona un caso para analizar:",
+        range(len(nombres_casos)),
+        format_func=lambda x: nombres_casos[x]
+    )
+    
+    caso_key = casos_disponibles[caso_seleccionado_idx]
+    caso = CASOS_ESTRATEGICOS[caso_key]
+    
+    st.markdown(f"### {caso['titulo']}")
+    
+    # Contexto del caso
+    st.markdown("#### 📖 Contexto")
+    st.info(caso['contexto'])
+    
+    st.markdown("---")
+    
+    # Estado del caso
+    caso_state_key = f"caso_{caso_key}"
+    if caso_state_key not in st.session_state:
+        st.session_state[caso_state_key] = {"resuelto": False, "opcion_elegida": None}
+    
+    if not st.session_state[caso_state_key]["resuelto"]:
+        st.markdown("#### 🤔 ¿Qué decisión tomarías?")
+        
+        for i, opcion in enumerate(caso['opciones']):
+            if st.button(
+                f"**Opción {i+1}:** {opcion['texto']}", 
+                key=f"btn_{caso_key}_opcion_{i}",
+                use_container_width=True
+            ):
+                st.session_state[caso_state_key]["resuelto"] = True
+                st.session_state[caso_state_key]["opcion_elegida"] = i
+                
+                # Marcar caso como resuelto
+                marcar_actividad('casos_resueltos', caso_key)
+                
+                # Otorgar puntos
+                if opcion['correcta']:
+                    actualizar_puntos(30)
+                else:
+                    actualizar_puntos(10)  # Puntos por intentar
+                
+                st.rerun()
+    
+    else:
+        # Mostrar resultado
+        opcion_elegida = st.session_state[caso_state_key]["opcion_elegida"]
+        opcion = caso['opciones'][opcion_elegida]
+        
+        st.markdown("---")
+        st.markdown("#### 📊 Resultado de tu Decisión")
+        
+        if opcion['correcta']:
+            st.success(f"✅ **Decisión Estratégica Adecuada**")
+            st.markdown(f"**Opción elegida:** {opcion['texto']}")
+            st.markdown(f"**Consecuencia:** {opcion['consecuencia']}")
+            st.info(f"💡 **Aprendizaje:** {opcion['aprendizaje']}")
+        else:
+            st.warning(f"⚠️ **Decisión con Riesgos Significativos**")
+            st.markdown(f"**Opción elegida:** {opcion['texto']}")
+            st.markdown(f"**Consecuencia:** {opcion['consecuencia']}")
+            st.error(f"❌ **Aprendizaje:** {opcion['aprendizaje']}")
+        
+        st.markdown("---")
+        st.markdown("#### 🎓 Lección Final del Caso")
+        st.info(caso['leccion_final'])
+        
+        if st.button("🔄 Intentar con otro caso", key=f"reset_{caso_key}"):
+            st.session_state[caso_state_key] = {"resuelto": False, "opcion_elegida": None}
+            st.rerun()
+
+
+pagina_casos_decision()
@@ -0,0 +1,101 @@
+"""Biblioteca de conceptos flash por capítulo."""
+
+import streamlit as st
+
+from comun import actualizar_puntos, agenda_repaso, guardar_progreso, marcar_actividad
+from nucleo import CONCEPTOS_CLAVE
+from nucleo.repeticion import PREFIJO_CONCEPTO, calidad_respuesta
+
+# --- FICHA DE CONCEPTO ---
+
+@st.fragment
+def tarjeta_concepto(capitulo, nombre_concepto, datos):
+    """Ficha de un concepto con su pregunta de comprensión.
+
+    Es un fragmento: responder o reintentar re-ejecuta solo esta ficha, no el
+    capítulo completo ni el resto de la aplicación.
+    """
+    with st.expander(f"💡 **{nombre_concepto}**", expanded=False):
+        
+        # Definición
+        st.markdown("<div class='concept-card'>", unsafe_allow_html=True)
+        st.markdown(f"**📝 Definición:**")
+        st.info(datos['definicion'])
+        
+        # Ejemplo
+        st.markdown(f"**🎯 Ejemplo Aplicado:**")
+        st.success(datos['ejemplo'])
+        st.markdown("</div>", unsafe_allow_html=True)
+        
+        # Pregunta de comprensión
+        st.markdown("---")
+        st.markdown("### ❓ Pregunta de Comprensión")
+        
+        pregunta_key = f"pregunta_{capitulo}_{nombre_concepto}"
+        
+        if pregunta_key not in st.session_state:
+            st.session_state[pregunta_key] = {"respondida": False, "correcta": None}
+        
+        if not st.session_state[pregunta_key]["respondida"]:
+            st.markdown(f"**{datos['pregunta']}**")
+            
+            respuesta = st.radio(
+                "Selecciona tu respuesta:",
+                options=range(len(datos['opciones'])),
+                format_func=lambda x, opciones=datos['opciones']: opciones[x],
+                key=f"radio_{pregunta_key}"
+            )
+            
+            if st.button(f"Verificar Respuesta", key=f"btn_{pregunta_key}"):
+                es_correcta = respuesta == datos['respuesta_correcta']
+                st.session_state[pregunta_key]["respondida"] = True
+                st.session_state[pregunta_key]["correcta"] = es_correcta
+                
+                # Marcar concepto como visto y programar su repaso
+                marcar_actividad('conceptos_vistos', nombre_concepto)
+                agenda_repaso().registrar(PREFIJO_CONCEPTO + datos['id'], calidad_respuesta(es_correcta))
+                
+                if es_correcta:
+                    actualizar_puntos(10)
+                # El rerun del fragmento no llega al guardado del final de app.py
+                guardar_progreso()
+                
+                st.rerun(scope="fragment")
+        
+        else:
+            # Mostrar resultado
+            if st.session_state[pregunta_key]["correcta"]:
+                st.success(f"✅ **¡Correcto!** Has ganado 10 puntos.")
+                st.balloons()
+            else:
+                st.error(f"❌ **Incorrecto.** La respuesta correcta es: {datos['opciones'][datos['respuesta_correcta']]}")
+                st.info("💡 Revisa nuevamente la definición y el ejemplo para reforzar el concepto.")
+            
+            if st.button(f"Reintentar", key=f"reintentar_{pregunta_key}"):
+                st.session_state[pregunta_key] = {"respondida": False, "correcta": None}
+                st.rerun(scope="fragment")
+
+
+# --- PÁGINA 4: CONCEPTOS FLASH POR CAPÍTULO ---
+
+def pagina_conceptos_flash():
+    st.markdown("<h1 class='main-header'>📖 Biblioteca de Conceptos Flash</h1>", unsafe_allow_html=True)
+    
+    st.markdown("Explora los conceptos clave organizados por capítulos. Cada ficha incluye definición, ejemplo y pregunta de comprensión.")
+    
+    st.markdown("---")
+    
+    # Selector de capítulo
+    capitulos = list(CONCEPTOS_CLAVE.keys())
+    capitulo_seleccionado = st.selectbox("📚 Selecciona un Capítulo:", capitulos, key="selector_capitulo")
+    
+    st.markdown("---")
+    
+    # Mostrar conceptos del capítulo
+    conceptos_capitulo = CONCEPTOS_CLAVE[capitulo_seleccionado]
+    
+    for nombre_concepto, datos in conceptos_capitulo.items():
+        tarjeta_concepto(capitulo_seleccionado, nombre_concepto, datos)
+
+
+pagina_conceptos_flash()
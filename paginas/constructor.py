@@ -0,0 +1,336 @@
+"""Constructor de estrategia de marca."""
+
+import streamlit as st
+
+from comun import actualizar_puntos, marcar_actividad
+
+# --- PÁGINA 6: CONSTRUCTOR DE MARCA ---
+
+def pagina_constructor_marca():
+    st.markdown("<h1 class='main-header'>🏗️ Constructor de Estrategia de Marca</h1>", unsafe_allow_html=True)
+    
+    st.markdown("Crea tu propia marca paso a paso y construye una estrategia coherente.")
+    
+    st.markdown("---")
+    
+    # Pestañas del proceso
+    tab1, tab2, tab3, tab4, tab5 = st.tabs([
+        "1️⃣ Identidad", 
+        "2️⃣ Estrategia", 
+        "3️⃣ Posicionamiento", 
+        "4️⃣ Arquitectura",
+        "5️⃣ Resumen"
+    ])
+    
+    # TAB 1: IDENTIDAD
+    with tab1:
+        st.markdown("### 🎨 Define la Identidad de tu Marca")
+        
+        nombre_marca = st.text_input(
+            "**Nombre de la Marca:**",
+            value=st.session_state.marca_creada.get('nombre', ''),
+            placeholder="Ej: EcoVida"
+        )
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            categoria = st.selectbox(
+                "**Categoría de Producto:**",
+                ["Tecnología", "Alimentos", "Moda", "Salud", "Educación", "Entretenimiento", "Servicios"],
+                index=["Tecnología", "Alimentos", "Moda", "Salud", "Educación", "Entretenimiento", "Servicios"].index(
+                    st.session_state.marca_creada.get('categoria', 'Tecnología')
+                )
+            )
+        
+        with col2:
+            proposito = st.text_input(
+                "**Propósito de la Marca:**",
+                value=st.session_state.marca_creada.get('proposito', ''),
+                placeholder="Ej: Mejorar la salud del planeta"
+            )
+        
+        valores = st.multiselect(
+            "**Valores de Marca (selecciona 3-5):**",
+            ["Innovación", "Sostenibilidad", "Calidad", "Accesibilidad", "Transparencia", 
+             "Experiencia", "Tradición", "Tecnología", "Responsabilidad Social", "Autenticidad"],
+            default=st.session_state.marca_creada.get('valores', [])
+        )
+        
+        personalidad = st.text_area(
+            "**Personalidad de Marca (¿Cómo hablaría tu marca?):**",
+            value=st.session_state.marca_creada.get('personalidad', ''),
+            placeholder="Ej: Cercana, inspiradora, comprometida con el cambio..."
+        )
+        
+        if st.button("💾 Guardar Identidad", type="primary"):
+            st.session_state.marca_creada.update({
+                'nombre': nombre_marca,
+                'categoria': categoria,
+                'proposito': proposito,
+                'valores': valores,
+                'personalidad': personalidad
+            })
+            st.success("✅ Identidad guardada correctamente!")
+            actualizar_puntos(20)
+    
+    # TAB 2: ESTRATEGIA
+    with tab2:
+        st.markdown("### 🎯 Define tu Estrategia de Marca")
+        
+        if 'nombre' not in st.session_state.marca_creada:
+            st.warning("⚠️ Primero completa la Identidad de Marca en la pestaña anterior.")
+        else:
+            tipo_estrategia = st.radio(
+                "**Tipo de Estrategia de Marca:**",
+                [
+                    "Marca Individual (cada producto tiene su propia marca)",
+                    "Marca Corporativa (un solo nombre para todos los productos)",
+                    "Marca Mixta (combinación de ambas)"
+                ],
+                index=[
+                    "Marca Individual (cada producto tiene su propia marca)",
+                    "Marca Corporativa (un solo nombre para todos los productos)",
+                    "Marca Mixta (combinación de ambas)"
+                ].index(st.session_state.marca_creada.get('tipo_estrategia', 
+                    "Marca Individual (cada producto tiene su propia marca)")) if 'tipo_estrategia' in st.session_state.marca_creada else 0
+            )
+            
+            st.info(f"""
+            **📚 Explicación:**
+            - **Marca Individual:** Cada producto tiene su propia identidad (ej: P&G con Pampers, Ariel, Gillette)
+            - **Marca Corporativa:** Un nombre unifica todo (ej: Samsung, Sony)
+            - **Marca Mixta:** Combina marca corporativa con sub-marcas (ej: Nestlé KitKat, Nestlé Nespresso)
+            """)
+            
+            considera_extension = st.checkbox(
+                "¿Consideras extensión de marca a futuro?",
+                value=st.session_state.marca_creada.get('extension', False)
+            )
+            
+            if considera_extension:
+                categorias_extension = st.multiselect(
+                    "**¿A qué categorías extenderías la marca?**",
+                    ["Productos complementarios", "Nueva categoría relacionada", "Servicios asociados", 
+                     "Mercado premium", "Mercado masivo"],
+                    default=st.session_state.marca_creada.get('categorias_extension', [])
+                )
+            else:
+                categorias_extension = []
+            
+            considera_cobranding = st.checkbox(
+                "¿Considerarías alianzas de Co-branding?",
+                value=st.session_state.marca_creada.get('cobranding', False)
+            )
+            
+            if st.button("💾 Guardar Estrategia", type="primary"):
+                st.session_state.marca_creada.update({
+                    'tipo_estrategia': tipo_estrategia,
+                    'extension': considera_extension,
+                    'categorias_extension': categorias_extension,
+                    'cobranding': considera_cobranding
+                })
+                st.success("✅ Estrategia guardada correctamente!")
+                actualizar_puntos(20)
+    
+    # TAB 3: POSICIONAMIENTO
+    with tab3:
+        st.markdown("### 🎯 Construye tu Declaración de Posicionamiento")
+        
+        if 'nombre' not in st.session_state.marca_creada:
+            st.warning("⚠️ Primero completa la Identidad de Marca.")
+        else:
+            st.info("""
+            **📐 Estructura de una Declaración de Posicionamiento:**
+            
+            *"Para [PÚBLICO OBJETIVO] que [NECESIDAD/PROBLEMA], [MARCA] es [CATEGORÍA] 
+            que [DIFERENCIACIÓN/BENEFICIO ÚNICO] a diferencia de [COMPETENCIA] porque [RAZÓN PARA CREER]."*
+            """)
+            
+            publico = st.text_input(
+                "**Público Objetivo:**",
+                value=st.session_state.marca_creada.get('publico', ''),
+                placeholder="Ej: jóvenes profesionales de 25-35 años"
+            )
+            
+            necesidad = st.text_input(
+                "**Necesidad/Problema:**",
+                value=st.session_state.marca_creada.get('necesidad', ''),
+                placeholder="Ej: buscan productos sostenibles sin sacrificar calidad"
+            )
+            
+            diferenciacion = st.text_area(
+                "**Diferenciación/Beneficio Único:**",
+                value=st.session_state.marca_creada.get('diferenciacion', ''),
+                placeholder="Ej: combina tecnología de punta con materiales 100% reciclados"
+            )
+            
+            razon_creer = st.text_area(
+                "**Razón para Creer:**",
+                value=st.session_state.marca_creada.get('razon_creer', ''),
+                placeholder="Ej: certificación ISO 14001 y transparencia total en la cadena de suministro"
+            )
+            
+            # Generar declaración automáticamente
+            if publico and necesidad and diferenciacion:
+                nombre = st.session_state.marca_creada.get('nombre', '[MARCA]')
+                categoria = st.session_state.marca_creada.get('categoria', '[CATEGORÍA]')
+                
+                declaracion = f"""
+                **Tu Declaración de Posicionamiento:**
+                
+                *"Para {publico} que {necesidad}, {nombre} es {categoria} 
+                que {diferenciacion}{' porque ' + razon_creer if razon_creer else ''}."*
+                """
+                
+                st.success(declaracion)
+            
+            if st.button("💾 Guardar Posicionamiento", type="primary"):
+                st.session_state.marca_creada.update({
+                    'publico': publico,
+                    'necesidad': necesidad,
+                    'diferenciacion': diferenciacion,
+                    'razon_creer': razon_creer
+                })
+                st.success("✅ Posicionamiento guardado correctamente!")
+                actualizar_puntos(25)
+    
+    # TAB 4: ARQUITECTURA
+    with tab4:
+        st.markdown("### 🏛️ Define la Arquitectura de Marca")
+        
+        if 'nombre' not in st.session_state.marca_creada:
+            st.warning("⚠️ Primero completa la Identidad de Marca.")
+        else:
+            st.info("""
+            **📚 Tipos de Arquitectura de Marca:**
+            - **Monolítica (Branded House):** Una marca única para todo (ej: FedEx)
+            - **Respaldada (Endorsed):** Sub-marcas respaldadas por marca matriz (ej: Nestlé KitKat)
+            - **Independiente (House of Brands):** Marcas totalmente independientes (ej: P&G)
+            """)
+            
+            arquitectura = st.selectbox(
+                "**Selecciona el tipo de Arquitectura:**",
+                ["Monolítica (Branded House)", "Respaldada (Endorsed)", "Independiente (House of Brands)"],
+                index=["Monolítica (Branded House)", "Respaldada (Endorsed)", "Independiente (House of Brands)"].index(
+                    st.session_state.marca_creada.get('arquitectura', "Monolítica (Branded House)")
+                ) if 'arquitectura' in st.session_state.marca_creada else 0
+            )
+            
+            # Validación de coherencia
+            tipo_estrategia = st.session_state.marca_creada.get('tipo_estrategia', '')
+            
+            coherencia = True
+            mensaje_coherencia = ""
+            
+            if "Individual" in tipo_estrategia and arquitectura == "Monolítica (Branded House)":
+                coherencia = False
+                mensaje_coherencia = "⚠️ **Incoherencia detectada:** Seleccionaste estrategia de Marca Individual pero arquitectura Monolítica. Considera revisar tu estrategia."
+            
+            if "Corporativa" in tipo_estrategia and arquitectura == "Independiente (House of Brands)":
+                coherencia = False
+                mensaje_coherencia = "⚠️ **Incoherencia detectada:** Seleccionaste estrategia de Marca Corporativa pero arquitectura Independiente. Considera revisar tu estrategia."
+            
+            if not coherencia:
+                st.warning(mensaje_coherencia)
+            else:
+                st.success("✅ Tu arquitectura es coherente con la estrategia de marca seleccionada.")
+            
+            num_lineas = st.slider(
+                "**¿Cuántas líneas de producto planeas gestionar?**",
+                min_value=1, max_value=10, 
+                value=st.session_state.marca_creada.get('num_lineas', 3)
+            )
+            
+            if st.button("💾 Guardar Arquitectura", type="primary"):
+                st.session_state.marca_creada.update({
+                    'arquitectura': arquitectura,
+                    'num_lineas': num_lineas,
+                    'coherencia_arquitectura': coherencia
+                })
+                st.success("✅ Arquitectura guardada correctamente!")
+                actualizar_puntos(25)
+    
+    # TAB 5: RESUMEN
+    with tab5:
+        st.markdown("### 📋 Resumen de tu Estrategia de Marca")
+        
+        if 'nombre' not in st.session_state.marca_creada:
+            st.warning("⚠️ Completa todas las secciones anteriores para ver el resumen.")
+        else:
+            marca = st.session_state.marca_creada
+            
+            # Tarjeta visual del resumen
+            st.markdown(f"""
+            <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
+                        padding: 2rem; border-radius: 15px; color: white; margin-bottom: 2rem;'>
+                <h1 style='text-align: center; margin: 0;'>{marca.get('nombre', 'Tu Marca')}</h1>
+                <p style='text-align: center; font-size: 1.2rem; margin-top: 0.5rem;'>{marca.get('proposito', '')}</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("#### 🎨 Identidad")
+                st.markdown(f"**Categoría:** {marca.get('categoria', 'N/A')}")
+                st.markdown(f"**Valores:** {', '.join(marca.get('valores', []))}")
+                st.markdown(f"**Personalidad:** {marca.get('personalidad', 'N/A')}")
+                
+                st.markdown("#### 🎯 Estrategia")
+                st.markdown(f"**Tipo:** {marca.get('tipo_estrategia', 'N/A').split('(')[0]}")
+                st.markdown(f"**Extensión planificada:** {'Sí' if marca.get('extension') else 'No'}")
+                if marca.get('extension'):
+                    st.markdown(f"**Categorías de extensión:** {', '.join(marca.get('categorias_extension', []))}")
+            
+            with col2:
+                st.markdown("#### 🏛️ Arquitectura")
+                st.markdown(f"**Tipo:** {marca.get('arquitectura', 'N/A').split('(')[0]}")
+                st.markdown(f"**Líneas de producto:** {marca.get('num_lineas', 'N/A')}")
+                st.markdown(f"**Coherencia estratégica:** {'✅ Coherente' if marca.get('coherencia_arquitectura', True) else '⚠️ Revisar'}")
+            
+            st.markdown("---")
+            st.markdown("#### 📐 Declaración de Posicionamiento")
+            
+            if marca.get('publico') and marca.get('necesidad') and marca.get('diferenciacion'):
+                declaracion_final = f"""
+                *"Para {marca.get('publico')} que {marca.get('necesidad')}, 
+                {marca.get('nombre')} es {marca.get('categoria')} que {marca.get('diferenciacion')}
+                {' porque ' + marca.get('razon_creer') if marca.get('razon_creer') else ''}."*
+                """
+                st.info(declaracion_final)
+            else:
+                st.warning("⚠️ Completa la sección de Posicionamiento para ver tu declaración.")
+            
+            st.markdown("---")
+            
+            # Evaluación de completitud
+            campos_completados = sum([
+                bool(marca.get('nombre')),
+                bool(marca.get('proposito')),
+                bool(marca.get('valores')),
+                bool(marca.get('personalidad')),
+                bool(marca.get('tipo_estrategia')),
+                bool(marca.get('arquitectura')),
+                bool(marca.get('publico')),
+                bool(marca.get('diferenciacion'))
+            ])
+            
+            completitud = (campos_completados / 8) * 100
+            
+            st.markdown(f"**Completitud de tu estrategia:** {completitud:.0f}%")
+            st.progress(completitud / 100)
+            
+            if completitud == 100:
+                st.success("🎉 ¡Felicitaciones! Has completado tu estrategia de marca de forma integral.")
+                
+                if st.button("🎓 Guardar como Caso de Estudio", type="primary"):
+                    actualizar_puntos(50)
+                    marcar_actividad('casos_resueltos', 'constructor_marca')
+                    st.balloons()
+                    st.success("✅ Tu marca ha sido guardada. ¡Has ganado 50 puntos!")
+            else:
+                st.info("💡 Completa todas las secciones para obtener tu certificación de estrategia.")
+
+
+pagina_constructor_marca()
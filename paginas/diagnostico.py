@@ -0,0 +1,76 @@
+"""Diagnóstico inicial de conocimientos."""
+
+import streamlit as st
+
+from comun import actualizar_puntos
+from nucleo import PREGUNTAS_DIAGNOSTICO
+from nucleo.puntuacion import calificar, nivel_diagnostico
+
+# --- PÁGINA 2: DIAGNÓSTICO ---
+
+def pagina_diagnostico():
+    st.markdown("<h1 class='main-header'>🔍 Diagnóstico Inicial</h1>", unsafe_allow_html=True)
+    st.markdown("**Responde 5 preguntas para identificar tu nivel actual de conocimiento.**")
+    
+    st.markdown("---")
+    
+    # Formulario de diagnóstico
+    with st.form("diagnostico_form"):
+        respuestas = {}
+        
+        for i, item in enumerate(PREGUNTAS_DIAGNOSTICO):
+            st.markdown(f"**Pregunta {i+1}:** {item['pregunta']}")
+            respuestas[i] = st.radio(
+                f"Selecciona tu respuesta:",
+                options=range(len(item['opciones'])),
+                format_func=lambda x, opciones=item['opciones']: opciones[x],
+                key=f"diag_{i}"
+            )
+            st.markdown("---")
+        
+        submitted = st.form_submit_button("📊 Ver Resultados", type="primary", use_container_width=True)
+    
+    # IMPORTANTE: El botón de volver debe estar FUERA del formulario
+    if submitted:
+        # Evaluar respuestas
+        resultado = calificar(PREGUNTAS_DIAGNOSTICO, list(respuestas.values()))
+        correctas_dict = dict(enumerate(resultado['aciertos']))
+        total_correctas = resultado['total_correctas']
+        
+        st.session_state.respuestas_diagnostico = correctas_dict
+        st.session_state.diagnostico_completado = True
+        
+        # Mostrar resultados
+        st.markdown("### 📊 Resultados del Diagnóstico")
+        
+        porcentaje = resultado['porcentaje']
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Respuestas Correctas", f"{total_correctas}/{len(PREGUNTAS_DIAGNOSTICO)}")
+        with col2:
+            st.metric("Porcentaje", f"{porcentaje:.0f}%")
+        with col3:
+            st.metric("Nivel Estimado", nivel_diagnostico(porcentaje))
+        
+        # Detalle por pregunta
+        with st.expander("Ver detalle de respuestas"):
+            for i, item in enumerate(PREGUNTAS_DIAGNOSTICO):
+                if correctas_dict[i]:
+                    st.success(f"✅ Pregunta {i+1}: Correcta")
+                else:
+                    st.error(f"❌ Pregunta {i+1}: Incorrecta")
+                    st.info(f"**Respuesta correcta:** {item['opciones'][item['correcta']]}")
+        
+        # Otorgar puntos
+        actualizar_puntos(total_correctas * 10)
+        
+        st.success(f"🎉 ¡Diagnóstico completado! Has ganado {total_correctas * 10} puntos.")
+    
+    # Botón de volver FUERA del formulario
+    st.markdown("---")
+    if st.button("🏠 Volver al Inicio", key="volver_inicio_diagnostico"):
+        st.switch_page("paginas/inicio.py")
+
+
+pagina_diagnostico()
@@ -0,0 +1,96 @@
+"""Inicio: bienvenida, progreso y recomendaciones del diagnóstico."""
+
+import streamlit as st
+
+from comun import mostrar_progreso_global
+
+# --- PÁGINA 1: INICIO Y DIAGNÓSTICO ---
+
+def pagina_inicio():
+    st.markdown("<h1 class='main-header'>🎯 Estrategia de Producto y Marca</h1>", unsafe_allow_html=True)
+    st.markdown("<p style='text-align:center; font-size:1.2rem; color:#666;'>Plataforma Interactiva de Aprendizaje</p>", unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Mostrar progreso si ya hay datos
+    if st.session_state.progreso['puntos_totales'] > 0:
+        with st.expander("📊 Ver Mi Progreso", expanded=False):
+            mostrar_progreso_global()
+        st.markdown("---")
+    
+    # Bienvenida
+    st.markdown("""
+    ### 👋 ¡Bienvenido a tu Estación de Aprendizaje!
+    
+    Esta plataforma te ayudará a dominar los conceptos fundamentales de **Estrategia de Producto y Marca** 
+    desde la perspectiva del **Marketing 6.0**.
+    
+    #### 🎓 ¿Qué aprenderás?
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        **📚 Conceptos Fundamentales:**
+        - Marketing 6.0 y creación de valor
+        - Niveles y clasificación del producto
+        - Ciclo de vida del producto (CVP)
+        - Marca como activo estratégico
+        - Identidad, imagen y equidad de marca
+        """)
+    
+    with col2:
+        st.markdown("""
+        **🎯 Aplicaciones Estratégicas:**
+        - Estrategias de marca y extensión
+        - Posicionamiento efectivo
+        - Innovación y desarrollo
+        - Aspectos legales (caso Frisby)
+        - Sostenibilidad y Marketing Real
+        """)
+    
+    st.markdown("---")
+    
+    # Diagnóstico inicial
+    if not st.session_state.diagnostico_completado:
+        st.markdown("### 🔍 Diagnóstico Inicial")
+        st.info("💡 **Comienza con un breve test** para identificar tus áreas de fortaleza y oportunidades de mejora.")
+        
+        if st.button("🚀 Iniciar Diagnóstico", type="primary", use_container_width=True):
+            st.switch_page("paginas/diagnostico.py")
+    else:
+        st.success("✅ **Diagnóstico completado.** Explora las secciones en el menú lateral.")
+        
+        # Recomendaciones personalizadas
+        st.markdown("### 🎯 Recomendaciones Personalizadas")
+        
+        resultados = st.session_state.respuestas_diagnostico
+        total = len(resultados)
+        correctas = sum(resultados.values())
+        porcentaje = (correctas / total * 100) if total > 0 else 0
+        
+        if porcentaje < 40:
+            st.warning("""
+            📚 **Comienza con los Fundamentos:**
+            - Revisa la sección "Conceptos por Capítulo"
+            - Comienza por Cap 1-3 para construir bases sólidas
+            - Practica con el Quiz en modo básico
+            """)
+        elif porcentaje < 70:
+            st.info("""
+            🎯 **Refuerza y Profundiza:**
+            - Explora el Simulador de CVP
+            - Practica casos de decisión estratégica
+            - Usa el Laboratorio de Conceptos para diferencias clave
+            """)
+        else:
+            st.success("""
+            ⭐ **¡Excelente base! Nivel Avanzado:**
+            - Prueba el Quiz Adaptativo en modo avanzado
+            - Resuelve todos los casos estratégicos
+            - Crea tu marca en el Constructor
+            """)
+
+
+pagina_inicio()
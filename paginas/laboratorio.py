@@ -0,0 +1,84 @@
+"""Laboratorio de conceptos que suelen confundirse."""
+
+import streamlit as st
+
+from comun import actualizar_puntos, marcar_actividad
+from nucleo import COMPARACIONES_LABORATORIO
+
+# --- PÁGINA 8: LABORATORIO DE CONCEPTOS ---
+
+def pagina_laboratorio_conceptos():
+    st.markdown("<h1 class='main-header'>🔬 Laboratorio de Conceptos</h1>", unsafe_allow_html=True)
+    
+    st.markdown("Comprende las diferencias clave entre conceptos que suelen confundirse.")
+    
+    st.markdown("---")
+    
+    # Selector de comparación
+    comparacion_seleccionada = st.selectbox(
+        "🔍 Selecciona una comparación:",
+        list(COMPARACIONES_LABORATORIO.keys())
+    )
+    
+    datos = COMPARACIONES_LABORATORIO[comparacion_seleccionada]
+    
+    st.markdown(f"### {comparacion_seleccionada}")
+    
+    # Crear tabla comparativa
+    st.table(datos)
+    
+    st.markdown("---")
+    
+    # Quiz de diferenciación
+    st.markdown("#### ❓ Quiz de Diferenciación")
+    
+    quiz_lab_key = f"quiz_lab_{comparacion_seleccionada}"
+    
+    if quiz_lab_key not in st.session_state:
+        st.session_state[quiz_lab_key] = False
+    
+    if not st.session_state[quiz_lab_key]:
+        # Generar pregunta según la comparación
+        if comparacion_seleccionada == "Identidad vs Imagen vs Reputación":
+            st.markdown("**¿Cuál concepto está más bajo el control de la empresa?**")
+            opciones_quiz = ["Identidad de Marca", "Imagen de Marca", "Reputación de Marca"]
+            correcta_quiz = 0
+            explicacion_quiz = "La identidad es construcción interna y deliberada de la empresa, mientras que imagen y reputación dependen de percepciones externas."
+        
+        elif comparacion_seleccionada == "Producto Básico vs Real vs Aumentado":
+            st.markdown("**¿En qué nivel del producto se encuentran los servicios postventa?**")
+            opciones_quiz = ["Producto Básico", "Producto Real", "Producto Aumentado"]
+            correcta_quiz = 2
+            explicacion_quiz = "Los servicios postventa son parte del producto aumentado, que incluye beneficios adicionales que complementan la oferta."
+        
+        elif comparacion_seleccionada == "Extensión de Línea vs Extensión de Marca":
+            st.markdown("**Dove lanzando shampoo después de vender jabón es un ejemplo de:**")
+            opciones_quiz = ["Extensión de Línea", "Extensión de Marca", "Co-branding", "Marca Individual"]
+            correcta_quiz = 1
+            explicacion_quiz = "Es extensión de marca porque Dove entra a una NUEVA categoría (cuidado capilar) usando su marca existente de jabones."
+        
+        else:  # Marca Individual vs Corporativa
+            st.markdown("**P&G gestionando Pampers, Ariel y Gillette como marcas separadas es un ejemplo de:**")
+            opciones_quiz = ["Marca Corporativa", "Marca Individual", "Extensión de Marca", "Co-branding"]
+            correcta_quiz = 1
+            explicacion_quiz = "P&G usa estrategia de marcas individuales: cada producto tiene su propia identidad independiente."
+        
+        respuesta_lab = st.radio(
+            "Tu respuesta:",
+            options=range(len(opciones_quiz)),
+            format_func=lambda x: opciones_quiz[x],
+            key=f"radio_{quiz_lab_key}"
+        )
+        
+        if st.button("Verificar", key=f"btn_{quiz_lab_key}"):
+            if respuesta_lab == correcta_quiz:
+                st.success(f"✅ ¡Correcto! {explicacion_quiz}")
+                actualizar_puntos(15)
+                st.session_state[quiz_lab_key] = True
+                marcar_actividad('quizzes_completados', quiz_lab_key)
+            else:
+                st.error(f"❌ Incorrecto. {explicacion_quiz}")
+                st.info("💡 Revisa nuevamente la tabla comparativa.")
+
+
+pagina_laboratorio_conceptos()
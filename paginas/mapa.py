@@ -0,0 +1,55 @@
+"""Mapa conceptual interactivo del curso."""
+
+import streamlit as st
+
+from comun import actividad_hecha, contar_actividades, marcar_actividad
+from nucleo import CATEGORIAS_MAPA, INDICES
+
+# --- PÁGINA 3: MAPA CONCEPTUAL ---
+
+def pagina_mapa_conceptual():
+    st.markdown("<h1 class='main-header'>🧭 Mapa Conceptual Interactivo</h1>", unsafe_allow_html=True)
+    
+    st.info("🗺️ **Visualiza la estructura completa del curso** y explora cada concepto.")
+    
+    st.markdown("---")
+    
+    # Crear mapa visual con expanders
+    st.markdown("### 📚 Estructura del Conocimiento")
+    
+    # Mostrar categorías con conceptos
+    for i, (categoria, conceptos) in enumerate(CATEGORIAS_MAPA.items()):
+        with st.expander(f"**{categoria}**", expanded=(i==0)):
+            cols = st.columns(len(conceptos))
+            for j, concepto in enumerate(conceptos):
+                with cols[j]:
+                    # Verificar si fue visto
+                    visto = actividad_hecha('conceptos_vistos', concepto)
+                    icono = "✅" if visto else "⭕"
+                    
+                    if st.button(f"{icono} {concepto}", key=f"mapa_{concepto}", use_container_width=True):
+                        st.session_state.concepto_seleccionado = concepto
+                        marcar_actividad('conceptos_vistos', concepto)
+    
+    # Mostrar concepto seleccionado
+    if 'concepto_seleccionado' in st.session_state:
+        st.markdown("---")
+        st.markdown(f"### 💡 {st.session_state.concepto_seleccionado}")
+        
+        # El paquete enlaza cada tema con su concepto (None si aún no tiene ficha)
+        datos = INDICES['temas_mapa'][st.session_state.concepto_seleccionado]
+        if datos is not None:
+            st.markdown(f"**Definición:** {datos['definicion']}")
+            st.markdown(f"**Ejemplo:** {datos['ejemplo']}")
+    
+    # Indicador de progreso
+    st.markdown("---")
+    total_conceptos = len(INDICES['temas_mapa'])
+    vistos = contar_actividades('conceptos_vistos')
+    progreso_pct = (vistos / total_conceptos) * 100
+    
+    st.markdown(f"**Progreso de exploración:** {vistos}/{total_conceptos} conceptos")
+    st.progress(progreso_pct / 100)
+
+
+pagina_mapa_conceptual()
@@ -0,0 +1,108 @@
+"""Métricas: panel de administración con la latencia por página en vivo."""
+
+import hmac
+import os
+
+import streamlit as st
+import pandas as pd
+
+from metricas import REGISTRO
+
+# --- ACCESO DE ADMINISTRACIÓN ---
+
+def clave_admin():
+    """Clave del panel: variable MARKETING_CLAVE_ADMIN o ``clave_admin`` en st.secrets"""
+    clave = os.environ.get("MARKETING_CLAVE_ADMIN")
+    if clave:
+        return clave
+    try:
+        return st.secrets.get("clave_admin")
+    except FileNotFoundError:
+        return None
+
+def pedir_clave():
+    clave = clave_admin()
+    if not clave:
+        st.error("🔒 El panel de métricas está deshabilitado: no hay una clave de administración configurada.")
+        return
+    
+    intento = st.text_input("🔑 Clave de administración:", type="password")
+    if intento:
+        if hmac.compare_digest(intento.encode(), clave.encode()):
+            st.session_state.es_admin = True
+            st.rerun()
+        else:
+            st.error("❌ Clave incorrecta.")
+
+# --- PANEL EN VIVO ---
+
+@st.fragment(run_every=5)
+def panel_metricas():
+    resumen = REGISTRO.resumen()
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Sesiones activas (5 min)", resumen['sesiones_activas'])
+    with col2:
+        st.metric("Sesiones desde el arranque", resumen['sesiones_totales'])
+    with col3:
+        st.metric("Reruns registrados", sum(datos['reruns'] for datos in resumen['paginas'].values()))
+    
+    if not resumen['paginas']:
+        st.info("Aún no hay reruns registrados.")
+        return
+    
+    tabla = pd.DataFrame([
+        {
+            "Página": pagina,
+            "Reruns": datos['reruns'],
+            "p50 (ms)": datos['percentiles_ms']['p50'],
+            "p95 (ms)": datos['percentiles_ms']['p95'],
+            "p99 (ms)": datos['percentiles_ms']['p99'],
+            "Elementos por rerun": datos['elementos_por_rerun'],
+        }
+        for pagina, datos in resumen['paginas'].items()
+    ]).sort_values("p95 (ms)", ascending=False)
+    
+    st.dataframe(
+        tabla,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            columna: st.column_config.NumberColumn(format="%.1f")
+            for columna in ("p50 (ms)", "p95 (ms)", "p99 (ms)", "Elementos por rerun")
+        }
+    )
+    st.bar_chart(tabla.set_index("Página")[["p50 (ms)", "p95 (ms)", "p99 (ms)"]], stack=False)
+    
+    if REGISTRO.ruta_exportacion:
+        st.caption(f"📤 Exportando a `{REGISTRO.ruta_exportacion}` cada pocos segundos.")
+    else:
+        st.caption("📤 Define la variable MARKETING_METRICAS para exportar a un archivo (JSON o Prometheus).")
+    
+    with st.expander("Ver formato Prometheus"):
+        st.code(REGISTRO.prometheus(), language="text")
+
+# --- PÁGINA: MÉTRICAS ---
+
+def pagina_metricas():
+    st.markdown("<h1 class='main-header'>⏱️ Métricas de Rendimiento</h1>", unsafe_allow_html=True)
+    
+    if not st.session_state.get("es_admin"):
+        pedir_clave()
+        return
+    
+    st.markdown("Latencia de cada rerun por página, agregada entre todas las sesiones de este proceso. Se actualiza cada 5 segundos.")
+    
+    st.toggle(
+        "🔬 Perfilar la próxima página que abra",
+        value=st.session_state.get("perfilar_siguiente", False),
+        key="interruptor_perfil",
+        on_change=lambda: st.session_state.update(perfilar_siguiente=st.session_state.interruptor_perfil),
+        help="Ejecuta la siguiente página con cProfile y tracemalloc, guarda los archivos en disco y muestra el resumen en la barra lateral. También se activa con ?perfilar=1 en la URL."
+    )
+    
+    panel_metricas()
+
+
+pagina_metricas()
@@ -0,0 +1,135 @@
+"""Mi Progreso: avance por área, autoevaluación y certificado."""
+
+import streamlit as st
+import plotly.graph_objects as go
+from datetime import datetime
+
+from comun import actualizar_puntos, calcular_nivel_estudiante, contar_actividades, mostrar_progreso_global
+from nucleo import AREAS_CONOCIMIENTO, CASOS_ESTRATEGICOS
+
+# --- PÁGINA 11: MI PROGRESO ---
+
+def pagina_mi_progreso():
+    st.markdown("<h1 class='main-header'>🎓 Mi Progreso</h1>", unsafe_allow_html=True)
+    
+    mostrar_progreso_global()
+    
+    st.markdown("---")
+    
+    # Gráfico de progreso por área
+    st.markdown("### 📊 Progreso por Área de Conocimiento")
+    
+    por_area = st.session_state.progreso['conceptos_por_area']
+    areas = {area: por_area.get(area, 0) for area in AREAS_CONOCIMIENTO}
+    
+    fig_areas = go.Figure(data=[
+        go.Bar(
+            x=list(areas.keys()),
+            y=list(areas.values()),
+            marker=dict(color='#3498db'),
+            text=list(areas.values()),
+            textposition='auto'
+        )
+    ])
+    
+    fig_areas.update_layout(
+        title="Conceptos Vistos por Área",
+        xaxis_title="Área de Conocimiento",
+        yaxis_title="Conceptos Vistos",
+        height=400
+    )
+    
+    st.plotly_chart(fig_areas, use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Matriz de autoevaluación
+    st.markdown("### ✅ Matriz de Autoevaluación")
+    st.info("💡 Marca los conceptos que puedes explicar con tus propias palabras.")
+    
+    conceptos_clave_lista = [
+        "Marketing 6.0", "Creación de Valor", "Niveles del Producto", 
+        "Ciclo de Vida del Producto", "Identidad vs Imagen de Marca",
+        "Equidad de Marca", "Extensión de Marca", "Posicionamiento",
+        "Co-branding", "Producto Verde", "Caso Frisby"
+    ]
+    
+    if 'autoevaluacion' not in st.session_state:
+        st.session_state.autoevaluacion = {concepto: False for concepto in conceptos_clave_lista}
+    
+    col1, col2 = st.columns(2)
+    
+    for i, concepto in enumerate(conceptos_clave_lista):
+        with col1 if i % 2 == 0 else col2:
+            st.session_state.autoevaluacion[concepto] = st.checkbox(
+                concepto,
+                value=st.session_state.autoevaluacion[concepto],
+                key=f"auto_{concepto}"
+            )
+    
+    dominio = sum(st.session_state.autoevaluacion.values())
+    porcentaje_dominio = (dominio / len(conceptos_clave_lista)) * 100
+    
+    st.markdown(f"**Dominio autoevaluado:** {dominio}/{len(conceptos_clave_lista)} conceptos ({porcentaje_dominio:.0f}%)")
+    st.progress(porcentaje_dominio / 100)
+    
+    st.markdown("---")
+    
+    # Certificado de dominio
+    st.markdown("### 🏆 Certificado de Dominio")
+    
+    progreso = st.session_state.progreso
+    total_actividades = len(conceptos_clave_lista) + len(CASOS_ESTRATEGICOS) + 10  # Estimado
+    completadas = contar_actividades()
+    porcentaje_actividades = (completadas / total_actividades) * 100
+    
+    if porcentaje_actividades >= 70:
+        st.success("""
+        🎉 **¡Felicitaciones!** Has alcanzado el nivel mínimo para el certificado.
+        
+        **Requisitos cumplidos:**
+        - ✅ 70%+ de actividades completadas
+        - ✅ Demostración de dominio conceptual
+        """)
+        
+        if st.button("📜 Generar Certificado", type="primary"):
+            st.markdown("---")
+            
+            # Certificado visual
+            nivel_final, color_nivel = calcular_nivel_estudiante(progreso)
+            
+            st.markdown(f"""
+            <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
+                        padding: 3rem; border-radius: 15px; color: white; text-align: center;'>
+                <h1 style='font-size: 2.5rem; margin: 0;'>🎓 CERTIFICADO DE DOMINIO</h1>
+                <h2 style='margin-top: 2rem;'>Estrategia de Producto y Marca</h2>
+                <p style='font-size: 1.2rem; margin-top: 2rem;'>
+                    Este certificado se otorga en reconocimiento al dominio de los conceptos fundamentales
+                    y aplicaciones estratégicas del Marketing 6.0
+                </p>
+                <h3 style='margin-top: 2rem; font-size: 1.8rem;'>Nivel Alcanzado: {nivel_final}</h3>
+                <p style='margin-top: 1rem;'>Puntos Totales: {progreso['puntos_totales']}</p>
+                <p style='margin-top: 2rem; font-size: 0.9rem;'>
+                    Fecha: {datetime.now().strftime("%d/%m/%Y")}<br>
+                    Plataforma: Estación de Aprendizaje - Marketing Estratégico
+                </p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            st.balloons()
+            actualizar_puntos(100)
+    else:
+        st.info(f"""
+        📊 **Progreso actual:** {porcentaje_actividades:.1f}%
+        
+        **Para obtener el certificado necesitas:**
+        - Completar al menos 70% de las actividades
+        - Explorar más conceptos clave
+        - Resolver casos estratégicos
+        - Practicar con quizzes
+        
+        ¡Sigue adelante! 💪
+        """)
+
+
+pagina_mi_progreso()
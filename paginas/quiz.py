@@ -0,0 +1,168 @@
+"""Quiz adaptativo por niveles de dificultad."""
+
+import streamlit as st
+from array import array
+
+from comun import actualizar_puntos, agenda_repaso
+from nucleo import INDICES
+from nucleo.irt import DIFICULTAD_NIVEL, EstimacionHabilidad, IndiceInformacion, nivel_habilidad
+from nucleo.puntuacion import es_correcta, puntos_quiz
+from nucleo.repeticion import calidad_respuesta
+
+@st.cache_resource(show_spinner=False)
+def indice_informacion():
+    """Ítems ordenados por información en cada nivel de habilidad, compartido por todas las sesiones"""
+    return IndiceInformacion(*INDICES['parametros_irt'])
+
+# --- PÁGINA 9: QUIZ ADAPTATIVO ---
+
+def pagina_quiz_adaptativo():
+    st.markdown("<h1 class='main-header'>🧪 Quiz Adaptativo</h1>", unsafe_allow_html=True)
+    
+    st.markdown("El quiz adapta su dificultad según tus respuestas. ¡Demuestra tu conocimiento!")
+    
+    st.markdown("---")
+    
+    # Selector de nivel inicial
+    if 'quiz_adaptativo_iniciado' not in st.session_state:
+        st.session_state.quiz_adaptativo_iniciado = False
+        st.session_state.quiz_adaptativo_nivel = "basico"
+        # Número de cada pregunta respondida (4 bytes por respuesta) y habilidad estimada
+        st.session_state.quiz_adaptativo_preguntas_respondidas = array('I')
+        st.session_state.quiz_adaptativo_habilidad = None
+        st.session_state.quiz_adaptativo_correctas = 0
+        st.session_state.quiz_adaptativo_pregunta_actual = None
+    
+    if not st.session_state.quiz_adaptativo_iniciado:
+        st.markdown("### 🎯 Selecciona el nivel de dificultad inicial")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            if st.button("🌱 Básico", use_container_width=True):
+                st.session_state.quiz_adaptativo_nivel = "basico"
+                st.session_state.quiz_adaptativo_habilidad = EstimacionHabilidad(DIFICULTAD_NIVEL["basico"])
+                st.session_state.quiz_adaptativo_iniciado = True
+                st.rerun()
+        
+        with col2:
+            if st.button("📚 Intermedio", use_container_width=True):
+                st.session_state.quiz_adaptativo_nivel = "intermedio"
+                st.session_state.quiz_adaptativo_habilidad = EstimacionHabilidad(DIFICULTAD_NIVEL["intermedio"])
+                st.session_state.quiz_adaptativo_iniciado = True
+                st.rerun()
+        
+        with col3:
+            if st.button("⭐ Avanzado", use_container_width=True):
+                st.session_state.quiz_adaptativo_nivel = "avanzado"
+                st.session_state.quiz_adaptativo_habilidad = EstimacionHabilidad(DIFICULTAD_NIVEL["avanzado"])
+                st.session_state.quiz_adaptativo_iniciado = True
+                st.rerun()
+        
+        st.info("💡 El sistema ajustará automáticamente la dificultad según tu desempeño.")
+    
+    else:
+        # Mostrar progreso
+        total_respondidas = len(st.session_state.quiz_adaptativo_preguntas_respondidas)
+        correctas = st.session_state.quiz_adaptativo_correctas
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Preguntas Respondidas", total_respondidas)
+        with col2:
+            st.metric("Respuestas Correctas", correctas)
+        with col3:
+            porcentaje = (correctas / total_respondidas * 100) if total_respondidas > 0 else 0
+            st.metric("Porcentaje de Acierto", f"{porcentaje:.0f}%")
+        
+        habilidad = st.session_state.quiz_adaptativo_habilidad
+        st.markdown(f"**Nivel Actual:** {st.session_state.quiz_adaptativo_nivel.upper()} "
+                    f"(habilidad estimada {habilidad.theta:+.2f} ± {habilidad.error:.2f})")
+        if habilidad.estable:
+            st.caption("📍 Tu nivel ya está estimado con precisión; las siguientes preguntas lo afinan.")
+        
+        st.markdown("---")
+        
+        # Seleccionar pregunta si no hay una actual
+        if st.session_state.quiz_adaptativo_pregunta_actual is None:
+            # Pregunta no respondida con máxima información para la habilidad estimada
+            posicion = indice_informacion().siguiente(
+                habilidad.theta, st.session_state.quiz_adaptativo_preguntas_respondidas
+            )
+            
+            if posicion is None:
+                st.balloons()
+                st.success("🏆 ¡Felicitaciones! Has respondido todas las preguntas del quiz.")
+                # El quiz se queda en este estado: el bono se otorga una vez por recorrido
+                if not st.session_state.get('quiz_bonus_otorgado'):
+                    st.session_state.quiz_bonus_otorgado = True
+                    actualizar_puntos(100)
+                
+                if st.button("🔄 Reiniciar Quiz"):
+                    st.session_state.quiz_adaptativo_iniciado = False
+                    st.session_state.quiz_adaptativo_preguntas_respondidas = array('I')
+                    st.session_state.quiz_adaptativo_habilidad = None
+                    st.session_state.quiz_adaptativo_correctas = 0
+                    st.session_state.quiz_adaptativo_pregunta_actual = None
+                    st.session_state.quiz_bonus_otorgado = False
+                    st.rerun()
+                
+                return
+            
+            # La pregunta elegida queda como actual hasta que se responda
+            st.session_state.quiz_adaptativo_pregunta_actual = INDICES['preguntas_por_numero'][posicion]
+        
+        # Mostrar pregunta actual
+        pregunta = st.session_state.quiz_adaptativo_pregunta_actual
+        
+        st.markdown(f"### ❓ {pregunta['pregunta']}")
+        st.caption(f"📚 Tema: {pregunta['tema']}")
+        
+        respuesta_usuario = st.radio(
+            "Selecciona tu respuesta:",
+            options=range(len(pregunta['opciones'])),
+            format_func=lambda x: pregunta['opciones'][x],
+            key="radio_quiz_adaptativo"
+        )
+        
+        col_a, col_b = st.columns([1, 3])
+        
+        with col_a:
+            if st.button("✅ Responder", type="primary", use_container_width=True):
+                # Evaluar respuesta
+                acierto = es_correcta(pregunta, respuesta_usuario)
+                
+                st.session_state.quiz_adaptativo_preguntas_respondidas.append(pregunta['numero'])
+                agenda_repaso().registrar(pregunta['id'], calidad_respuesta(acierto))
+                if acierto:
+                    st.session_state.quiz_adaptativo_correctas += 1
+                
+                # Actualizar la habilidad estimada y el nivel que le corresponde
+                habilidad.registrar(pregunta['discriminacion'], pregunta['dificultad'], acierto)
+                nivel_anterior = st.session_state.quiz_adaptativo_nivel
+                nivel_nuevo = nivel_habilidad(habilidad.theta)
+                st.session_state.quiz_adaptativo_nivel = nivel_nuevo
+                
+                if acierto:
+                    st.success(f"✅ ¡Correcto! {pregunta['explicacion']}")
+                    if nivel_nuevo != nivel_anterior:
+                        st.info(f"⬆️ ¡Nivel aumentado a {nivel_nuevo.upper()}!")
+                    
+                    actualizar_puntos(puntos_quiz(pregunta['nivel']))
+                
+                else:
+                    st.error(f"❌ Incorrecto. {pregunta['explicacion']}")
+                    st.info(f"💡 La respuesta correcta era: **{pregunta['opciones'][pregunta['correcta']]}**")
+                    
+                    if nivel_anterior == "avanzado" and nivel_nuevo == "intermedio":
+                        st.warning("⬇️ Nivel ajustado a INTERMEDIO para reforzar conceptos.")
+                    elif nivel_anterior == "intermedio" and nivel_nuevo == "basico":
+                        st.warning("⬇️ Nivel ajustado a BÁSICO para reforzar fundamentos.")
+                
+                # Limpiar pregunta actual para cargar siguiente
+                st.session_state.quiz_adaptativo_pregunta_actual = None
+                
+                st.rerun()
+
+
+pagina_quiz_adaptativo()
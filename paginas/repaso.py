@@ -0,0 +1,295 @@
+"""Panel de repaso final: resumen, glosario y generador de examen."""
+
+import streamlit as st
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from comun import actualizar_puntos, agenda_repaso
+from nucleo import BANCO_PREGUNTAS, GLOSARIO, INDICES, NIVELES_QUIZ, RESUMENES_EJECUTIVOS
+from nucleo.repeticion import PREFIJO_CONCEPTO, calidad_respuesta
+
+NIVELES_EXAMEN = {"Básico": "basico", "Intermedio": "intermedio", "Avanzado": "avanzado"}
+
+
+def muestra_preguntas(niveles, cantidad):
+    """Preguntas al azar de los niveles dados; del banco solo se leen las elegidas."""
+    tamanos = [len(BANCO_PREGUNTAS[nivel]) for nivel in niveles]
+    total = sum(tamanos)
+    preguntas = []
+    for indice in random.sample(range(total), min(cantidad, total)):
+        for nivel, tamano in zip(niveles, tamanos):
+            if indice < tamano:
+                preguntas.append(BANCO_PREGUNTAS[nivel][indice])
+                break
+            indice -= tamano
+    return preguntas
+
+
+def item_repaso(clave):
+    """Pregunta de repaso (mismas claves que el banco) para una clave de la agenda.
+    
+    Devuelve ``None`` si la clave ya no está en el contenido.
+    """
+    if not clave.startswith(PREFIJO_CONCEPTO):
+        return INDICES['preguntas'].get(clave)
+    datos = INDICES['conceptos_por_id'].get(clave[len(PREFIJO_CONCEPTO):])
+    if datos is None:
+        return None
+    return {
+        'pregunta': datos['pregunta'],
+        'opciones': datos['opciones'],
+        'correcta': datos['respuesta_correcta'],
+        'explicacion': datos['definicion'],
+        'tema': f"{datos['nombre']} ({datos['capitulo']})",
+    }
+
+
+def elegir_item_repaso(agenda, intentos=20):
+    """Clave del próximo ítem: el vencido más antiguo; si no hay, uno nuevo al azar; si no, el más próximo.
+    
+    Las tarjetas de ítems que ya no están en el contenido se descartan por el camino.
+    """
+    proxima = agenda.proxima()
+    while proxima is not None and item_repaso(proxima[0]) is None:
+        agenda.descartar(proxima[0])
+        proxima = agenda.proxima()
+    if proxima is not None and proxima[1] <= time.time():
+        return proxima[0]
+    
+    preguntas = INDICES['preguntas_por_numero']
+    conceptos = list(INDICES['conceptos_por_id'])
+    total = len(preguntas) + len(conceptos)
+    if len(agenda) < total:
+        # Sorteo con reintentos: O(1) esperado mientras el estudiante no haya visto casi todo el banco
+        for _ in range(intentos):
+            indice = random.randrange(total)
+            if indice < len(preguntas):
+                clave = preguntas[indice]['id']
+            else:
+                clave = PREFIJO_CONCEPTO + conceptos[indice - len(preguntas)]
+            if clave not in agenda:
+                return clave
+    
+    return proxima[0] if proxima is not None else None
+
+
+@st.cache_resource(show_spinner=False)
+def ejecutor_lotes():
+    """Hilos compartidos por todas las sesiones para generar lotes de exámenes"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="lotes-examenes")
+
+
+def estado_lote_examenes():
+    """Estado del lote en curso; mientras corre se refresca solo, sin bloquear la página."""
+    trabajo = st.session_state.lote_examenes
+    futuro = trabajo['futuro']
+    variantes, preguntas, semilla = trabajo['parametros']
+    
+    if not futuro.done():
+        st.info(f"⏳ Generando {variantes} variantes de {preguntas} preguntas... "
+                f"({time.time() - trabajo['inicio']:.0f} s)")
+    elif trabajo['pendiente']:
+        # Rerun completo para dejar de refrescar el fragmento
+        trabajo['pendiente'] = False
+        st.rerun()
+    elif futuro.exception() is not None:
+        st.error(f"❌ No se pudo generar el lote: {futuro.exception()}")
+    else:
+        st.success(f"✅ Lote listo: {variantes} variantes de {preguntas} preguntas (semilla {semilla}).")
+        st.download_button(
+            "⬇️ Descargar exámenes y claves (ZIP)",
+            futuro.result(),
+            file_name=f"examenes_{variantes}x{preguntas}_semilla{semilla}.zip",
+            mime="application/zip",
+            key="descargar_lote"
+        )
+
+
+def seccion_lote_examenes():
+    st.markdown("### 👩‍🏫 Lote de Exámenes para Docentes")
+    st.markdown("Genera variantes distintas y reproducibles (misma semilla, mismo lote), con temas "
+                "balanceados y opciones barajadas en cada variante, más sus claves de respuestas.")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        variantes = st.number_input("Variantes", min_value=1, max_value=5000, value=500, key="lote_variantes")
+    with col2:
+        preguntas = st.number_input("Preguntas por examen", min_value=1, max_value=200, value=10,
+                                    key="lote_preguntas")
+    with col3:
+        semilla = st.number_input("Semilla", min_value=0, value=0, key="lote_semilla")
+    niveles = st.multiselect("Niveles", list(NIVELES_EXAMEN), default=list(NIVELES_EXAMEN), key="lote_niveles")
+    
+    trabajo = st.session_state.get('lote_examenes')
+    ocupado = trabajo is not None and not trabajo['futuro'].done()
+    if st.button("⚙️ Generar Lote", key="generar_lote", disabled=ocupado or not niveles):
+        from nucleo.examenes import generar_lote_zip
+        
+        trabajo = st.session_state.lote_examenes = {
+            'futuro': ejecutor_lotes().submit(
+                generar_lote_zip, [NIVELES_EXAMEN[nivel] for nivel in niveles], variantes, preguntas, semilla
+            ),
+            'parametros': (variantes, preguntas, semilla),
+            'inicio': time.time(),
+            'pendiente': True,
+        }
+    
+    if trabajo is not None:
+        st.fragment(run_every=1 if trabajo['pendiente'] else None)(estado_lote_examenes)()
+
+# --- PÁGINA 10: PANEL DE REPASO ---
+
+def pagina_panel_repaso():
+    st.markdown("<h1 class='main-header'>📊 Panel de Repaso Final</h1>", unsafe_allow_html=True)
+    
+    st.markdown("Revisa todos los conceptos clave y evalúa tu dominio antes del examen.")
+    
+    st.markdown("---")
+    
+    # Tabs para organizar
+    tab1, tab2, tab3, tab4 = st.tabs(
+        ["📚 Resumen Ejecutivo", "🔍 Glosario", "📝 Generador de Examen", "🔁 Repaso Espaciado"]
+    )
+    
+    # TAB 1: RESUMEN EJECUTIVO
+    with tab1:
+        st.markdown("### 📚 Resumen Ejecutivo por Capítulo")
+        
+        for titulo, contenido in RESUMENES_EJECUTIVOS.items():
+            with st.expander(f"**{titulo}**"):
+                st.markdown(contenido)
+    
+    # TAB 2: GLOSARIO
+    with tab2:
+        st.markdown("### 🔍 Glosario Interactivo")
+        
+        termino_buscar = st.text_input("🔎 Buscar término:", placeholder="Ej: Equidad")
+        
+        if termino_buscar:
+            resultados = {k: v for k, v in GLOSARIO.items() if termino_buscar.lower() in k.lower()}
+            if resultados:
+                for termino, definicion in resultados.items():
+                    st.markdown(f"**{termino}:** {definicion}")
+            else:
+                st.warning("No se encontraron resultados. Intenta con otro término.")
+        else:
+            # Mostrar todos
+            for termino, definicion in sorted(GLOSARIO.items()):
+                with st.expander(termino):
+                    st.markdown(definicion)
+    
+    # TAB 3: GENERADOR DE EXAMEN
+    with tab3:
+        st.markdown("### 📝 Generador de Preguntas de Práctica")
+        
+        num_preguntas = st.slider("¿Cuántas preguntas quieres practicar?", 5, 20, 10)
+        nivel_examen = st.selectbox("Nivel de dificultad:", ["Básico", "Intermedio", "Avanzado", "Mixto"])
+        balancear = st.checkbox("Repartir las preguntas entre todos los temas (y niveles, en Mixto)", value=True)
+        
+        if st.button("🎲 Generar Examen de Práctica", type="primary"):
+            st.markdown("---")
+            st.markdown("### 📋 Tu Examen de Práctica")
+            
+            # Seleccionar preguntas
+            if nivel_examen == "Mixto":
+                niveles = NIVELES_QUIZ
+            else:
+                niveles = [NIVELES_EXAMEN[nivel_examen]]
+            
+            if balancear:
+                from nucleo.examenes import preguntas_de_niveles
+                from nucleo.planes import Ensamblador, plan_balanceado
+                
+                banco = preguntas_de_niveles(niveles)
+                cantidad = min(num_preguntas, len(banco))
+                try:
+                    plan = plan_balanceado(banco, cantidad, niveles=len(niveles) > 1)
+                    lote = Ensamblador(banco, plan, semilla=None).armar(1)
+                except ValueError as error:
+                    st.error(f"❌ No se pudo armar el examen: {error}")
+                    preguntas_examen = []
+                else:
+                    preguntas_examen = [banco[posicion] for posicion in lote['preguntas'][0]]
+            else:
+                preguntas_examen = muestra_preguntas(niveles, num_preguntas)
+            
+            for i, pregunta in enumerate(preguntas_examen, 1):
+                st.markdown(f"**{i}. {pregunta['pregunta']}** _(Tema: {pregunta['tema']})_")
+                for j, opcion in enumerate(pregunta['opciones']):
+                    st.markdown(f"   {chr(65+j)}. {opcion}")
+                
+                with st.expander("Ver respuesta"):
+                    st.success(f"✅ Respuesta correcta: **{chr(65+pregunta['correcta'])}. {pregunta['opciones'][pregunta['correcta']]}**")
+                    st.info(f"💡 {pregunta['explicacion']}")
+                
+                st.markdown("---")
+        
+        # Solo docentes: el lote ocupa los hilos compartidos por todo el proceso
+        if st.session_state.get("es_admin"):
+            st.markdown("---")
+            seccion_lote_examenes()
+    
+    # TAB 4: REPASO ESPACIADO
+    with tab4:
+        st.markdown("### 🔁 Repaso Espaciado")
+        st.markdown("Las preguntas que fallas vuelven pronto; las que dominas se espacian cada vez más.")
+        
+        agenda = agenda_repaso()
+        if 'repaso_item' not in st.session_state:
+            st.session_state.repaso_item = None
+            st.session_state.repaso_resultado = None
+        if st.session_state.repaso_item is None:
+            st.session_state.repaso_item = elegir_item_repaso(agenda)
+        clave = st.session_state.repaso_item
+        pregunta = None if clave is None else item_repaso(clave)
+        if clave is not None and pregunta is None:
+            # El ítem salió del contenido durante la sesión
+            agenda.descartar(clave)
+            clave = st.session_state.repaso_item = elegir_item_repaso(agenda)
+            st.session_state.repaso_resultado = None
+            pregunta = None if clave is None else item_repaso(clave)
+        
+        proxima = agenda.proxima()
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Tarjetas en tu agenda", len(agenda))
+        with col2:
+            siguiente = datetime.fromtimestamp(proxima[1]).strftime("%d/%m %H:%M") if proxima else "—"
+            st.metric("Próximo repaso programado", siguiente)
+        
+        if pregunta is None:
+            st.info("No hay preguntas para repasar.")
+        else:
+            st.markdown(f"**{pregunta['pregunta']}**")
+            st.caption(f"📚 Tema: {pregunta['tema']}")
+            
+            if st.session_state.repaso_resultado is None:
+                respuesta = st.radio(
+                    "Selecciona tu respuesta:",
+                    options=range(len(pregunta['opciones'])),
+                    format_func=lambda x: pregunta['opciones'][x],
+                    key=f"radio_repaso_{clave}"
+                )
+                if st.button("✅ Responder", key="responder_repaso", type="primary"):
+                    acierto = respuesta == pregunta['correcta']
+                    tarjeta = agenda.registrar(clave, calidad_respuesta(acierto))
+                    st.session_state.repaso_resultado = (acierto, tarjeta.intervalo)
+                    if acierto:
+                        actualizar_puntos(5)
+                    st.rerun()
+            else:
+                acierto, intervalo = st.session_state.repaso_resultado
+                if acierto:
+                    st.success(f"✅ ¡Correcto! Volverás a verla en {intervalo} día(s).")
+                else:
+                    st.error(f"❌ La respuesta correcta era: **{pregunta['opciones'][pregunta['correcta']]}**")
+                    st.info(f"💡 {pregunta['explicacion']}")
+                if st.button("▶️ Siguiente", key="siguiente_repaso"):
+                    st.session_state.repaso_item = None
+                    st.session_state.repaso_resultado = None
+                    st.rerun()
+
+
+pagina_panel_repaso()
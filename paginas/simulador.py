@@ -0,0 +1,636 @@
+"""Simulador del ciclo de vida del producto (CVP)."""
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+
+from comun import actualizar_puntos, marcar_actividad
+from nucleo.cvp import ETAPAS, clasificar_etapas, curvas_productos, parametros_producto, simular_escenarios
+from nucleo.catalogo import Catalogo
+from nucleo.ventas import leer_ventas
+
+# --- CATÁLOGO DE PRODUCTOS ---
+
+@st.cache_resource(show_spinner=False)
+def obtener_catalogo():
+    """Índice del catálogo de productos, cargado una vez por proceso"""
+    return Catalogo()
+
+# --- GRÁFICO DEL CVP ---
+
+COLORES_ETAPA = {
+    "Introducción": "#3498db",
+    "Crecimiento": "#2ecc71",
+    "Madurez": "#f39c12",
+    "Declive": "#e74c3c"
+}
+
+# A partir de cuántos puntos la comparación se dibuja con WebGL
+UMBRAL_PUNTOS_WEBGL = 5_000
+
+# Configuraciones específicas por etapa actual del producto
+CONFIGURACIONES_CVP = {
+    "Introducción": {
+        "ventas_max": 30,
+        "utilidades_min": -20,
+        "utilidades_max": 5,
+        "punto_ventas": 0.15,  # 15% del tiempo total
+        "punto_utilidades": 0.20
+    },
+    "Crecimiento": {
+        "ventas_max": 65,
+        "utilidades_min": -10,
+        "utilidades_max": 55,
+        "punto_ventas": 0.40,  # 40% del tiempo total
+        "punto_utilidades": 0.45
+    },
+    "Madurez": {
+        "ventas_max": 85,
+        "utilidades_min": -5,
+        "utilidades_max": 70,
+        "punto_ventas": 0.70,  # 70% del tiempo total
+        "punto_utilidades": 0.65
+    },
+    "Declive": {
+        "ventas_max": 30,
+        "utilidades_min": 0,
+        "utilidades_max": 25,
+        "punto_ventas": 0.95,  # 95% del tiempo total
+        "punto_utilidades": 0.90
+    }
+}
+
+def generar_curvas_cvp(producto_info, n_puntos=200):
+    """Genera las curvas (x, ventas, utilidades) del producto con el motor paramétrico"""
+    x, ventas, utilidades = curvas_productos([producto_info], n_puntos=n_puntos)
+    return x, ventas[0], utilidades[0]
+
+@st.cache_resource(max_entries=256, show_spinner=False)
+def _figura_cvp(nombre, etapa_actual, etapa_resaltar, parametros_cvp):
+    """Figura del CVP compartida entre sesiones (LRU acotado a 256 entradas).
+
+    Se devuelve la misma instancia a todas las sesiones: quien necesite añadir
+    trazas debe copiarla antes con ``go.Figure(fig)``.
+    """
+    config = CONFIGURACIONES_CVP[etapa_actual]
+    x, ventas, utilidades = generar_curvas_cvp(
+        {'etapa_actual': etapa_actual, 'parametros_cvp': dict(parametros_cvp)}
+    )
+    
+    # Crear figura
+    fig = go.Figure()
+    
+    # Curva de Ventas
+    fig.add_trace(go.Scatter(
+        x=x, y=ventas,
+        mode='lines',
+        name='Ventas',
+        line=dict(color='#3498db', width=4),
+        fill='tozeroy',
+        fillcolor='rgba(52, 152, 219, 0.2)',
+        hovertemplate='<b>Ventas</b><br>Tiempo: %{x:.1f}<br>Nivel: %{y:.1f}<extra></extra>'
+    ))
+    
+    # Curva de Utilidades
+    fig.add_trace(go.Scatter(
+        x=x, y=utilidades,
+        mode='lines',
+        name='Utilidades',
+        line=dict(color='#e74c3c', width=4, dash='dash'),
+        hovertemplate='<b>Utilidades</b><br>Tiempo: %{x:.1f}<br>Nivel: %{y:.1f}<extra></extra>'
+    ))
+    
+    # Etapas del CVP (zonas de fondo)
+    etapas_zonas = [
+        (0, 2.5, 'Introducción', '#e8f4f8'),
+        (2.5, 5, 'Crecimiento', '#d4edda'),
+        (5, 7.5, 'Madurez', '#fff3cd'),
+        (7.5, 10, 'Declive', '#f8d7da')
+    ]
+    
+    for inicio, fin, etapa_zona, color in etapas_zonas:
+        # Resaltar la etapa actual del producto
+        resaltar = (etapa_zona == etapa_actual) or (etapa_resaltar == etapa_zona)
+        
+        fig.add_vrect(
+            x0=inicio, x1=fin,
+            fillcolor=color,
+            opacity=0.6 if resaltar else 0.2,
+            line_width=3 if resaltar else 0,
+            line_color='#2c3e50' if resaltar else None,
+            annotation_text=f"<b>{etapa_zona}</b>" if resaltar else etapa_zona,
+            annotation_position="top",
+            annotation_font_size=14 if resaltar else 11,
+            annotation_font_color='#2c3e50' if resaltar else '#7f8c8d'
+        )
+    
+    # Marcar el punto actual del producto
+    punto_x = config['punto_ventas'] * 10
+    punto_y_ventas = np.interp(punto_x, x, ventas)
+    
+    fig.add_trace(go.Scatter(
+        x=[punto_x],
+        y=[punto_y_ventas],
+        mode='markers+text',
+        marker=dict(size=20, color='#e74c3c', symbol='star', line=dict(width=2, color='white')),
+        text=["📍 Estás aquí"],
+        textposition="top center",
+        textfont=dict(size=14, color='#e74c3c', family='Arial Black'),
+        name='Posición Actual',
+        hovertemplate=f'<b>Posición Actual</b><br>{etapa_actual}<extra></extra>'
+    ))
+    
+    # Layout del gráfico
+    fig.update_layout(
+        title=dict(
+            text=f"<b>Ciclo de Vida: {nombre}</b><br><sub>Etapa Actual: {etapa_actual}</sub>",
+            font=dict(size=20, family='Arial Black'),
+            x=0.5,
+            xanchor='center'
+        ),
+        xaxis=dict(
+            title='<b>Tiempo</b>',
+            showgrid=True,
+            gridcolor='lightgray',
+            showticklabels=False  # Ocultar números del eje temporal
+        ),
+        yaxis=dict(
+            title='<b>Nivel de Ventas / Utilidades</b>',
+            showgrid=True,
+            gridcolor='lightgray',
+            zeroline=True,
+            zerolinewidth=2,
+            zerolinecolor='gray'
+        ),
+        hovermode='x unified',
+        height=500,
+        showlegend=True,
+        legend=dict(
+            x=0.02, 
+            y=0.98,
+            bgcolor='rgba(255, 255, 255, 0.8)',
+            bordercolor='gray',
+            borderwidth=1
+        ),
+        plot_bgcolor='white',
+        paper_bgcolor='#f8f9fa'
+    )
+    
+    return fig
+
+def crear_grafico_cvp_especifico(producto_info, etapa_resaltar=None):
+    """Crea gráfico del CVP específico para cada producto"""
+    return _figura_cvp(
+        producto_info.get('nombre', 'Producto'),
+        producto_info['etapa_actual'],
+        etapa_resaltar,
+        tuple(sorted(producto_info.get('parametros_cvp', {}).items()))
+    )
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _bandas_escenarios(etapa_actual, parametros_cvp, dispersiones, n_escenarios):
+    """Percentiles 5/50/95 de las ventas simuladas, cacheados por conjunto de parámetros"""
+    parametros = parametros_producto(
+        {'etapa_actual': etapa_actual, 'parametros_cvp': dict(parametros_cvp)}
+    )
+    return simular_escenarios(parametros, n_escenarios, *dispersiones)
+
+def agregar_bandas_escenarios(fig, producto_info, dispersiones, n_escenarios):
+    """Copia la figura del CVP y le superpone la mediana y la banda 5-95% simuladas"""
+    x, (p5, p50, p95) = _bandas_escenarios(
+        producto_info['etapa_actual'],
+        tuple(sorted(producto_info.get('parametros_cvp', {}).items())),
+        dispersiones,
+        n_escenarios
+    )
+    fig = go.Figure(fig)
+    
+    fig.add_trace(go.Scatter(
+        x=x, y=p95,
+        mode='lines',
+        line=dict(width=0),
+        showlegend=False,
+        hovertemplate='<b>Percentil 95</b>: %{y:.1f}<extra></extra>'
+    ))
+    fig.add_trace(go.Scatter(
+        x=x, y=p5,
+        mode='lines',
+        name='Escenarios 5%-95%',
+        line=dict(width=0),
+        fill='tonexty',
+        fillcolor='rgba(142, 68, 173, 0.2)',
+        hovertemplate='<b>Percentil 5</b>: %{y:.1f}<extra></extra>'
+    ))
+    fig.add_trace(go.Scatter(
+        x=x, y=p50,
+        mode='lines',
+        name='Mediana de escenarios',
+        line=dict(color='#8e44ad', width=3, dash='dot'),
+        hovertemplate='<b>Mediana</b>: %{y:.1f}<extra></extra>'
+    ))
+    return fig
+
+def crear_grafico_comparacion(x, curvas, nombres, etapas, titulo_x='<b>Tiempo</b>'):
+    """Superpone varias curvas de ventas normalizadas a su propio pico.
+
+    ``curvas`` es una matriz ``(k, len(x))`` que se normaliza en una sola
+    operación. Las curvas se agrupan en la leyenda por etapa y, con muchos
+    puntos, se dibujan con ``Scattergl`` para que el navegador use WebGL.
+    """
+    curvas = np.asarray(curvas, dtype=float)
+    normalizadas = (curvas / np.maximum(curvas.max(axis=1, keepdims=True), 1e-9)).astype(np.float32)
+    if not isinstance(x, pd.DatetimeIndex):
+        x = np.asarray(x, dtype=np.float32)
+    tipo = 'scattergl' if normalizadas.size > UMBRAL_PUNTOS_WEBGL else 'scatter'
+    
+    # Las trazas se pasan juntas como dicts: add_trace revalida la figura en cada llamada
+    trazas = []
+    en_leyenda = set()
+    for nombre, etapa, y in zip(nombres, etapas, normalizadas):
+        trazas.append(dict(
+            type=tipo,
+            x=x, y=y,
+            mode='lines',
+            name=nombre,
+            legendgroup=etapa,
+            legendgrouptitle_text=etapa if etapa not in en_leyenda else None,
+            line=dict(color=COLORES_ETAPA[etapa], width=2),
+            opacity=0.8,
+            hovertemplate=f'<b>{nombre}</b><br>Nivel: %{{y:.0%}}<extra>{etapa}</extra>'
+        ))
+        en_leyenda.add(etapa)
+    fig = go.Figure(data=trazas)
+    
+    fig.update_layout(
+        title=dict(
+            text=f"<b>Comparación de {len(curvas)} productos</b><br><sub>Ventas normalizadas a su pico</sub>",
+            font=dict(size=20, family='Arial Black'),
+            x=0.5,
+            xanchor='center'
+        ),
+        xaxis=dict(title=titulo_x, showgrid=True, gridcolor='lightgray'),
+        yaxis=dict(title='<b>Ventas / pico</b>', showgrid=True, gridcolor='lightgray', tickformat='.0%'),
+        hovermode='closest',
+        height=500,
+        legend=dict(
+            x=0.02,
+            y=0.98,
+            bgcolor='rgba(255, 255, 255, 0.8)',
+            bordercolor='gray',
+            borderwidth=1
+        ),
+        plot_bgcolor='white',
+        paper_bgcolor='#f8f9fa'
+    )
+    return fig
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _figura_comparacion_catalogo(posiciones):
+    """Figura de comparación compartida entre sesiones; las curvas se calculan en un solo lote"""
+    productos = [obtener_catalogo().detalle(i) for i in posiciones]
+    x, ventas, _ = curvas_productos(productos)
+    return crear_grafico_comparacion(
+        x, ventas,
+        [info['nombre'] for info in productos],
+        [info['etapa_actual'] for info in productos]
+    )
+
+def seccion_comparacion(catalogo):
+    """Compara en un solo gráfico el ciclo de vida de varios productos del catálogo"""
+    st.markdown("### 📊 Comparar Productos")
+    
+    seleccion = st.multiselect(
+        "Selecciona los productos a comparar:",
+        catalogo.filtrar(),
+        default=list(range(min(5, len(catalogo)))),
+        format_func=lambda i: catalogo.productos[i]['nombre'],
+        key="comparacion_catalogo"
+    )
+    if not seleccion:
+        st.info("Selecciona al menos un producto para comparar.")
+        return
+    
+    st.plotly_chart(_figura_comparacion_catalogo(tuple(seleccion)), use_container_width=True)
+
+# --- VENTAS REALES ---
+
+@st.cache_data(max_entries=8, show_spinner="Clasificando el catálogo...")
+def _clasificar_archivo(file_id, _archivo, nombre_archivo):
+    """Lee y clasifica un archivo subido; la caché se indexa por ``file_id``."""
+    skus, meses, matriz = leer_ventas(_archivo, nombre_archivo)
+    etapas, tasa = clasificar_etapas(matriz)
+    resumen = pd.DataFrame({
+        "SKU": skus,
+        "Etapa": np.asarray(ETAPAS)[etapas],
+        "Crecimiento mensual": tasa,
+        "Ventas último mes": matriz[:, -1],
+    })
+    return resumen, meses, matriz
+
+def seccion_ventas_reales():
+    """Clasifica en etapas del CVP un catálogo de ventas mensuales subido por el usuario"""
+    st.markdown("### 📂 Clasifica tu Propio Catálogo")
+    st.markdown(
+        "Sube un archivo CSV o Parquet con las columnas **sku**, **mes** y **ventas** "
+        "(una fila por producto y mes). Cada SKU se clasifica según la tendencia y "
+        "la aceleración de sus ventas suavizadas."
+    )
+    
+    archivo = st.file_uploader("Archivo de ventas mensuales", type=["csv", "parquet"])
+    if archivo is None:
+        return
+    
+    try:
+        resumen, meses, matriz = _clasificar_archivo(archivo.file_id, archivo, archivo.name)
+    except ValueError as error:
+        st.error(f"❌ No se pudo procesar el archivo: {error}")
+        return
+    
+    st.caption(f"{len(resumen):,} SKU · {len(meses)} meses ({meses[0]} a {meses[-1]})")
+    
+    conteo = resumen["Etapa"].value_counts()
+    cols_etapas = st.columns(len(ETAPAS))
+    for col, etapa in zip(cols_etapas, ETAPAS):
+        with col:
+            st.metric(etapa, f"{conteo.get(etapa, 0):,}")
+    
+    st.dataframe(
+        resumen,
+        use_container_width=True,
+        hide_index=True,
+        column_config={"Crecimiento mensual": st.column_config.NumberColumn(format="percent")}
+    )
+    
+    sku = st.selectbox("🎯 Selecciona un SKU para analizar:", resumen["SKU"])
+    fila = resumen.index[resumen["SKU"] == sku][0]
+    etapa = resumen.at[fila, "Etapa"]
+    
+    st.plotly_chart(
+        crear_grafico_cvp_especifico({'nombre': sku, 'etapa_actual': etapa}),
+        use_container_width=True
+    )
+    st.markdown("**📈 Ventas mensuales reales**")
+    st.line_chart(pd.Series(matriz[fila], index=meses.to_timestamp(), name="Ventas"))
+    
+    st.markdown("---")
+    comparar = st.multiselect(
+        "📊 Compara el ciclo de vida real de varios SKU:",
+        resumen.index,
+        default=list(resumen.index[:min(10, len(resumen))]),
+        format_func=lambda i: resumen.at[i, "SKU"]
+    )
+    if comparar:
+        st.plotly_chart(
+            crear_grafico_comparacion(
+                meses.to_timestamp(), matriz[comparar],
+                resumen["SKU"].to_numpy()[comparar], resumen["Etapa"].to_numpy()[comparar],
+                titulo_x='<b>Mes</b>'
+            ),
+            use_container_width=True
+        )
+
+# --- PÁGINA 5: SIMULADOR CVP ---
+
+def pagina_simulador_cvp():
+    st.markdown("<h1 class='main-header'>🎮 Simulador del Ciclo de Vida del Producto</h1>", unsafe_allow_html=True)
+    
+    st.markdown("Explora las etapas del CVP, analiza productos reales y aprende qué estrategias aplicar en cada fase.")
+    
+    st.markdown("---")
+    
+    fuente = st.radio(
+        "Fuente de datos:",
+        ["📦 Catálogo de productos", "📊 Comparar productos", "📂 Mis datos de ventas"],
+        horizontal=True
+    )
+    if fuente == "📂 Mis datos de ventas":
+        seccion_ventas_reales()
+        return
+    
+    catalogo = obtener_catalogo()
+    if fuente == "📊 Comparar productos":
+        seccion_comparacion(catalogo)
+        return
+    
+    # Selector de producto sobre el catálogo indexado
+    
+    col_busqueda, col_etapa_filtro, col_industria = st.columns([2, 1, 1])
+    with col_busqueda:
+        texto_busqueda = st.text_input("🔎 Buscar producto:", placeholder="Ej: eléctrico, streaming, Latinoamérica")
+    with col_etapa_filtro:
+        etapa_filtro = st.selectbox("Etapa:", ["Todas"] + catalogo.valores("etapa_actual"))
+    with col_industria:
+        industria_filtro = st.selectbox("Industria:", ["Todas"] + catalogo.valores("industria"))
+    
+    posiciones = catalogo.filtrar(
+        etapa=None if etapa_filtro == "Todas" else etapa_filtro,
+        industria=None if industria_filtro == "Todas" else industria_filtro,
+        texto=texto_busqueda
+    )
+    if not posiciones:
+        st.warning("No hay productos que coincidan con los filtros.")
+        return
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        posicion = st.selectbox(
+            f"🎯 Selecciona un producto para analizar ({len(posiciones)} de {len(catalogo)}):",
+            posiciones,
+            format_func=lambda i: catalogo.productos[i]['nombre'],
+            help="Cada producto está en una etapa diferente del CVP",
+            key="producto_catalogo"
+        )
+    
+    info_producto = catalogo.detalle(posicion)
+    producto_seleccionado = info_producto['nombre']
+    
+    with col2:
+        etapa_resaltar = st.selectbox(
+            "🔍 Resaltar otra etapa del CVP (comparación):",
+            ["Ninguna", "Introducción", "Crecimiento", "Madurez", "Declive"],
+            help="Resalta una etapa diferente para comparar"
+        )
+    
+    # Mostrar gráfico CVP ESPECÍFICO
+    st.markdown("### 📊 Gráfico del Ciclo de Vida")
+    fig_cvp = crear_grafico_cvp_especifico(
+        info_producto, 
+        etapa_resaltar if etapa_resaltar != "Ninguna" else None
+    )
+    
+    if st.toggle("🎲 Modo ¿Qué pasaría si?", help="Simula miles de trayectorias posibles del producto"):
+        col_lanz, col_pico, col_decl, col_esc = st.columns(4)
+        with col_lanz:
+            dispersion_lanzamiento = st.slider("Incertidumbre del lanzamiento", 0, 100, 30, 5, format="%d%%")
+        with col_pico:
+            dispersion_pico = st.slider("Incertidumbre del pico", 0, 100, 20, 5, format="%d%%")
+        with col_decl:
+            dispersion_declive = st.slider("Incertidumbre del declive", 0, 100, 20, 5, format="%d%%")
+        with col_esc:
+            n_escenarios = st.select_slider("Escenarios", [1_000, 2_000, 5_000, 10_000], value=10_000)
+        
+        fig_cvp = agregar_bandas_escenarios(
+            fig_cvp,
+            info_producto,
+            (dispersion_lanzamiento / 100, dispersion_pico / 100, dispersion_declive / 100),
+            n_escenarios
+        )
+        st.caption(f"Mediana y banda del 5% al 95% de {n_escenarios:,} trayectorias simuladas.")
+    
+    st.plotly_chart(fig_cvp, use_container_width=True)
+    
+    # Información detallada del producto
+    st.markdown("---")
+    st.markdown(f"### 📱 Análisis Detallado: **{producto_seleccionado}**")
+    
+    col_etapa, col_desc = st.columns([1, 2])
+    
+    with col_etapa:
+        st.markdown("**🎯 Etapa Actual**")
+        st.markdown(f"<h2 style='color:{COLORES_ETAPA[info_producto['etapa_actual']]};'>{info_producto['etapa_actual']}</h2>", unsafe_allow_html=True)
+    
+    with col_desc:
+        st.markdown("**📋 Descripción de la Situación**")
+        st.info(info_producto['descripcion'])
+    
+    # Características de la etapa
+    st.markdown("---")
+    st.markdown("**📊 Características de esta Etapa**")
+    for caracteristica in info_producto['caracteristicas_etapa']:
+        st.markdown(f"- {caracteristica}")
+    
+    # Estrategias recomendadas
+    st.markdown("---")
+    st.markdown("**🎯 Estrategias Aplicadas/Recomendadas**")
+    for estrategia in info_producto['estrategias']:
+        st.markdown(f"- {estrategia}")
+    
+    # Métricas clave
+    st.markdown("---")
+    st.markdown("**📈 Métricas Clave del Producto**")
+    if info_producto['metricas']:
+        cols_metricas = st.columns(len(info_producto['metricas']))
+        for i, (metrica, valor) in enumerate(info_producto['metricas'].items()):
+            with cols_metricas[i]:
+                st.metric(metrica, valor)
+    else:
+        st.caption("Este producto no tiene métricas registradas en el catálogo.")
+    
+    # Comparación de etapas
+    st.markdown("---")
+    with st.expander("📚 Ver Comparación de Todas las Etapas del CVP"):
+        tabla_comparacion = pd.DataFrame({
+            "Etapa": ["Introducción", "Crecimiento", "Madurez", "Declive"],
+            "Ventas": ["Bajas", "Crecimiento rápido", "Pico/Estables", "En descenso"],
+            "Utilidades": ["Negativas", "Crecientes", "Máximas", "Bajas/Decrecientes"],
+            "Competencia": ["Poca/Nula", "Creciente", "Intensa", "Decreciente"],
+            "Clientes": ["Innovadores", "Adoptadores tempranos", "Mayoría", "Rezagados"],
+            "Objetivo": ["Conocimiento", "Participación", "Defensa", "Eficiencia/Salida"],
+            "Estrategia Precio": ["Alto/Penetración", "Competitivo", "Defensivo", "Reducción"],
+            "Estrategia Comunicación": ["Informativa", "Persuasiva", "Recordatoria", "Mínima"]
+        })
+        st.dataframe(tabla_comparacion, use_container_width=True, hide_index=True)
+    
+    # Quiz situacional
+    st.markdown("---")
+    st.markdown("### ❓ Quiz Situacional")
+    
+    quiz_cvp_key = f"quiz_cvp_{producto_seleccionado}"
+    
+    if quiz_cvp_key not in st.session_state:
+        st.session_state[quiz_cvp_key] = {"respondido": False, "correcto": None}
+    
+    if not st.session_state[quiz_cvp_key]["respondido"]:
+        st.markdown(f"**¿En qué etapa del CVP se encuentra actualmente {producto_seleccionado}?**")
+        
+        respuesta_cvp = st.radio(
+            "Selecciona tu respuesta:",
+            ["Introducción", "Crecimiento", "Madurez", "Declive"],
+            key=f"radio_cvp_{producto_seleccionado}"
+        )
+        
+        if st.button("✅ Verificar Respuesta", key=f"btn_cvp_{producto_seleccionado}", type="primary"):
+            es_correcta = respuesta_cvp == info_producto['etapa_actual']
+            st.session_state[quiz_cvp_key]["respondido"] = True
+            st.session_state[quiz_cvp_key]["correcto"] = es_correcta
+            
+            if es_correcta:
+                actualizar_puntos(15)
+                marcar_actividad('quizzes_completados', quiz_cvp_key)
+            
+            st.rerun()
+    
+    else:
+        # Mostrar resultado
+        if st.session_state[quiz_cvp_key]["correcto"]:
+            st.success(f"✅ ¡Correcto! {producto_seleccionado} está en etapa de **{info_producto['etapa_actual']}**.")
+            st.balloons()
+            
+            # Explicación adicional
+            explicaciones = {
+                "Introducción": "Reconociste que este producto está en fase inicial con ventas bajas, altos costos y enfoque en generar conocimiento.",
+                "Crecimiento": "Identificaste correctamente que este producto está en expansión acelerada con ventas crecientes y nuevos competidores entrando.",
+                "Madurez": "Acertaste que este producto está consolidado pero con crecimiento desacelerado y competencia intensa.",
+                "Declive": "Reconociste que este producto está en descenso con ventas cayendo y siendo reemplazado por tecnologías superiores."
+            }
+            st.info(f"💡 {explicaciones[info_producto['etapa_actual']]}")
+        
+        else:
+            st.error(f"❌ Incorrecto. La etapa correcta es: **{info_producto['etapa_actual']}**")
+            st.info("💡 Observa el gráfico: la estrella roja 📍 muestra dónde está actualmente el producto. Analiza las características y métricas para identificar la etapa.")
+        
+        if st.button("🔄 Reintentar con este producto", key=f"reintentar_cvp_{producto_seleccionado}"):
+            st.session_state[quiz_cvp_key] = {"respondido": False, "correcto": None}
+            st.rerun()
+    
+    # Sección educativa adicional
+    st.markdown("---")
+    st.markdown("### 💡 ¿Cómo Identificar la Etapa del CVP?")
+    
+    with st.expander("Ver Guía de Identificación"):
+        st.markdown("""
+        **Pregúntate estas 5 cosas para identificar la etapa:**
+        
+        1. **📊 ¿Cómo están las ventas?**
+           - Bajas/Iniciales → Introducción
+           - Creciendo rápidamente → Crecimiento
+           - Altas pero estancadas → Madurez
+           - Cayendo → Declive
+        
+        2. **💰 ¿Y las utilidades?**
+           - Negativas/Pérdidas → Introducción
+           - Creciendo fuertemente → Crecimiento
+           - En su máximo nivel → Madurez
+           - Bajando → Declive
+        
+        3. **⚔️ ¿Cuántos competidores hay?**
+           - Pocos o ninguno → Introducción
+           - Cada vez más entrando → Crecimiento
+           - Muchísimos compitiendo → Madurez
+           - Varios saliendo del mercado → Declive
+        
+        4. **👥 ¿Quién está comprando?**
+           - Solo innovadores/early adopters → Introducción
+           - Adoptadores tempranos → Crecimiento
+           - La mayoría del mercado → Madurez
+           - Solo rezagados o nicho → Declive
+        
+        5. **🎯 ¿Cuál es el objetivo principal?**
+           - Crear conocimiento → Introducción
+           - Ganar participación → Crecimiento
+           - Defender posición → Madurez
+           - Reducir costos/salir → Declive
+        """)
+    
+    # Recomendación de siguiente paso
+    st.markdown("---")
+    st.info("""
+    💡 **Siguiente paso sugerido:**  
+    Explora diferentes productos para ver cómo varía el CVP según la industria y contexto.
+    Luego practica con el **Quiz Adaptativo** para consolidar tu conocimiento.
+    """)
+
+
+pagina_simulador_cvp()
@@ -0,0 +1,97 @@
+"""Perfilado bajo demanda de un único rerun con cProfile y tracemalloc.
+
+Solo se activa cuando un administrador lo pide (``?perfilar=1`` en la URL o
+el interruptor del panel de métricas); el resto de reruns no pasa por aquí. Cada perfil deja en
+``DIRECTORIO_PERFILES`` dos archivos con marca de tiempo:
+
+- ``<marca>_<pagina>.prof``: estadísticas de cProfile (``python -m pstats`` o snakeviz).
+- ``<marca>_<pagina>.tracemalloc``: snapshot de memoria (``tracemalloc.Snapshot.load``).
+"""
+
+import cProfile
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+DIRECTORIO_PERFILES = os.environ.get(
+    "MARKETING_PERFILES", os.path.join(os.path.dirname(os.path.abspath(__file__)), "perfiles")
+)
+FUNCIONES_RESUMEN = 15
+ASIGNACIONES_RESUMEN = 5
+
+_en_curso = threading.Lock()
+
+
+def _resumen_funciones(perfilador, cantidad):
+    estadisticas = pstats.Stats(perfilador).stats
+    filas = sorted(estadisticas.items(), key=lambda item: item[1][3], reverse=True)[:cantidad]
+    return [
+        {
+            "funcion": f"{os.path.basename(archivo)}:{linea}({nombre})" if linea else nombre,
+            "llamadas": llamadas_totales,
+            "propio_ms": propio * 1000,
+            "acumulado_ms": acumulado * 1000,
+        }
+        for (archivo, linea, nombre), (_, llamadas_totales, propio, acumulado, _) in filas
+    ]
+
+
+@contextmanager
+def perfilar(pagina, directorio=DIRECTORIO_PERFILES):
+    """Perfila el bloque y escribe los archivos al salir, también si hay excepción.
+
+    Entrega un diccionario que se completa al terminar con ``segundos``,
+    ``pico_memoria_mb``, las rutas de los archivos y los resúmenes de las
+    funciones más costosas y de las líneas que más memoria reservaron.
+
+    tracemalloc y su pico son globales al proceso, así que solo corre un
+    perfil a la vez: si ya hay otro en curso entrega ``None`` y el bloque se
+    ejecuta sin perfilar.
+    """
+    if not _en_curso.acquire(blocking=False):
+        yield None
+        return
+    try:
+        with _perfilar(pagina, directorio) as perfil:
+            yield perfil
+    finally:
+        _en_curso.release()
+
+
+@contextmanager
+def _perfilar(pagina, directorio):
+    marca = datetime.now().strftime("%Y%m%d-%H%M%S")
+    base = os.path.join(directorio, f"{marca}_{pagina}")
+    perfil = {"pagina": pagina, "fecha": marca}
+
+    rastreaba = tracemalloc.is_tracing()
+    if not rastreaba:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    perfilador = cProfile.Profile()
+    inicio = time.perf_counter()
+    perfilador.enable()
+    try:
+        yield perfil
+    finally:
+        perfilador.disable()
+        perfil["segundos"] = time.perf_counter() - inicio
+        instantanea = tracemalloc.take_snapshot()
+        perfil["pico_memoria_mb"] = tracemalloc.get_traced_memory()[1] / 2**20
+        if not rastreaba:
+            tracemalloc.stop()
+
+        os.makedirs(directorio, exist_ok=True)
+        perfilador.dump_stats(f"{base}.prof")
+        instantanea.dump(f"{base}.tracemalloc")
+        perfil["ruta_perfil"] = f"{base}.prof"
+        perfil["ruta_memoria"] = f"{base}.tracemalloc"
+        perfil["funciones"] = _resumen_funciones(perfilador, FUNCIONES_RESUMEN)
+        perfil["asignaciones"] = [
+            {"linea": str(estadistica.traceback), "kb": estadistica.size / 1024}
+            for estadistica in instantanea.statistics("lineno")[:ASIGNACIONES_RESUMEN]
+        ]